@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark: interaction queries grouped on actor code text vs interned actor IDs
+
+Loads synthetic events (actor codes redrawn from a --actors sized Zipf pool,
+as real exports have tens of thousands of distinct codes) into a fresh
+schema_events.sql schema, whose actors dictionary GDELTEventIngestion fills,
+then compares ActorNetworkAnalyzer.fetch_interactions grouped on
+actor1_code/actor2_code with the interned query grouped on actor1_id/actor2_id.
+Reports server execution time (EXPLAIN ANALYZE), result size on the server
+(sum of pg_column_size over result rows), end-to-end fetch time including
+the actor code lookup, and sparse graph build time.
+
+Usage:
+    POSTGRES_HOST=localhost python benchmarks/benchmark_actor_ids.py --rows 500000 --actors 20000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import psycopg2
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.actor_networks import ActorNetworkAnalyzer  # noqa: E402
+from event_db.config import DATABASE_CONFIG  # noqa: E402
+from event_db.event_ingestion import GDELTEventIngestion  # noqa: E402
+from event_db.pool import close_all, connection_params, get_pool  # noqa: E402
+from event_db.synthetic import synthetic_export_frame  # noqa: E402
+
+SCHEMA_PATH = Path(__file__).parent.parent / "event_db" / "schema_events.sql"
+START = datetime(2024, 1, 1)
+
+
+def synthetic_events(rows: int, actors: int, days: int, seed: int) -> pd.DataFrame:
+    """Preprocessed events whose actor codes come from a Zipf-like pool of `actors` codes."""
+    df = synthetic_export_frame(rows, start_date=START, days=days, seed=seed)
+    rng = np.random.default_rng(seed)
+    pool = np.array([f"ACT{i:06d}" for i in range(actors)], dtype=object)
+    weights = 1.0 / np.arange(1, actors + 1) ** 0.8
+    weights /= weights.sum()
+    for prefix in ('Actor1', 'Actor2'):
+        present = df[f'{prefix}Code'].notna().to_numpy()
+        codes = np.full(rows, None, dtype=object)
+        codes[present] = pool[rng.choice(actors, size=present.sum(), p=weights)]
+        df[f'{prefix}Code'] = codes
+        df[f'{prefix}Name'] = codes
+    return GDELTEventIngestion(load_mode='batch').preprocess_events(df)
+
+
+def median_ms(cursor, query: str, params, repeat: int) -> float:
+    """Median EXPLAIN ANALYZE execution time."""
+    runs = []
+    for _ in range(repeat):
+        cursor.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + query, params)
+        runs.append(cursor.fetchone()[0][0]['Execution Time'])
+    return statistics.median(runs)
+
+
+def result_bytes(cursor, query: str, params) -> int:
+    cursor.execute("SELECT COALESCE(SUM(pg_column_size(r.*)), 0) FROM (" + query + ") r", params)
+    return cursor.fetchone()[0]
+
+
+def timed(func, *args, repeat: int = 1, **kwargs):
+    """Median wall time over `repeat` calls, and the last result."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=500_000, help='synthetic events to load')
+    parser.add_argument('--actors', type=int, default=20_000, help='distinct actor codes')
+    parser.add_argument('--days', type=int, default=30, help='days the events are spread over')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement')
+    parser.add_argument('--top-n', type=int, default=None, help='fetch only the top N pairs')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Generating {args.rows:,} synthetic events over {args.days} days, {args.actors:,} actors...")
+    df = synthetic_events(args.rows, args.actors, args.days, args.seed)
+
+    schema = f"bench_actor_ids_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(**connection_params())
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}")
+        cursor.execute(SCHEMA_PATH.read_text())
+
+    config = dict(DATABASE_CONFIG, options=f"-c search_path={schema}")
+    try:
+        GDELTEventIngestion(db_config=config, load_mode='copy', rollups=False).load_events(df)
+        with admin.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE gdelt_events")
+            cursor.execute("SELECT COUNT(*) FROM actors")
+            print(f"Loaded {len(df):,} events, {cursor.fetchone()[0]:,} actors in the dictionary")
+
+        analyzer = ActorNetworkAnalyzer(config)
+        start, end = START, START + timedelta(days=args.days)
+
+        def fetch_codes():
+            query, params = analyzer._interactions_query(start, end, top_n=args.top_n)
+            with get_pool(config).connection() as conn:
+                return pd.read_sql_query(query, conn, params=params).astype(analyzer.INTERACTION_DTYPES)
+
+        def fetch_interned():
+            return analyzer.fetch_interactions(start, end, top_n=args.top_n)
+
+        results = {}
+        for label, interned, fetch in (('codes', False, fetch_codes), ('interned', True, fetch_interned)):
+            query, params = analyzer._interactions_query(start, end, top_n=args.top_n, interned=interned)
+            with admin.cursor() as cursor:
+                cursor.execute(f"SET search_path TO {schema}")
+                ms = median_ms(cursor, query, params, args.repeat)
+                size = result_bytes(cursor, query, params)
+            fetch_sec, interactions = timed(fetch, repeat=args.repeat)
+            build_sec, graph = timed(analyzer.build_sparse_graph, interactions, repeat=args.repeat)
+            results[label] = (ms, size, fetch_sec, build_sec, len(interactions), graph.number_of_nodes())
+
+        print(f"\n{'Query':<10} {'pairs':>9} {'nodes':>7} {'server ms':>10} {'result MB':>10} "
+              f"{'fetch ms':>9} {'build ms':>9}")
+        print("-" * 70)
+        for label, (ms, size, fetch_sec, build_sec, pairs, nodes) in results.items():
+            print(f"{label:<10} {pairs:>9,} {nodes:>7,} {ms:>10.1f} {size / 2**20:>10.2f} "
+                  f"{fetch_sec * 1000:>9.1f} {build_sec * 1000:>9.1f}")
+        codes, interned = results['codes'], results['interned']
+        print(f"\nInterned: server {codes[0] / interned[0]:.1f}x faster, result {codes[1] / max(interned[1], 1):.1f}x "
+              f"smaller, fetch {codes[2] / interned[2]:.1f}x faster, graph build {codes[3] / interned[3]:.1f}x faster")
+    finally:
+        close_all()
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pandas C engine vs multithreaded pyarrow.csv export parsing
+
+Parses synthetic GDELT export zips of 100k, 1M and 5M rows (by default) with
+GDELTEventIngestion(parser='pandas') and GDELTEventIngestion(parser='arrow'),
+and reports rows/s for each, plus the Arrow parse alone (parse_export_table,
+without the pandas conversion). Fixture zips are written in slices so the
+generator never holds a 5M-row frame, and are kept in --fixture-dir between
+runs.
+
+Requires pyarrow. Arrow's speedup scales with the cores available to it.
+
+Usage:
+    python benchmarks/benchmark_arrow_parser.py --rows 100000 1000000 5000000
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.event_ingestion import ARROW_AVAILABLE, GDELTEventIngestion  # noqa: E402
+from event_db.synthetic import synthetic_export_frame  # noqa: E402
+
+# Rows generated per slice when writing a fixture
+SLICE_ROWS = 250_000
+
+
+def fixture_zip(directory: Path, n_rows: int, seed: int) -> Path:
+    """Write (or reuse) a synthetic export zip with n_rows events."""
+    path = directory / f"synthetic_{n_rows}_{seed}.export.CSV.zip"
+    if path.exists():
+        return path
+
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        with zf.open(path.with_suffix('').name, 'w', force_zip64=True) as member:
+            for offset in range(0, n_rows, SLICE_ROWS):
+                df = synthetic_export_frame(min(SLICE_ROWS, n_rows - offset), seed=seed + offset,
+                                            first_event_id=1_000_000_000 + offset)
+                buffer = io.StringIO()
+                df.to_csv(buffer, sep='\t', header=False, index=False)
+                member.write(buffer.getvalue().encode('utf-8'))
+    return path
+
+
+def best_of(repeat: int, fn) -> float:
+    """Fastest wall-clock time of repeat calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+        assert result is not None, "parse failed"
+        del result
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000],
+                        help='Fixture sizes in rows')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per parser (best is reported)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--fixture-dir', type=Path, default=Path(tempfile.gettempdir()) / "gdelt_parser_bench",
+                        help='Directory for the generated fixture zips')
+    args = parser.parse_args()
+
+    if not ARROW_AVAILABLE:
+        sys.exit("pyarrow is not installed")
+
+    args.fixture_dir.mkdir(parents=True, exist_ok=True)
+    pandas_parser = GDELTEventIngestion(cache_mode='off', parser='pandas')
+    arrow_parser = GDELTEventIngestion(cache_mode='off', parser='arrow')
+
+    print(f"\nParse throughput in rows/s (best of {args.repeat}, {os.cpu_count()} CPUs)\n")
+    print(f"{'rows':>10}{'pandas':>14}{'arrow':>14}{'arrow table':>14}{'speedup':>10}")
+    for n_rows in args.rows:
+        raw = fixture_zip(args.fixture_dir, n_rows, args.seed).read_bytes()
+        pandas_s = best_of(args.repeat, lambda: pandas_parser.parse_export(raw))
+        arrow_s = best_of(args.repeat, lambda: arrow_parser.parse_export(raw))
+        table_s = best_of(args.repeat, lambda: arrow_parser.parse_export_table(raw))
+        print(f"{n_rows:>10,}{n_rows / pandas_s:>14,.0f}{n_rows / arrow_s:>14,.0f}"
+              f"{n_rows / table_s:>14,.0f}{pandas_s / arrow_s:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CAMEO mapper cold start with and without the compiled artifact
+
+Starts fresh worker processes (as the ingestion ProcessPoolExecutor does)
+that instantiate CAMEOMapper and categorize a small batch, and reports the
+median time from mapper construction to the first result when the lookup
+table is built from the Python mapping versus loaded from the compiled
+.npz artifact. Also times CAMEOMapperLite reusing the same artifact.
+
+Usage:
+    python benchmarks/benchmark_cameo_artifact.py --runs 15
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+WORKER = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import pandas as pd
+from event_db.cameo_mapping import CAMEOMapper, compile_mapping
+from event_db_lite import CAMEOMapperLite
+
+mode, path = sys.argv[1], sys.argv[2]
+codes = pd.Series(['1451', '071', '18', '0211', '999'] * 20)
+start = time.perf_counter()
+if mode == 'build':
+    mapper = CAMEOMapper()
+    mapper._compiled = compile_mapping(mapper.mapping, mapper._build_lookup())
+elif mode == 'lite':
+    mapper = CAMEOMapperLite(artifact_path=path)
+else:
+    mapper = CAMEOMapper(artifact_path=path)
+mapper.categorize_series(codes)
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def cold_start(mode: str, path: Path) -> float:
+    """Seconds to the first categorize_series result in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, '-c', WORKER.format(root=str(ROOT)), mode, str(path)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=15, help='fresh processes per mode')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cameo_mapping.npz"
+        cold_start('artifact', path)  # compile the artifact once
+        print(f"Artifact: {path.stat().st_size:,} bytes\n")
+
+        print(f"{'Mode':<28} {'Median ms':>10}")
+        print("-" * 39)
+        results = {}
+        for mode, label in (('build', 'CAMEOMapper, build lookup'),
+                            ('artifact', 'CAMEOMapper, load artifact'),
+                            ('lite', 'CAMEOMapperLite, artifact')):
+            results[mode] = statistics.median(cold_start(mode, path) for _ in range(args.runs))
+            print(f"{label:<28} {results[mode] * 1000:>10.2f}")
+        print(f"\nCold-start speedup from the artifact: {results['build'] / results['artifact']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
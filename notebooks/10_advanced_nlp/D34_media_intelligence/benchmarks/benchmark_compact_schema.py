@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-memory footprint of the compact GDELT schema
+
+Parses the same synthetic export zip with pandas' inferred dtypes (CAMEO codes
+as str, as before the compact schema) and with GDELTEventIngestion.PARSE_DTYPES,
+then preprocesses both, and reports deep memory usage scaled to one million
+rows.
+
+Usage:
+    python benchmarks/benchmark_compact_schema.py --rows 200000
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.event_ingestion import GDELTEventIngestion  # noqa: E402
+from event_db.synthetic import synthetic_export_frame, write_export_zip  # noqa: E402
+
+CODE_DTYPES = {'EventCode': str, 'EventBaseCode': str, 'EventRootCode': str}
+
+
+def parse_inferred(raw: bytes) -> pd.DataFrame:
+    """Parse with pandas' inferred dtypes (the pre-compact-schema layout)."""
+    with pd.option_context('future.infer_string', False):
+        return pd.read_csv(
+            io.BytesIO(raw),
+            sep='\t',
+            header=None,
+            names=GDELTEventIngestion.GDELT_COLUMNS,
+            compression='zip',
+            low_memory=False,
+            dtype=CODE_DTYPES
+        )
+
+
+def mb_per_million(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / len(df) * 1_000_000 / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200_000, help='Synthetic events to parse')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = write_export_zip(
+            synthetic_export_frame(args.rows, seed=args.seed), Path(tmp) / "bench.export.CSV.zip"
+        ).read_bytes()
+
+    ingestion = GDELTEventIngestion(cache_mode='off')
+    inferred = parse_inferred(raw)
+    compact = ingestion.parse_export(raw)
+
+    results = [
+        ('parsed', mb_per_million(inferred), mb_per_million(compact)),
+        ('preprocessed', mb_per_million(ingestion.preprocess_events(inferred.copy())),
+         mb_per_million(ingestion.preprocess_events(compact.copy()))),
+    ]
+
+    print(f"\n{args.rows:,} synthetic events, deep memory usage in MiB per million rows\n")
+    print(f"{'stage':<14}{'inferred':>12}{'compact':>12}{'ratio':>9}")
+    for stage, before, after in results:
+        print(f"{stage:<14}{before:>12,.0f}{after:>12,.0f}{before / after:>8.1f}x")
+
+    print("\nPer-column MiB per million rows (compact, parsed; largest first):")
+    per_column = compact.memory_usage(deep=True, index=False) / len(compact) * 1_000_000 / 2**20
+    for col, size in per_column.sort_values(ascending=False).head(10).items():
+        print(f"  {col:<24}{size:>8,.1f}  {compact[col].dtype}")
+
+
+if __name__ == '__main__':
+    main()
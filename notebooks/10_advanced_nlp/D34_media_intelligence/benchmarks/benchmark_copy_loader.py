@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: execute_batch inserts vs COPY + merge loading
+
+Loads the same synthetic, preprocessed GDELT frame into a local PostgreSQL
+through GDELTEventIngestion.insert_batch and GDELTEventIngestion.copy_batch,
+each into a fresh schema, then re-loads it to measure the all-duplicates path.
+
+Usage:
+    POSTGRES_HOST=localhost python benchmarks/benchmark_copy_loader.py --rows 100000
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import psycopg2
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.config import DATABASE_CONFIG, INGESTION_CONFIG  # noqa: E402
+from event_db.event_ingestion import GDELTEventIngestion  # noqa: E402
+from event_db.pool import connection_params  # noqa: E402
+from event_db.synthetic import synthetic_export_frame  # noqa: E402
+
+SCHEMA_SQL = (Path(__file__).parent.parent / "event_db" / "schema_events.sql").read_text()
+
+
+def load(ingestion: GDELTEventIngestion, conn, df) -> dict:
+    """Load df in chunk_size batches with the ingestion's load mode."""
+    chunk = INGESTION_CONFIG['chunk_size']
+    inserted = skipped = errors = 0
+    start = time.perf_counter()
+    with conn.cursor() as cursor:
+        for i in range(0, len(df), chunk):
+            batch = df.iloc[i:i + chunk]
+            if ingestion.load_mode == 'copy':
+                ins, skp, err = ingestion.copy_batch(conn, cursor, batch)
+            else:
+                ins, err = ingestion.insert_batch(conn, cursor, batch)
+                skp = 0
+            inserted += ins
+            skipped += skp
+            errors += err
+    elapsed = time.perf_counter() - start
+    return {
+        'seconds': elapsed,
+        'rows_per_sec': len(df) / elapsed,
+        'inserted': inserted,
+        'skipped': skipped,
+        'errors': errors,
+    }
+
+
+def run_mode(mode: str, df) -> dict:
+    """Run a first load and a duplicate re-load in a throwaway schema."""
+    schema = f"bench_{mode}_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(**connection_params())
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}")
+        cursor.execute(SCHEMA_SQL)
+
+    config = dict(DATABASE_CONFIG, options=f"-c search_path={schema}")
+    ingestion = GDELTEventIngestion(db_config=config, load_mode=mode)
+    conn = psycopg2.connect(**connection_params(config))
+    try:
+        first = load(ingestion, conn, df)
+        reload = load(ingestion, conn, df)
+    finally:
+        conn.close()
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+    return {'first': first, 'reload': reload}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000, help='synthetic events to load')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Generating {args.rows:,} synthetic events...")
+    df = GDELTEventIngestion(load_mode='batch').preprocess_events(
+        synthetic_export_frame(args.rows, days=7, seed=args.seed)
+    )
+
+    print(f"\n{'Mode':<8} {'Pass':<8} {'Seconds':>10} {'Rows/s':>12} {'Inserted':>10} {'Skipped':>10} {'Errors':>8}")
+    print("-" * 72)
+    results = {}
+    for mode in ('batch', 'copy'):
+        results[mode] = run_mode(mode, df)
+        for label, r in results[mode].items():
+            print(f"{mode:<8} {label:<8} {r['seconds']:>10.2f} {r['rows_per_sec']:>12,.0f} "
+                  f"{r['inserted']:>10,} {r['skipped']:>10,} {r['errors']:>8,}")
+
+    speedup = results['batch']['first']['seconds'] / results['copy']['first']['seconds']
+    print(f"\nCOPY speedup on first load: {speedup:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
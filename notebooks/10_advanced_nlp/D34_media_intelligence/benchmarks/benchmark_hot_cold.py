@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: analyzer queries on the plain vs hot/cold split gdelt_events schema
+
+Loads the same synthetic, preprocessed GDELT frame into a fresh
+schema_events.sql schema and a fresh schema_events_split.sql schema, runs
+VACUUM ANALYZE, then runs the exact queries ActorNetworkAnalyzer.fetch_interactions
+and GeoEventAnalyzer.fetch_geo_events issue under EXPLAIN (ANALYZE, BUFFERS)
+and reports shared buffer hits/reads, execution time and the plan's scan node.
+
+Usage:
+    POSTGRES_HOST=localhost python benchmarks/benchmark_hot_cold.py --rows 200000
+"""
+
+import argparse
+import statistics
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import psycopg2
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.actor_networks import ActorNetworkAnalyzer  # noqa: E402
+from event_db.config import DATABASE_CONFIG  # noqa: E402
+from event_db.event_ingestion import GDELTEventIngestion  # noqa: E402
+from event_db.geo_analysis import GeoEventAnalyzer  # noqa: E402
+from event_db.pool import close_all, connection_params  # noqa: E402
+from event_db.synthetic import synthetic_export_frame  # noqa: E402
+
+SCHEMA_DIR = Path(__file__).parent.parent / "event_db"
+# Files loaded in order; the split file defines only what schema_events.sql does not share
+SCHEMAS = {'plain': ['schema_events.sql'], 'split': ['schema_events_split.sql', 'schema_events.sql']}
+START = datetime(2024, 1, 1)
+
+
+def analyzer_queries(config: dict, days: int) -> dict:
+    """label -> (query, params) for the analyzer fetches over a one-week window."""
+    start, end = START + timedelta(days=days // 2), START + timedelta(days=days // 2 + 7)
+    actors, geo = ActorNetworkAnalyzer(config), GeoEventAnalyzer(config)
+    return {
+        'interactions': actors._interactions_query(start, end),
+        'interactions/country': actors._interactions_query(start, end, countries=['USA', 'CHN']),
+        'geo_events': geo._geo_events_query(start, end),
+        'geo_events/bbox': geo._geo_events_query(start, end, bbox=(-10.0, 35.0, 30.0, 60.0)),
+    }
+
+
+def scan_nodes(plan: dict) -> str:
+    """Scan node types (and index names) of a plan tree."""
+    stack, scans = [plan], []
+    while stack:
+        node = stack.pop()
+        if 'Scan' in node['Node Type']:
+            scans.append(f"{node['Node Type']}" + (f" {node['Index Name']}" if 'Index Name' in node else ''))
+        stack.extend(node.get('Plans', []))
+    return ', '.join(sorted(set(scans)))
+
+
+def explain(cursor, query: str, params, repeat: int) -> dict:
+    """Median execution time and buffer counts of repeated EXPLAIN ANALYZE runs."""
+    runs = []
+    for _ in range(repeat):
+        cursor.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query, params)
+        runs.append(cursor.fetchone()[0][0])
+    last = runs[-1]['Plan']
+    return {
+        'ms': statistics.median(r['Execution Time'] for r in runs),
+        'hit': last['Shared Hit Blocks'],
+        'read': last['Shared Read Blocks'],
+        'scan': scan_nodes(last),
+    }
+
+
+def run_schema(label: str, df, days: int, repeat: int) -> dict:
+    """Load df into a fresh schema and measure the analyzer queries."""
+    schema = f"bench_hot_cold_{label}_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(**connection_params())
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}")
+        for name in SCHEMAS[label]:
+            cursor.execute((SCHEMA_DIR / name).read_text())
+
+    config = dict(DATABASE_CONFIG, options=f"-c search_path={schema}")
+    try:
+        GDELTEventIngestion(db_config=config, load_mode='copy', rollups=False).load_events(df)
+        with admin.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE gdelt_events")
+            cursor.execute("SELECT pg_total_relation_size('gdelt_events'), pg_relation_size('gdelt_events')")
+            total, heap = cursor.fetchone()
+            results = {name: explain(cursor, query, params, repeat)
+                       for name, (query, params) in analyzer_queries(config, days).items()}
+        return {'total_mb': total / 2**20, 'heap_mb': heap / 2**20, 'queries': results}
+    finally:
+        close_all()
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200_000, help='synthetic events to load')
+    parser.add_argument('--days', type=int, default=30, help='days the events are spread over')
+    parser.add_argument('--repeat', type=int, default=5, help='EXPLAIN ANALYZE runs per query')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Generating {args.rows:,} synthetic events over {args.days} days...")
+    df = GDELTEventIngestion(load_mode='batch').preprocess_events(
+        synthetic_export_frame(args.rows, start_date=START, days=args.days, seed=args.seed)
+    )
+
+    results = {label: run_schema(label, df, args.days, args.repeat) for label in SCHEMAS}
+    for label, r in results.items():
+        print(f"{label:<6} gdelt_events heap {r['heap_mb']:.1f} MB, with indexes {r['total_mb']:.1f} MB")
+
+    print(f"\n{'Query':<22} {'Schema':<6} {'Hit':>8} {'Read':>8} {'ms':>9}  Scan")
+    print("-" * 90)
+    for name in results['plain']['queries']:
+        for label in SCHEMAS:
+            q = results[label]['queries'][name]
+            print(f"{name:<22} {label:<6} {q['hit']:>8,} {q['read']:>8,} {q['ms']:>9.2f}  {q['scan']}")
+        plain, split = results['plain']['queries'][name], results['split']['queries'][name]
+        buffers = (plain['hit'] + plain['read']) / max(split['hit'] + split['read'], 1)
+        print(f"{'':<22} {'':<6} buffers {buffers:.1f}x fewer, latency {plain['ms'] / split['ms']:.1f}x faster\n")
+
+
+if __name__ == '__main__':
+    main()
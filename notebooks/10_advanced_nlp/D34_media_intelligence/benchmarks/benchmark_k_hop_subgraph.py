@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sparse k-hop subgraph extraction vs NetworkX neighbor traversal
+
+Builds synthetic actor graphs and extracts the k-hop neighborhood of the
+highest-degree (hub) actor three ways: the node-by-node G.neighbors()
+traversal get_subgraph used to run (then copied), get_subgraph on the
+NetworkX graph (CSR conversion included) and get_subgraph on the
+SparseActorGraph, with and without a --max-nodes budget. Reports wall time
+and subgraph size.
+
+Usage:
+    python benchmarks/benchmark_k_hop_subgraph.py --edges 100000 500000 --hops 1 2
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.actor_networks import ActorNetworkAnalyzer  # noqa: E402
+from event_db.synthetic import synthetic_interactions  # noqa: E402
+
+
+def traversal_subgraph(G, nodes, k_hop):
+    """The previous get_subgraph: Python-level neighbor expansion, then an induced copy."""
+    neighborhood = set(nodes)
+    for _ in range(k_hop):
+        new_neighbors = set()
+        for node in neighborhood:
+            if node in G:
+                new_neighbors.update(G.neighbors(node))
+        neighborhood.update(new_neighbors)
+    return G.subgraph(neighborhood).copy()
+
+
+def timed(func, *args, repeat: int = 3, **kwargs):
+    """Best wall time over `repeat` calls, and the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--edges', type=int, nargs='+', default=[100_000, 500_000])
+    parser.add_argument('--hops', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--max-nodes', type=int, default=1_000, help='node budget for the budgeted runs')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    analyzer = ActorNetworkAnalyzer()
+    for n_edges in args.edges:
+        interactions = synthetic_interactions(n_edges, seed=args.seed)
+        graph = analyzer.build_sparse_graph(interactions, directed=False)
+        G = graph.to_networkx()
+        degree = np.diff(graph.adjacency().indptr)
+        hub = graph.actors[int(np.argmax(degree))]
+        print(f"\n{graph.number_of_nodes():,} actors, {graph.number_of_edges():,} edges, "
+              f"hub {hub} with {degree.max():,} neighbors")
+        print(f"{'k':>2} {'method':<26} {'nodes':>8} {'ms':>9} {'speedup':>8}")
+        print("-" * 57)
+
+        for k_hop in args.hops:
+            baseline, expected = timed(traversal_subgraph, G, {hub}, k_hop, repeat=args.repeat)
+            runs = [
+                ('networkx traversal', baseline, expected.number_of_nodes()),
+            ]
+            for label, source, budget in (
+                ('sparse, NetworkX input', G, None),
+                ('sparse, SparseActorGraph', graph, None),
+                (f'sparse, budget {args.max_nodes:,}', graph, args.max_nodes),
+            ):
+                seconds, (nodes, _) = timed(analyzer.get_subgraph, source, {hub}, k_hop=k_hop,
+                                            max_nodes=budget, output='sparse', repeat=args.repeat)
+                runs.append((label, seconds, len(nodes)))
+            for label, seconds, size in runs:
+                print(f"{k_hop:>2} {label:<26} {size:>8,} {seconds * 1000:>9.1f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
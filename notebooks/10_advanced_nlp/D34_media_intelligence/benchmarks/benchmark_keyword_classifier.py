@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Aho-Corasick keyword classification vs the naive keyword loop
+
+Counts domain keyword hits in synthetic headlines (100k by default) with
+CAMEOMapper.classify_texts (one automaton pass per headline, pyahocorasick
+and pure-Python backends) and with the naive loop that searches every
+keyword in every headline. Runs with CAMEOMapper.DOMAIN_KEYWORDS and with
+vocabularies grown by --vocab-scale synthetic keywords per domain, since
+the naive loop's cost grows with the vocabulary and the automaton's does not.
+
+Usage:
+    python benchmarks/benchmark_keyword_classifier.py --docs 100000
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.cameo_mapping import CAMEOMapper  # noqa: E402
+from event_db.keyword_classifier import AHOCORASICK_AVAILABLE, KeywordAutomaton  # noqa: E402
+
+FILLER = (
+    "officials said the minister on monday after talks in the capital over new plans "
+    "for regional growth amid reports of rising tension and calls from local leaders"
+).split()
+
+
+def synthetic_headlines(n: int, keywords: list, seed: int = 0) -> list:
+    """Headlines of 8-14 words, about one in five a (possibly inflected) keyword."""
+    rng = random.Random(seed)
+    headlines = []
+    for _ in range(n):
+        words = []
+        for _ in range(rng.randint(8, 14)):
+            if rng.random() < 0.2:
+                words.append(rng.choice(keywords) + rng.choice(['', 's', 'ing', 'ed', 'ion']))
+            else:
+                words.append(rng.choice(FILLER))
+        headline = ' '.join(words)
+        headlines.append(headline.capitalize() if rng.random() < 0.5 else headline)
+    return headlines
+
+
+def scaled_vocabulary(scale: int, seed: int = 0) -> dict:
+    """DOMAIN_KEYWORDS plus `scale` random 5-8 letter keywords per domain."""
+    rng = random.Random(seed)
+    return {
+        domain: keywords + [
+            ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 8))) for _ in range(scale)
+        ]
+        for domain, keywords in CAMEOMapper.DOMAIN_KEYWORDS.items()
+    }
+
+
+def naive_counts(texts: list, keyword_map: dict) -> np.ndarray:
+    """One substring count per keyword per document."""
+    counts = np.zeros((len(texts), len(keyword_map)), dtype=np.int64)
+    for row, text in enumerate(texts):
+        text = text.lower()
+        for col, keywords in enumerate(keyword_map.values()):
+            counts[row, col] = sum(text.count(keyword) for keyword in keywords)
+    return counts
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--docs', type=int, default=100_000, help='synthetic headlines')
+    parser.add_argument('--vocab-scale', type=int, nargs='+', default=[0, 50, 500],
+                        help='extra synthetic keywords per domain')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    backends = ['pyahocorasick', 'python'] if AHOCORASICK_AVAILABLE else ['python']
+    print(f"{args.docs:,} synthetic headlines; docs/s (speedup over naive loop)\n")
+    print(f"{'keywords':>9} {'naive':>12} " + ' '.join(f"{b:>22}" for b in backends))
+    print("-" * (23 + 23 * len(backends)))
+
+    for scale in args.vocab_scale:
+        keyword_map = scaled_vocabulary(scale, args.seed)
+        vocabulary = [keyword for keywords in keyword_map.values() for keyword in keywords]
+        texts = synthetic_headlines(args.docs, vocabulary, args.seed)
+
+        naive_sec, expected = timed(naive_counts, texts, keyword_map)
+        row = f"{len(vocabulary):>9,} {args.docs / naive_sec:>12,.0f} "
+        for backend in backends:
+            automaton = KeywordAutomaton(keyword_map, backend=backend)
+            seconds, counts = timed(automaton.count_many, texts)
+            assert (counts == expected).all(), f"{backend} counts differ from the naive loop"
+            row += f"{args.docs / seconds:>14,.0f} ({naive_sec / seconds:>4.1f}x) "
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
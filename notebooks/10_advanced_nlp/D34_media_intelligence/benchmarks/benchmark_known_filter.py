@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: re-ingesting a fully overlapping window with and without the
+known event-ID pre-filter
+
+Loads a synthetic, preprocessed GDELT frame into a fresh schema, then loads it
+again (every row a duplicate) through GDELTEventIngestion.load_events with
+prefilter_known off (duplicates travel to PostgreSQL and are dropped by
+ON CONFLICT DO NOTHING) and on (KnownEventFilter drops them client-side), for
+both load modes.
+
+Usage:
+    POSTGRES_HOST=localhost python benchmarks/benchmark_known_filter.py --rows 100000
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import psycopg2
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.config import DATABASE_CONFIG  # noqa: E402
+from event_db.event_ingestion import GDELTEventIngestion  # noqa: E402
+from event_db.pool import close_all, connection_params  # noqa: E402
+from event_db.synthetic import synthetic_export_frame  # noqa: E402
+
+SCHEMA_SQL = (Path(__file__).parent.parent / "event_db" / "schema_events.sql").read_text()
+
+
+def timed_load(ingestion: GDELTEventIngestion, df) -> dict:
+    start = time.perf_counter()
+    inserted, skipped, errors = ingestion.load_events(df)
+    elapsed = time.perf_counter() - start
+    return {'seconds': elapsed, 'rows_per_sec': len(df) / elapsed,
+            'inserted': inserted, 'skipped': skipped, 'errors': errors}
+
+
+def run_mode(mode: str, df) -> dict:
+    """First load, then a duplicate re-load without and with the pre-filter."""
+    schema = f"bench_known_{mode}_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(**connection_params())
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}")
+        cursor.execute(SCHEMA_SQL)
+
+    config = dict(DATABASE_CONFIG, options=f"-c search_path={schema}")
+    try:
+        plain = GDELTEventIngestion(db_config=config, load_mode=mode, rollups=False, prefilter_known=False)
+        filtered = GDELTEventIngestion(db_config=config, load_mode=mode, rollups=False, prefilter_known=True)
+        return {
+            'first': timed_load(plain, df),
+            'reload': timed_load(plain, df),
+            'filtered': timed_load(filtered, df),
+        }
+    finally:
+        close_all()
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000, help='synthetic events to load')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Generating {args.rows:,} synthetic events...")
+    df = GDELTEventIngestion(load_mode='batch').preprocess_events(
+        synthetic_export_frame(args.rows, days=7, seed=args.seed)
+    )
+
+    print(f"\n{'Mode':<8} {'Pass':<10} {'Seconds':>10} {'Rows/s':>12} {'Inserted':>10} {'Skipped':>10} {'Errors':>8}")
+    print("-" * 74)
+    for mode in ('batch', 'copy'):
+        results = run_mode(mode, df)
+        for label, r in results.items():
+            print(f"{mode:<8} {label:<10} {r['seconds']:>10.2f} {r['rows_per_sec']:>12,.0f} "
+                  f"{r['inserted']:>10,} {r['skipped']:>10,} {r['errors']:>8,}")
+        speedup = results['reload']['seconds'] / results['filtered']['seconds']
+        print(f"{mode:<8} 100%-overlap re-ingest speedup with pre-filter: {speedup:.1f}x\n")
+
+
+if __name__ == '__main__':
+    main()
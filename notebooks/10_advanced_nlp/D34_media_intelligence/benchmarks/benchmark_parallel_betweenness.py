@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parallel pivot-batched betweenness vs networkx sampled betweenness
+
+Builds synthetic actor graphs and estimates betweenness from the same number
+of sampled pivots (1,000 by default) with nx.betweenness_centrality(k=...)
+and with estimate_betweenness across worker counts, reporting wall time and
+speedup. Also reports how many pivots the tolerance rule needs for a given
+standard error.
+
+Usage:
+    python benchmarks/benchmark_parallel_betweenness.py --edges 100000 --workers 1 2 4 8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import networkx as nx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.betweenness import estimate_betweenness  # noqa: E402
+from event_db.sparse_graph import SparseActorGraph  # noqa: E402
+from event_db.synthetic import synthetic_interactions  # noqa: E402
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--edges', type=int, nargs='+', default=[20_000, 100_000])
+    parser.add_argument('--pivots', type=int, default=1_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--tolerance', type=float, default=1e-3)
+    parser.add_argument('--skip-networkx', action='store_true', help='skip the (slow) networkx baseline')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for n_edges in args.edges:
+        graph = SparseActorGraph.from_interactions(synthetic_interactions(n_edges, seed=args.seed), directed=False)
+        adjacency = graph.adjacency()
+        print(f"\n{graph.number_of_nodes():,} actors, {graph.number_of_edges():,} edges, "
+              f"{args.pivots:,} pivots")
+        print(f"{'method':<22} {'seconds':>9} {'speedup':>8}")
+        print("-" * 41)
+
+        baseline = None
+        if not args.skip_networkx:
+            G = graph.to_networkx()
+            baseline, _ = timed(nx.betweenness_centrality, G, k=min(args.pivots, len(G)), seed=args.seed)
+            print(f"{'networkx k-sampled':<22} {baseline:>9.2f} {1.0:>7.1f}x")
+
+        for workers in args.workers:
+            seconds, _ = timed(estimate_betweenness, adjacency, pivots=args.pivots, workers=workers,
+                               batch_size=args.batch_size, seed=args.seed)
+            baseline = baseline or seconds
+            print(f"{f'batched, {workers} worker(s)':<22} {seconds:>9.2f} {baseline / seconds:>7.1f}x")
+
+        seconds, estimate = timed(estimate_betweenness, adjacency, pivots=graph.number_of_nodes(),
+                                  workers=max(args.workers), batch_size=args.batch_size,
+                                  seed=args.seed, tolerance=args.tolerance)
+        print(f"tolerance {args.tolerance:g}: stopped after {estimate.pivots:,} pivots "
+              f"(max standard error {estimate.max_error:.2e}) in {seconds:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
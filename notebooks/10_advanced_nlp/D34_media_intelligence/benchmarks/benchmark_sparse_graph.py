@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sparse actor graph construction vs one add_edge per interaction
+
+Builds graphs from synthetic interaction frames (10k, 100k and 1M actor pairs
+by default) three ways: the former iterrows/add_edge loop, the vectorized
+SparseActorGraph (factorize + CSR adjacency), and SparseActorGraph followed by
+to_networkx() as ActorNetworkAnalyzer.build_graph now does. The add_edge loop
+is skipped above --loop-max edges.
+
+Usage:
+    python benchmarks/benchmark_sparse_graph.py --edges 10000 100000 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import networkx as nx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.sparse_graph import SparseActorGraph  # noqa: E402
+from event_db.synthetic import synthetic_interactions  # noqa: E402
+
+
+def add_edge_loop(interactions, directed):
+    G = nx.DiGraph() if directed else nx.Graph()
+    for _, row in interactions.iterrows():
+        G.add_edge(row['actor1'], row['actor2'], weight=row['event_count'], event_count=row['event_count'],
+                   avg_goldstein=row['avg_goldstein'], avg_tone=row['avg_tone'])
+    return G
+
+
+def sparse_build(interactions, directed):
+    graph = SparseActorGraph.from_interactions(interactions, directed=directed)
+    graph.adjacency()
+    return graph
+
+
+def sparse_to_networkx(interactions, directed):
+    return SparseActorGraph.from_interactions(interactions, directed=directed).to_networkx()
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--edges', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--loop-max', type=int, default=100_000, help='largest size to run the add_edge loop on')
+    parser.add_argument('--undirected', action='store_true')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    directed = not args.undirected
+    print(f"{'directed' if directed else 'undirected'} graphs; build seconds\n")
+    print(f"{'edges':>10} {'actors':>9} {'add_edge':>10} {'sparse+CSR':>11} {'sparse->nx':>11} {'speedup':>8}")
+    print("-" * 64)
+
+    for n_edges in args.edges:
+        interactions = synthetic_interactions(n_edges, seed=args.seed)
+        actors = len(set(interactions['actor1']) | set(interactions['actor2']))
+        sparse_sec = timed(sparse_build, interactions, directed)
+        to_nx_sec = timed(sparse_to_networkx, interactions, directed)
+        if n_edges <= args.loop_max:
+            loop_sec = timed(add_edge_loop, interactions, directed)
+            loop, speedup = f"{loop_sec:>10.3f}", f"{loop_sec / sparse_sec:>7.0f}x"
+        else:
+            loop, speedup = f"{'-':>10}", f"{'-':>8}"
+        print(f"{n_edges:>10,} {actors:>9,} {loop} {sparse_sec:>11.3f} {to_nx_sec:>11.3f} {speedup}")
+
+
+if __name__ == '__main__':
+    main()
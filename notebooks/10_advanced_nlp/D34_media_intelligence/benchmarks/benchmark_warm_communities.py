@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: warm-started vs cold community detection over sliding windows
+
+Generates timestamped interactions among actors in planted communities, then
+slides a --window-day window forward one day at a time. Each window's graph
+gets its communities three ways: ActorNetworkAnalyzer.detect_communities cold
+(python-louvain, or greedy modularity when it is not installed), cold local
+moving from singletons (refine_partition over every node) and
+warm_start_communities seeded with the previous window's partition. Reports
+per-window node evaluations, wall time and modularity.
+
+Usage:
+    python benchmarks/benchmark_warm_communities.py --actors 5000 --days 30 --window-days 7
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.actor_networks import ActorNetworkAnalyzer  # noqa: E402
+from event_db.community_refinement import modularity, refine_partition  # noqa: E402
+
+
+def planted_interactions(n_actors: int, groups: int, events_per_day: int, days: int, seed: int) -> pd.DataFrame:
+    """Daily actor pairs, 90% inside one of `groups` planted communities."""
+    rng = np.random.default_rng(seed)
+    group = rng.integers(0, groups, size=n_actors)
+    members = [np.flatnonzero(group == g) for g in range(groups)]
+    n = events_per_day * days
+    actor1 = rng.integers(0, n_actors, size=n)
+    inside = rng.random(n) < 0.9
+    actor2 = rng.integers(0, n_actors, size=n)
+    actor2[inside] = [rng.choice(members[group[a]]) for a in actor1[inside]]
+    names = np.array([f"ACT{i:06d}" for i in range(n_actors)], dtype=object)
+    return pd.DataFrame({
+        'day': rng.integers(0, days, size=n),
+        'actor1': names[actor1],
+        'actor2': names[actor2],
+    })
+
+
+def window_interactions(events: pd.DataFrame, first_day: int, window_days: int) -> pd.DataFrame:
+    window = events[(events['day'] >= first_day) & (events['day'] < first_day + window_days)]
+    pairs = window.groupby(['actor1', 'actor2']).size().reset_index(name='event_count')
+    pairs['avg_goldstein'] = 0.0
+    pairs['avg_tone'] = 0.0
+    return pairs
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--actors', type=int, default=5_000)
+    parser.add_argument('--groups', type=int, default=50)
+    parser.add_argument('--events-per-day', type=int, default=6_000)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--window-days', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    events = planted_interactions(args.actors, args.groups, args.events_per_day, args.days, args.seed)
+    analyzer = ActorNetworkAnalyzer()
+
+    print(f"{'window':>6} {'nodes':>6} {'edges':>7} {'changed':>7} | "
+          f"{'louvain ms':>10} {'Q':>6} | {'cold evals':>10} {'ms':>7} {'Q':>6} | "
+          f"{'warm evals':>10} {'ms':>7} {'Q':>6} {'dQ':>7}")
+    print("-" * 112)
+
+    totals = np.zeros(4)
+    for first_day in range(args.days - args.window_days + 1):
+        G = analyzer.build_graph(window_interactions(events, first_day, args.window_days), directed=False)
+        nodes, adjacency = analyzer._community_adjacency(G)
+
+        louvain_sec, partition = timed(analyzer.detect_communities, G)
+        louvain_q = modularity(adjacency, np.array([partition[node] for node in nodes]))
+        cold_sec, cold = timed(refine_partition, adjacency, np.arange(len(nodes)))
+
+        if first_day == 0:
+            analyzer.detect_communities(G, lineage='sliding')
+            continue
+        warm_sec, warm = timed(analyzer.warm_start_communities, G, lineage='sliding')
+
+        totals += [cold.evaluations, cold_sec, warm.evaluations, warm_sec]
+        print(f"{first_day:>6} {len(nodes):>6,} {G.number_of_edges():>7,} {warm.active_nodes:>7,} | "
+              f"{louvain_sec * 1000:>10.1f} {louvain_q:>6.3f} | "
+              f"{cold.evaluations:>10,} {cold_sec * 1000:>7.1f} {cold.modularity:>6.3f} | "
+              f"{warm.evaluations:>10,} {warm_sec * 1000:>7.1f} {warm.modularity:>6.3f} {warm.modularity_delta:>+7.3f}")
+
+    print(f"\nWarm vs cold local moving: {totals[0] / max(totals[2], 1):.1f}x fewer evaluations, "
+          f"{totals[1] / max(totals[3], 1e-9):.1f}x less time")
+
+
+if __name__ == '__main__':
+    main()
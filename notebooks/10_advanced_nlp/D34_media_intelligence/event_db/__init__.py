@@ -8,13 +8,25 @@ __version__ = "0.1.0"
 __author__ = "KR-Labs"
 
 from .event_ingestion import GDELTEventIngestion
+from .feed_follower import GDELTFeedFollower
+from .backfill import BackfillQueue
 from .cameo_mapping import CAMEOMapper
 from .actor_networks import ActorNetworkAnalyzer
+from .actor_dictionary import ActorDictionary
+from .sparse_graph import SparseActorGraph
 from .geo_analysis import GeoEventAnalyzer
+from .partitions import PartitionManager
+from .rollups import EventRollups
 
 __all__ = [
     "GDELTEventIngestion",
+    "GDELTFeedFollower",
+    "BackfillQueue",
     "CAMEOMapper",
     "ActorNetworkAnalyzer",
+    "ActorDictionary",
+    "SparseActorGraph",
     "GeoEventAnalyzer",
+    "EventRollups",
+    "PartitionManager",
 ]
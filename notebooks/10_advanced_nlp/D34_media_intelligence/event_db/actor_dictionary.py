@@ -0,0 +1,272 @@
+"""
+Actor Dictionary
+
+Interns actor codes as integer IDs. The actors table holds one row per
+distinct actor code (with the first actor name seen for it), and
+GDELTEventIngestion stamps every event with actor1_id / actor2_id before
+loading it, so ActorNetworkAnalyzer groups interactions on 4-byte integers
+instead of repeated text and looks up the codes of only the actors in its
+result.
+
+Each batch's distinct codes are resolved with one upsert and one lookup of
+the codes not yet cached by the process, so steady-state loads do not touch
+the actors table for actors they have seen before.
+
+Databases created before the actor dictionary are upgraded in place (actors
+table, ID columns and IDs for the events already stored) with:
+    python -m event_db.actor_dictionary --backfill
+
+Until then ActorNetworkAnalyzer keeps grouping on actor codes, so events
+stored without IDs are never left out of its results.
+
+Author: KRL Team
+"""
+
+import argparse
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from psycopg2 import sql
+
+from .config import DATABASE_CONFIG
+from .pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+# Event column holding each actor's code -> column holding its interned ID
+ID_COLUMNS = {'actor1_code': 'actor1_id', 'actor2_code': 'actor2_id'}
+
+
+class ActorDictionary:
+    """Integer IDs for actor codes, backed by the actors table."""
+
+    INTERN_SQL = """
+        INSERT INTO actors (actor_code, actor_name)
+        SELECT * FROM unnest(%s::text[], %s::text[])
+        ON CONFLICT (actor_code) DO NOTHING
+    """
+
+    IDS_SQL = "SELECT actor_code, actor_id FROM actors WHERE actor_code = ANY(%s)"
+
+    CODES_SQL = "SELECT actor_id, actor_code FROM actors WHERE actor_id = ANY(%s) ORDER BY actor_id"
+
+    # Whether gdelt_events (as resolved by search_path) has the ID columns and actors exists
+    HAS_IDS_SQL = """
+        SELECT to_regclass('actors') IS NOT NULL AND COUNT(*) = 2
+        FROM information_schema.columns c
+        JOIN pg_class t ON t.oid = to_regclass('gdelt_events')
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE c.table_schema = n.nspname AND c.table_name = 'gdelt_events'
+          AND c.column_name IN ('actor1_id', 'actor2_id')
+    """
+
+    # Answered from the idx_missing_actor_ids partial index, which is empty once backfilled
+    IDS_COMPLETE_SQL = """
+        SELECT NOT EXISTS (
+            SELECT 1 FROM gdelt_events
+            WHERE (actor1_id IS NULL AND actor1_code IS NOT NULL)
+               OR (actor2_id IS NULL AND actor2_code IS NOT NULL)
+        )
+    """
+
+    # Brings a database created before the actor dictionary up to the current schema
+    UPGRADE_SQL = """
+        CREATE TABLE IF NOT EXISTS actors (
+            actor_id SERIAL PRIMARY KEY,
+            actor_code VARCHAR(50) NOT NULL UNIQUE,
+            actor_name TEXT
+        );
+        ALTER TABLE gdelt_events
+            ADD COLUMN IF NOT EXISTS actor1_id INTEGER,
+            ADD COLUMN IF NOT EXISTS actor2_id INTEGER;
+        CREATE INDEX IF NOT EXISTS idx_date_actor_ids ON gdelt_events(event_date, actor1_id, actor2_id);
+        CREATE INDEX IF NOT EXISTS idx_missing_actor_ids ON gdelt_events(event_id)
+            WHERE (actor1_id IS NULL AND actor1_code IS NOT NULL)
+               OR (actor2_id IS NULL AND actor2_code IS NOT NULL);
+        -- Transient; copy_batch() recreates it with the new columns
+        DROP TABLE IF EXISTS gdelt_events_staging;
+    """
+
+    # The hot/cold split schema's view expands e.* when created, so it is rebuilt
+    UPGRADE_SPLIT_SQL = """
+        DROP VIEW IF EXISTS gdelt_events_full;
+        CREATE VIEW gdelt_events_full AS
+        SELECT e.*, d.actor1_name, d.actor2_name, d.actor1_geo_fullname, d.actor2_geo_fullname, d.source_url
+        FROM gdelt_events e
+        LEFT JOIN gdelt_events_detail d USING (event_id);
+    """
+
+    BACKFILL_ACTORS_SQL = """
+        INSERT INTO actors (actor_code, actor_name)
+        SELECT actor_code, MIN(actor_name)
+        FROM (
+            SELECT actor1_code AS actor_code, actor1_name AS actor_name FROM {source}
+            WHERE actor1_code IS NOT NULL AND actor1_id IS NULL
+            UNION ALL
+            SELECT actor2_code, actor2_name FROM {source}
+            WHERE actor2_code IS NOT NULL AND actor2_id IS NULL
+        ) codes
+        GROUP BY actor_code
+        ORDER BY actor_code
+        ON CONFLICT (actor_code) DO NOTHING
+    """
+
+    BACKFILL_IDS_SQL = """
+        UPDATE gdelt_events SET
+            actor1_id = (SELECT actor_id FROM actors WHERE actor_code = actor1_code),
+            actor2_id = (SELECT actor_id FROM actors WHERE actor_code = actor2_code)
+        WHERE (actor1_id IS NULL AND actor1_code IS NOT NULL)
+           OR (actor2_id IS NULL AND actor2_code IS NOT NULL)
+    """
+
+    def __init__(self, db_config: Optional[Dict] = None):
+        """Initialize actor dictionary.
+
+        Args:
+            db_config: PostgreSQL connection config (defaults to DATABASE_CONFIG)
+        """
+        self.db_config = db_config or DATABASE_CONFIG
+        # actor_code -> actor_id for every code this process has resolved
+        self._ids: Dict[str, int] = {}
+
+    @classmethod
+    def has_actor_ids(cls, cursor) -> bool:
+        """Whether the schema has the actors dictionary and the event ID columns to load."""
+        cursor.execute(cls.HAS_IDS_SQL)
+        return cursor.fetchone()[0]
+
+    @classmethod
+    def ids_complete(cls, cursor) -> bool:
+        """Whether every stored actor code has its ID (false until backfill() after an upgrade)."""
+        cursor.execute(cls.IDS_COMPLETE_SQL)
+        return cursor.fetchone()[0]
+
+    def intern(self, conn, cursor, codes: Iterable[str], names: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+        """Resolve actor codes to IDs, adding codes not in the dictionary yet.
+
+        Commits when codes had to be resolved, so new dictionary entries
+        outlive a load that fails after them (they are valid either way).
+
+        Args:
+            conn: psycopg2 connection
+            cursor: psycopg2 cursor
+            codes: Distinct actor codes
+            names: Actor name to store with a new code (optional)
+
+        Returns:
+            Mapping from actor code to actor_id covering every code given
+        """
+        missing = sorted(code for code in codes if code not in self._ids)
+        if missing:
+            names = names or {}
+            cursor.execute(self.INTERN_SQL, (missing, [names.get(code) for code in missing]))
+            added = cursor.rowcount
+            cursor.execute(self.IDS_SQL, (missing,))
+            self._ids.update(cursor.fetchall())
+            conn.commit()
+            logger.debug(f"Resolved {len(missing):,} actor codes ({added:,} new)")
+        return self._ids
+
+    def assign_ids(self, conn, cursor, batch: pd.DataFrame) -> pd.DataFrame:
+        """Add actor1_id / actor2_id columns to a preprocessed batch.
+
+        Args:
+            conn: psycopg2 connection
+            cursor: psycopg2 cursor
+            batch: Preprocessed DataFrame chunk (Actor1Code, Actor2Code, ...)
+
+        Returns:
+            The batch with nullable Int32 actor1_id and actor2_id columns
+            (missing where the code is missing)
+        """
+        n = len(batch)
+        codes = pd.concat([batch['Actor1Code'], batch['Actor2Code']], ignore_index=True).astype(object)
+        names = pd.concat([batch['Actor1Name'], batch['Actor2Name']], ignore_index=True).astype(object)
+        positions, distinct = pd.factorize(codes)
+
+        # First non-missing name of each code
+        named = pd.Series(names.to_numpy(), index=positions).dropna()
+        named = named[(named.index >= 0) & ~named.index.duplicated()]
+        first_names = dict(zip(distinct[named.index].tolist(), named.tolist()))
+
+        ids = self.intern(conn, cursor, distinct.tolist(), first_names)
+        # Trailing 0 is what a missing code (position -1) picks up; it is masked
+        lookup = np.array([ids[code] for code in distinct.tolist()] + [0], dtype=np.int32)
+        values = pd.arrays.IntegerArray(lookup[positions], positions < 0)
+        return batch.assign(actor1_id=values[:n], actor2_id=values[n:])
+
+    @classmethod
+    def codes(cls, cursor, actor_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Codes of a set of actor IDs.
+
+        Args:
+            cursor: psycopg2 cursor
+            actor_ids: Actor IDs (duplicates allowed)
+
+        Returns:
+            (sorted distinct IDs found, their codes as an object array)
+        """
+        cursor.execute(cls.CODES_SQL, (np.unique(actor_ids).tolist(),))
+        rows = cursor.fetchall()
+        found = np.array([row[0] for row in rows], dtype=np.int64)
+        codes = np.empty(len(rows), dtype=object)
+        codes[:] = [row[1] for row in rows]
+        return found, codes
+
+    def backfill(self, split: Optional[bool] = None) -> int:
+        """Upgrade the schema and intern the actors of events stored without IDs.
+
+        Creates the actors table and ID columns when missing, then adds every
+        code of an event without IDs to the dictionary and sets the event's
+        IDs, in one transaction.
+
+        Args:
+            split: Hot/cold split schema (names are read through gdelt_events_full);
+                detected from the schema when None
+
+        Returns:
+            Number of events updated
+        """
+        with get_pool(self.db_config).connection() as conn, conn.cursor() as cursor:
+            try:
+                if split is None:
+                    cursor.execute("SELECT to_regclass('gdelt_events_detail') IS NOT NULL")
+                    split = cursor.fetchone()[0]
+                cursor.execute(self.UPGRADE_SQL)
+                if split:
+                    cursor.execute(self.UPGRADE_SPLIT_SQL)
+                source = sql.Identifier('gdelt_events_full' if split else 'gdelt_events')
+                cursor.execute(sql.SQL(self.BACKFILL_ACTORS_SQL).format(source=source))
+                added = cursor.rowcount
+                cursor.execute(self.BACKFILL_IDS_SQL)
+                updated = cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        self._ids.clear()
+        logger.info(f"Backfilled actor IDs: {added:,} new actors, {updated:,} events updated")
+        return updated
+
+
+def main():
+    """Maintenance command: upgrade a database to interned actor IDs."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Intern actor codes as integer actor IDs")
+    parser.add_argument('--backfill', action='store_true', required=True,
+                        help='create the actors table and ID columns, and set IDs of stored events')
+    parser.parse_args()
+
+    updated = ActorDictionary().backfill()
+    print(f"Set actor IDs of {updated:,} events")
+
+
+if __name__ == '__main__':
+    main()
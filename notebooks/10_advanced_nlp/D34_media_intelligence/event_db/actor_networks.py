@@ -5,32 +5,67 @@ Constructs and analyzes networks of actors (countries, organizations, groups)
 based on their interactions in GDELT Event Database.
 
 Features:
-- Directed/undirected graph construction
-- Community detection (Louvain)
-- Centrality metrics (degree, betweenness, eigenvector)
-- Temporal network evolution
-- Subgraph extraction by domain
+- Interaction queries grouped on interned integer actor IDs
+- Directed/undirected graph construction (sparse, NetworkX on demand)
+- Community detection (Louvain, warm-started across related graphs)
+- Centrality metrics (degree, betweenness, eigenvector; parallel sampled betweenness)
+- Temporal network evolution (single windowed query, incremental metrics)
+- Subgraph extraction by domain and sparse k-hop neighborhood (with a node budget)
 
 Author: KRL Team
 """
 
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple, Set, Union
 
 import networkx as nx
+import numpy as np
 import pandas as pd
-import psycopg2
 from psycopg2 import sql
+from scipy import sparse
 
-from .config import DATABASE_CONFIG
+from .actor_dictionary import ActorDictionary
+from .betweenness import estimate_betweenness
+from .community_refinement import CommunityUpdate, modularity, refine_partition
+from .config import DATABASE_CONFIG, NETWORK_CONFIG
+from .pool import get_pool
+from .sparse_graph import RunningAdjacency, SparseActorGraph, graph_fingerprint, k_hop_neighborhood
 
 logger = logging.getLogger(__name__)
 
 
+class _LineageState(NamedTuple):
+    """Last graph and partition of a detect_communities() lineage."""
+    nodes: List
+    adjacency: sparse.csr_matrix
+    partition: Dict
+    modularity: float
+
+
 class ActorNetworkAnalyzer:
     """Analyzes actor interaction networks from GDELT events."""
     
+    # Compact in-memory dtypes for fetch_interactions() results
+    INTERACTION_DTYPES = {
+        'event_count': 'int32',
+        'avg_goldstein': 'float32',
+        'avg_tone': 'float32',
+    }
+    
+    # Interned actor ID columns of fetch results (see ActorDictionary)
+    ACTOR_ID_DTYPES = {
+        'actor1_id': 'int32',
+        'actor2_id': 'int32',
+    }
+    
+    # Metrics calculate_centrality() can compute
+    CENTRALITY_METRICS = ('degree', 'betweenness', 'eigenvector')
+    
+    # Graphs whose centrality arrays are kept (least recently used evicted)
+    CENTRALITY_CACHE_SIZE = 16
+    
     def __init__(self, db_config: Optional[Dict] = None):
         """Initialize network analyzer.
         
@@ -38,80 +73,303 @@ class ActorNetworkAnalyzer:
             db_config: PostgreSQL connection config (defaults to DATABASE_CONFIG)
         """
         self.db_config = db_config or DATABASE_CONFIG
+        # graph_fingerprint() -> (nodes, {metric: score array aligned with nodes})
+        self._centrality_cache: OrderedDict = OrderedDict()
+        # detect_communities() lineage -> _LineageState
+        self._lineages: Dict[Hashable, _LineageState] = {}
+        # Whether every stored event has its actor IDs (re-checked until it does)
+        self._interned: Optional[bool] = None
     
-    def fetch_interactions(
+    def _interaction_filters(
         self,
         start_date: datetime,
         end_date: datetime,
         domain: Optional[str] = None,
         min_goldstein: Optional[float] = None,
         max_goldstein: Optional[float] = None,
-        countries: Optional[List[str]] = None
-    ) -> pd.DataFrame:
-        """Fetch actor interactions from database.
-        
-        Args:
-            start_date: Start of time window
-            end_date: End of time window
-            domain: Filter by socioeconomic domain (optional)
-            min_goldstein: Minimum Goldstein scale (optional)
-            max_goldstein: Maximum Goldstein scale (optional)
-            countries: Filter by country codes (optional)
-            
-        Returns:
-            DataFrame with columns: actor1, actor2, event_count, avg_goldstein, avg_tone
-        """
-        conn = psycopg2.connect(**self.db_config)
-        
-        # Build query with filters
-        query = """
-            SELECT
-                actor1_code AS actor1,
-                actor2_code AS actor2,
-                COUNT(*) AS event_count,
-                AVG(goldstein_scale) AS avg_goldstein,
-                AVG(avg_tone) AS avg_tone,
-                ARRAY_AGG(DISTINCT event_code) AS event_types
-            FROM gdelt_events
-            WHERE
+        countries: Optional[List[str]] = None,
+        interned: bool = False
+    ) -> Tuple[str, Dict]:
+        """WHERE clause shared by the interaction queries, and its parameters."""
+        where = """
                 event_date BETWEEN %(start_date)s AND %(end_date)s
                 AND actor1_code IS NOT NULL
                 AND actor2_code IS NOT NULL
         """
         
+        if interned:
+            where += " AND actor1_id IS NOT NULL AND actor2_id IS NOT NULL"
+        
         params = {
             'start_date': start_date,
             'end_date': end_date
         }
         
         if domain:
-            query += " AND socioeconomic_domain = %(domain)s"
+            where += " AND socioeconomic_domain = %(domain)s"
             params['domain'] = domain
         
         if min_goldstein is not None:
-            query += " AND goldstein_scale >= %(min_goldstein)s"
+            where += " AND goldstein_scale >= %(min_goldstein)s"
             params['min_goldstein'] = min_goldstein
         
         if max_goldstein is not None:
-            query += " AND goldstein_scale <= %(max_goldstein)s"
+            where += " AND goldstein_scale <= %(max_goldstein)s"
             params['max_goldstein'] = max_goldstein
         
         if countries:
-            query += " AND (actor1_country_code = ANY(%(countries)s) OR actor2_country_code = ANY(%(countries)s))"
+            where += " AND (actor1_country_code = ANY(%(countries)s) OR actor2_country_code = ANY(%(countries)s))"
             params['countries'] = countries
         
-        query += """
-            GROUP BY actor1_code, actor2_code
+        return where, params
+    
+    def _interactions_query(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        domain: Optional[str] = None,
+        min_goldstein: Optional[float] = None,
+        max_goldstein: Optional[float] = None,
+        countries: Optional[List[str]] = None,
+        top_n: Optional[int] = None,
+        interned: bool = False
+    ) -> Tuple[str, Dict]:
+        """Build the fetch_interactions() query and its parameters.
+        
+        Interned queries group on actor1_id / actor2_id and return those
+        instead of the actor codes (see _with_actor_codes()).
+        """
+        where, params = self._interaction_filters(
+            start_date, end_date, domain, min_goldstein, max_goldstein, countries, interned
+        )
+        actors, group_by = self._actor_columns(interned)
+        query = """
+            SELECT
+                """ + actors + """,
+                COUNT(*) AS event_count,
+                AVG(goldstein_scale) AS avg_goldstein,
+                AVG(avg_tone) AS avg_tone,
+                ARRAY_AGG(DISTINCT event_code) AS event_types
+            FROM gdelt_events
+            WHERE
+        """ + where + """
+            GROUP BY """ + group_by + """
             HAVING COUNT(*) >= 5
             ORDER BY event_count DESC
         """
+        if top_n is not None:
+            query += " LIMIT %(top_n)s"
+            params['top_n'] = top_n
+        return query, params
+    
+    @staticmethod
+    def _actor_columns(interned: bool) -> Tuple[str, str]:
+        """Actor select list and GROUP BY columns of the interaction queries."""
+        if interned:
+            return "actor1_id, actor2_id", "actor1_id, actor2_id"
+        return "actor1_code AS actor1, actor2_code AS actor2", "actor1_code, actor2_code"
+    
+    def _windowed_interactions_query(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        window_days: int,
+        domain: Optional[str] = None,
+        interned: bool = False
+    ) -> Tuple[str, Dict]:
+        """Build the fetch_windowed_interactions() query and its parameters.
+        
+        Window k spans [start + k * window, min(start + (k + 1) * window, end)],
+        inclusive at both ends like fetch_interactions(), so an event dated
+        exactly on a window boundary is counted in both windows: each event
+        gets its bucket (offset // window) and, on a boundary, the bucket
+        before it.
+        """
+        where, params = self._interaction_filters(start_date, end_date, domain, interned=interned)
+        actors, group_by = self._actor_columns(interned)
+        params['window_seconds'] = window_days * 86400
+        params['last_window'] = len(self._windows(start_date, end_date, window_days)) - 1
         
-        df = pd.read_sql_query(query, conn, params=params)
-        conn.close()
+        query = """
+            WITH events AS (
+                SELECT
+                    """ + group_by + """,
+                    goldstein_scale,
+                    avg_tone,
+                    EXTRACT(EPOCH FROM event_date - %(start_date)s::timestamp)::bigint AS offset_seconds
+                FROM gdelt_events
+                WHERE
+        """ + where + """
+            )
+            SELECT
+                w.window_index,
+                """ + actors + """,
+                COUNT(*) AS event_count,
+                AVG(goldstein_scale) AS avg_goldstein,
+                AVG(avg_tone) AS avg_tone
+            FROM events
+            CROSS JOIN LATERAL (VALUES
+                (offset_seconds / %(window_seconds)s),
+                (CASE WHEN offset_seconds %% %(window_seconds)s = 0
+                      THEN offset_seconds / %(window_seconds)s - 1 END)
+            ) AS w (window_index)
+            WHERE w.window_index BETWEEN 0 AND %(last_window)s
+            GROUP BY w.window_index, """ + group_by + """
+            HAVING COUNT(*) >= 5
+            ORDER BY w.window_index, event_count DESC
+        """
+        return query, params
+    
+    def _uses_actor_ids(self, conn) -> bool:
+        """Whether interaction queries can group on interned actor IDs.
+        
+        Only once no stored event has an actor code without its ID: events
+        loaded before an upgrade would otherwise drop out of the ID-grouped
+        queries, so until backfill runs the queries group on actor codes.
+        """
+        if not self._interned:
+            with conn.cursor() as cursor:
+                has_ids = ActorDictionary.has_actor_ids(cursor)
+                interned = has_ids and ActorDictionary.ids_complete(cursor)
+            if has_ids and not interned and self._interned is None:
+                logger.warning("Events without actor IDs; grouping interactions on actor codes "
+                               "until `python -m event_db.actor_dictionary --backfill` is run")
+            self._interned = interned
+        return self._interned
+    
+    def _with_actor_codes(self, conn, df: pd.DataFrame) -> pd.DataFrame:
+        """Add actor1 / actor2 codes to a frame of interned pairs.
+        
+        Codes are fetched once per distinct actor in the frame and spread over
+        the rows with a vectorized lookup; the ID columns move to the end.
+        """
+        ids = df[list(self.ACTOR_ID_DTYPES)].to_numpy(dtype=np.int64)
+        with conn.cursor() as cursor:
+            known, codes = ActorDictionary.codes(cursor, ids)
+        positions = np.searchsorted(known, ids)
+        
+        leading = ['window_index'] if 'window_index' in df else []
+        rest = [col for col in df.columns if col not in leading and col not in self.ACTOR_ID_DTYPES]
+        return df[leading].assign(actor1=codes[positions[:, 0]], actor2=codes[positions[:, 1]]).join(
+            df[rest + list(self.ACTOR_ID_DTYPES)].astype(self.ACTOR_ID_DTYPES)
+        )
+    
+    def fetch_interactions(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        domain: Optional[str] = None,
+        min_goldstein: Optional[float] = None,
+        max_goldstein: Optional[float] = None,
+        countries: Optional[List[str]] = None,
+        top_n: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Fetch actor interactions from database.
+        
+        When every stored event has its interned actor IDs, pairs are grouped
+        on them and actor codes are looked up only for the actors of the
+        returned pairs.
+        
+        Args:
+            start_date: Start of time window
+            end_date: End of time window
+            domain: Filter by socioeconomic domain (optional)
+            min_goldstein: Minimum Goldstein scale (optional)
+            max_goldstein: Maximum Goldstein scale (optional)
+            countries: Filter by country codes (optional)
+            top_n: Return only the top_n pairs by event count (optional)
+            
+        Returns:
+            DataFrame with columns: actor1, actor2, event_count, avg_goldstein, avg_tone,
+            event_types (and actor1_id, actor2_id when actor IDs are interned)
+        """
+        with get_pool(self.db_config).connection() as conn:
+            interned = self._uses_actor_ids(conn)
+            query, params = self._interactions_query(
+                start_date, end_date, domain, min_goldstein, max_goldstein, countries, top_n, interned
+            )
+            df = pd.read_sql_query(query, conn, params=params)
+            if interned:
+                df = self._with_actor_codes(conn, df)
+        df = df.astype(self.INTERACTION_DTYPES)
         
         logger.info(f"Fetched {len(df):,} actor pairs from {start_date} to {end_date}")
         return df
     
+    @staticmethod
+    def _windows(start_date: datetime, end_date: datetime, window_days: int) -> List[Tuple[datetime, datetime]]:
+        """Consecutive (window_start, window_end) pairs covering start_date .. end_date."""
+        windows = []
+        current_start = start_date
+        while current_start < end_date:
+            current_end = min(current_start + timedelta(days=window_days), end_date)
+            windows.append((current_start, current_end))
+            current_start = current_end
+        return windows
+    
+    def fetch_windowed_interactions(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        window_days: int = 7,
+        domain: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Fetch actor interactions for every time window in one query.
+        
+        Equivalent to one fetch_interactions() call per window of
+        analyze_temporal_evolution() (without event_types), from a single
+        scan of the date range.
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            window_days: Size of time window in days
+            domain: Filter by socioeconomic domain (optional)
+            
+        Returns:
+            DataFrame with columns: window_index, actor1, actor2, event_count,
+            avg_goldstein, avg_tone (and actor1_id, actor2_id when actor IDs are
+            interned), sorted by window_index, then event_count descending
+        """
+        with get_pool(self.db_config).connection() as conn:
+            interned = self._uses_actor_ids(conn)
+            query, params = self._windowed_interactions_query(
+                start_date, end_date, window_days, domain, interned
+            )
+            df = pd.read_sql_query(query, conn, params=params)
+            if interned:
+                df = self._with_actor_codes(conn, df)
+        df = df.astype({'window_index': 'int32', **self.INTERACTION_DTYPES})
+        
+        logger.info(f"Fetched {len(df):,} windowed actor pairs from {start_date} to {end_date}")
+        return df
+    
+    def build_sparse_graph(
+        self,
+        interactions: pd.DataFrame,
+        directed: bool = True,
+        weight_by: str = 'event_count'
+    ) -> SparseActorGraph:
+        """Build a sparse actor graph from interactions.
+        
+        Actor names are factorized into integer node IDs and the edges kept
+        as arrays, with CSR adjacency available via SparseActorGraph.adjacency().
+        
+        Args:
+            interactions: DataFrame from fetch_interactions()
+            directed: True for directed graph, False for undirected
+            weight_by: Edge weight attribute ('event_count', 'avg_goldstein', 'avg_tone')
+            
+        Returns:
+            SparseActorGraph
+        """
+        graph = SparseActorGraph.from_interactions(interactions, directed=directed, weight_by=weight_by)
+        
+        logger.info(f"Built {'directed' if directed else 'undirected'} graph: "
+                   f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+        
+        return graph
+    
     def build_graph(
         self,
         interactions: pd.DataFrame,
@@ -128,32 +386,45 @@ class ActorNetworkAnalyzer:
         Returns:
             NetworkX Graph or DiGraph
         """
-        G = nx.DiGraph() if directed else nx.Graph()
-        
-        for _, row in interactions.iterrows():
-            G.add_edge(
-                row['actor1'],
-                row['actor2'],
-                weight=row[weight_by],
-                event_count=row['event_count'],
-                avg_goldstein=row['avg_goldstein'],
-                avg_tone=row['avg_tone']
-            )
-        
-        logger.info(f"Built {'directed' if directed else 'undirected'} graph: "
-                   f"{G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
-        
-        return G
+        return self.build_sparse_graph(interactions, directed=directed, weight_by=weight_by).to_networkx()
     
-    def detect_communities(self, G: nx.Graph) -> Dict[str, int]:
+    def _community_adjacency(self, G: nx.Graph) -> Tuple[List, sparse.csr_matrix]:
+        """Nodes and symmetric weighted CSR adjacency of G, as community detection sees it."""
+        G_undirected = G.to_undirected() if G.is_directed() else G
+        nodes = list(G_undirected)
+        return nodes, sparse.csr_matrix(nx.to_scipy_sparse_array(G_undirected, nodelist=nodes, weight='weight'))
+    
+    def _remember_partition(self, lineage: Hashable, G: nx.Graph, partition: Dict):
+        """Keep a graph's partition as the warm start for the next graph of its lineage."""
+        nodes, adjacency = self._community_adjacency(G)
+        labels = np.array([partition[node] for node in nodes])
+        self._lineages[lineage] = _LineageState(nodes, adjacency, partition, modularity(adjacency, labels))
+    
+    def detect_communities(
+        self,
+        G: nx.Graph,
+        previous: Optional[Dict[str, int]] = None,
+        lineage: Optional[Hashable] = None
+    ) -> Dict[str, int]:
         """Detect communities using Louvain algorithm.
         
+        Runs cold unless a warm start is available: an explicit previous
+        partition, or one remembered for the lineage (see
+        warm_start_communities()).
+        
         Args:
             G: NetworkX graph
+            previous: Partition of an earlier, similar graph to start from (optional)
+            lineage: Key of a sequence of related graphs (e.g. one per time
+                window); the partition found is remembered under it and the
+                next call with the same lineage warm-starts from it (optional)
             
         Returns:
             Dict mapping node -> community_id
         """
+        if previous is not None or (lineage is not None and lineage in self._lineages):
+            return self.warm_start_communities(G, previous=previous, lineage=lineage).partition
+        
         # Convert to undirected for community detection
         G_undirected = G.to_undirected() if G.is_directed() else G
         
@@ -161,7 +432,6 @@ class ActorNetworkAnalyzer:
             import community as community_louvain  # python-louvain package
             communities = community_louvain.best_partition(G_undirected)
             logger.info(f"Detected {len(set(communities.values()))} communities")
-            return communities
         except ImportError:
             logger.warning("python-louvain not installed, using greedy modularity")
             communities_gen = nx.community.greedy_modularity_communities(G_undirected)
@@ -170,45 +440,173 @@ class ActorNetworkAnalyzer:
                 for node in comm:
                     communities[node] = i
             logger.info(f"Detected {len(communities_gen)} communities")
-            return communities
+        
+        if lineage is not None:
+            self._remember_partition(lineage, G, communities)
+        return communities
     
-    def calculate_centrality(self, G: nx.Graph) -> Dict[str, Dict[str, float]]:
-        """Calculate node centrality metrics.
+    def warm_start_communities(
+        self,
+        G: nx.Graph,
+        previous: Optional[Dict[str, int]] = None,
+        lineage: Optional[Hashable] = None
+    ) -> CommunityUpdate:
+        """Refine a previous partition on a changed graph instead of starting cold.
+        
+        Nodes keep their previous community (new nodes start alone) and
+        Louvain local moving (see community_refinement.refine_partition) is
+        seeded with the nodes around the changes: those whose edges were
+        added, removed or reweighted since the lineage's previous graph, plus
+        new nodes. With an explicit previous partition and no known previous
+        graph, every node is evaluated once, still starting from the seed.
         
         Args:
             G: NetworkX graph
+            previous: Partition to start from (defaults to the lineage's)
+            lineage: Key of a sequence of related graphs; supplies the previous
+                partition and graph, and remembers the result
             
         Returns:
-            Dict mapping node -> {'degree', 'betweenness', 'eigenvector'}
+            CommunityUpdate; modularity_delta is relative to the previous
+            partition on the previous graph when the lineage knows it,
+            otherwise to the seed partition on G
         """
-        logger.info("Calculating centrality metrics...")
-        
-        # Degree centrality
-        degree_cent = nx.degree_centrality(G)
-        
-        # Betweenness centrality (sample for large graphs)
-        if G.number_of_nodes() > 1000:
-            betweenness_cent = nx.betweenness_centrality(G, k=min(1000, G.number_of_nodes()))
-        else:
-            betweenness_cent = nx.betweenness_centrality(G)
+        nodes, adjacency = self._community_adjacency(G)
+        state = self._lineages.get(lineage) if lineage is not None else None
+        if previous is None:
+            if state is None:
+                raise ValueError(f"No previous partition for lineage {lineage!r}")
+            previous = state.partition
+        
+        # Seed labels: previous communities, new nodes as singletons
+        seed, _ = pd.factorize(pd.Series([previous.get(node) for node in nodes], dtype=object))
+        new = np.flatnonzero(seed < 0)
+        seed[new] = seed.max(initial=-1) + 1 + np.arange(len(new))
+        
+        active = None
+        if state is not None and previous is state.partition:
+            active = np.union1d(self._changed_nodes(state.nodes, state.adjacency, nodes, adjacency), new)
+        
+        refinement = refine_partition(adjacency, seed, active=active)
+        partition = dict(zip(nodes, refinement.labels.tolist()))
+        previous_modularity = state.modularity if active is not None else refinement.seed_modularity
+        
+        if lineage is not None:
+            self._lineages[lineage] = _LineageState(nodes, adjacency, partition, refinement.modularity)
+        
+        logger.info(f"Refined {len(set(partition.values()))} communities: "
+                   f"{refinement.moves} moves in {refinement.evaluations} evaluations")
+        return CommunityUpdate(
+            partition, refinement.modularity, refinement.modularity - previous_modularity,
+            refinement.evaluations, refinement.moves, None if active is None else len(active)
+        )
+    
+    @staticmethod
+    def _changed_nodes(
+        previous_nodes: List,
+        previous_adjacency: sparse.csr_matrix,
+        nodes: List,
+        adjacency: sparse.csr_matrix
+    ) -> np.ndarray:
+        """Node indices (into nodes) whose edges differ from the previous graph."""
+        position = pd.Index(nodes).get_indexer(pd.Index(previous_nodes))
+        kept = position >= 0
+        previous = previous_adjacency.tocoo()
+        both = kept[previous.row] & kept[previous.col]
+        remapped = sparse.csr_matrix(
+            (previous.data[both], (position[previous.row[both]], position[previous.col[both]])),
+            shape=adjacency.shape
+        )
+        difference = (adjacency - remapped).tocoo()
+        changed = difference.row[difference.data != 0]
+        # Surviving nodes that lost an edge to a node no longer in the graph
+        lost = position[previous.row[kept[previous.row] & ~kept[previous.col]]]
+        return np.union1d(changed, lost)
+    
+    def _compute_centrality(self, G: nx.Graph, metric: str) -> Dict[str, float]:
+        """Compute one centrality metric for every node."""
+        if metric == 'degree':
+            return nx.degree_centrality(G)
+        
+        if metric == 'betweenness':
+            # Sample pivots for large graphs, in parallel batches (see estimate_betweenness)
+            if G.number_of_nodes() > NETWORK_CONFIG['betweenness_pivots']:
+                nodes = list(G)
+                adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format='csr')
+                estimate = estimate_betweenness(
+                    adjacency, pivots=NETWORK_CONFIG['betweenness_pivots'], directed=G.is_directed()
+                )
+                return dict(zip(nodes, estimate.scores.tolist()))
+            return nx.betweenness_centrality(G)
         
         # Eigenvector centrality (with fallback)
         try:
-            eigenvector_cent = nx.eigenvector_centrality(G, max_iter=1000)
+            return nx.eigenvector_centrality(G, max_iter=1000)
         except nx.PowerIterationFailedConvergence:
             logger.warning("Eigenvector centrality failed to converge, using zeros")
-            eigenvector_cent = {node: 0.0 for node in G.nodes()}
+            return {node: 0.0 for node in G.nodes()}
+    
+    def centrality_arrays(
+        self,
+        G: nx.Graph,
+        metrics: Optional[Iterable[str]] = None
+    ) -> Tuple[List[str], Dict[str, np.ndarray]]:
+        """Centrality scores as arrays, memoized per graph.
         
-        # Combine into single dict
-        centrality = {}
-        for node in G.nodes():
-            centrality[node] = {
-                'degree': degree_cent[node],
-                'betweenness': betweenness_cent[node],
-                'eigenvector': eigenvector_cent[node]
-            }
+        Results are cached under graph_fingerprint(G), so a later call on the
+        same graph (or one rebuilt from the same interactions) only computes
+        metrics it has not computed before.
         
-        return centrality
+        Args:
+            G: NetworkX graph
+            metrics: Subset of CENTRALITY_METRICS (defaults to all)
+            
+        Returns:
+            (nodes, {metric: float64 array of scores aligned with nodes})
+        """
+        metrics = list(self.CENTRALITY_METRICS if metrics is None else dict.fromkeys(metrics))
+        unknown = set(metrics) - set(self.CENTRALITY_METRICS)
+        if unknown:
+            raise ValueError(f"Unknown metric(s): {sorted(unknown)} (expected {self.CENTRALITY_METRICS})")
+        
+        fingerprint = graph_fingerprint(G)
+        if fingerprint not in self._centrality_cache:
+            self._centrality_cache[fingerprint] = (list(G.nodes()), {})
+            while len(self._centrality_cache) > self.CENTRALITY_CACHE_SIZE:
+                self._centrality_cache.popitem(last=False)
+        self._centrality_cache.move_to_end(fingerprint)
+        nodes, scores = self._centrality_cache[fingerprint]
+        
+        missing = [metric for metric in metrics if metric not in scores]
+        if missing:
+            logger.info(f"Calculating centrality metrics: {', '.join(missing)}...")
+        for metric in missing:
+            values = self._compute_centrality(G, metric)
+            scores[metric] = np.array([values[node] for node in nodes], dtype=np.float64)
+        
+        return nodes, {metric: scores[metric] for metric in metrics}
+    
+    def calculate_centrality(
+        self,
+        G: nx.Graph,
+        metrics: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """Calculate node centrality metrics.
+        
+        Args:
+            G: NetworkX graph
+            metrics: Metrics to compute, any of 'degree', 'betweenness',
+                'eigenvector' (defaults to all three)
+            
+        Returns:
+            Dict mapping node -> {metric: score} for the requested metrics
+        """
+        nodes, scores = self.centrality_arrays(G, metrics)
+        columns = {metric: values.tolist() for metric, values in scores.items()}
+        return {
+            node: {metric: values[i] for metric, values in columns.items()}
+            for i, node in enumerate(nodes)
+        }
     
     def get_top_actors(
         self,
@@ -218,6 +616,9 @@ class ActorNetworkAnalyzer:
     ) -> List[Tuple[str, float]]:
         """Get top actors by centrality metric.
         
+        Only the requested metric is computed (and memoized, see
+        centrality_arrays()); ties keep node order.
+        
         Args:
             G: NetworkX graph
             metric: 'degree', 'betweenness', or 'eigenvector'
@@ -226,103 +627,140 @@ class ActorNetworkAnalyzer:
         Returns:
             List of (actor, score) tuples
         """
-        centrality = self.calculate_centrality(G)
-        scores = [(node, centrality[node][metric]) for node in centrality]
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:n]
+        nodes, scores = self.centrality_arrays(G, [metric])
+        scores = scores[metric]
+        if n <= 0 or len(scores) == 0:
+            return []
+        
+        if n < len(scores):
+            # Everything scoring at least the n-th best score, then a stable sort
+            threshold = scores[np.argpartition(-scores, n - 1)[n - 1]]
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(len(scores))
+        top = candidates[np.lexsort((candidates, -scores[candidates]))][:n]
+        
+        return [(nodes[i], score) for i, score in zip(top.tolist(), scores[top].tolist())]
+    
+    SUBGRAPH_OUTPUTS = ('networkx', 'sparse')
     
     def get_subgraph(
         self,
-        G: nx.Graph,
+        G: Union[nx.Graph, SparseActorGraph],
         nodes: Set[str],
-        k_hop: int = 1
-    ) -> nx.Graph:
+        k_hop: int = 1,
+        max_nodes: Optional[int] = None,
+        output: str = 'networkx'
+    ) -> Union[nx.Graph, Tuple[List[str], sparse.csr_matrix]]:
         """Extract subgraph around specified nodes.
         
+        The neighborhood is expanded hop by hop over the CSR adjacency (see
+        k_hop_neighborhood()); on a directed graph, along out-edges. Pass the
+        SparseActorGraph from build_sparse_graph() to skip converting a
+        NetworkX graph to CSR.
+        
         Args:
-            G: NetworkX graph
-            nodes: Set of nodes to include
+            G: NetworkX graph or SparseActorGraph
+            nodes: Set of nodes to include (nodes not in G are ignored)
             k_hop: Include neighbors up to k hops away
+            max_nodes: Node budget; the hop that would exceed it keeps only its
+                top-weighted new nodes and expansion stops (optional)
+            output: 'networkx' (G.subgraph view for a NetworkX G, a graph
+                materialized from the subgraph edges for a SparseActorGraph)
+                or 'sparse' (node list and weighted CSR submatrix in that order)
             
         Returns:
             Subgraph containing nodes and their k-hop neighborhood
         """
-        if k_hop == 0:
-            return G.subgraph(nodes)
+        if output not in self.SUBGRAPH_OUTPUTS:
+            raise ValueError(f"Unknown output: {output} (expected one of {self.SUBGRAPH_OUTPUTS})")
         
-        # Get k-hop neighborhood
-        neighborhood = set(nodes)
-        for _ in range(k_hop):
-            new_neighbors = set()
-            for node in neighborhood:
-                if node in G:
-                    new_neighbors.update(G.neighbors(node))
-            neighborhood.update(new_neighbors)
+        if isinstance(G, SparseActorGraph):
+            labels = G.actors
+            adjacency = G.adjacency()
+        else:
+            labels = np.empty(G.number_of_nodes(), dtype=object)
+            labels[:] = list(G)
+            if len(labels):
+                adjacency = nx.to_scipy_sparse_array(G, nodelist=labels.tolist(), weight='weight', format='csr')
+            else:
+                adjacency = sparse.csr_matrix((0, 0))
+        
+        seeds = pd.Index(labels).get_indexer(list(nodes))
+        index, _, truncated = k_hop_neighborhood(adjacency, seeds[seeds >= 0], k_hop, max_nodes)
         
-        subgraph = G.subgraph(neighborhood)
-        logger.info(f"Extracted subgraph: {subgraph.number_of_nodes()} nodes, "
-                   f"{subgraph.number_of_edges()} edges")
+        logger.info(f"Extracted subgraph: {len(index)} nodes"
+                   f"{' (node budget reached)' if truncated else ''}")
         
-        return subgraph
+        if output == 'sparse':
+            return labels[index].tolist(), sparse.csr_matrix(adjacency[index][:, index])
+        if isinstance(G, SparseActorGraph):
+            return G.subgraph(index).to_networkx()
+        return G.subgraph(labels[index].tolist())
     
     def analyze_temporal_evolution(
         self,
         start_date: datetime,
         end_date: datetime,
         window_days: int = 7,
-        domain: Optional[str] = None
+        domain: Optional[str] = None,
+        warm_start: bool = False
     ) -> List[Dict]:
         """Analyze network evolution over time windows.
         
+        All windows are fetched with one fetch_windowed_interactions() query.
+        Node, edge, density and clustering figures come from a RunningAdjacency
+        moved from window to window by edge additions and removals rather
+        than from a graph rebuilt per window.
+        
         Args:
             start_date: Start date
             end_date: End date
             window_days: Size of time window in days
             domain: Socioeconomic domain filter (optional)
+            warm_start: Seed each window's community detection with the
+                previous window's partition (see warm_start_communities())
             
         Returns:
             List of dicts with: {'window_start', 'window_end', 'num_nodes', 'num_edges', 
                                  'density', 'avg_clustering', 'num_communities'}
         """
-        results = []
-        current_start = start_date
+        windows = self._windows(start_date, end_date, window_days)
+        interactions = self.fetch_windowed_interactions(start_date, end_date, window_days, domain=domain)
         
-        while current_start < end_date:
-            current_end = min(current_start + timedelta(days=window_days), end_date)
-            
-            # Fetch interactions for window
-            interactions = self.fetch_interactions(
-                current_start,
-                current_end,
-                domain=domain
-            )
+        # One actor dictionary for all windows, so window graphs share node IDs
+        ids, actors = pd.factorize(pd.concat([interactions['actor1'], interactions['actor2']], ignore_index=True))
+        src, dst = ids[:len(interactions)], ids[len(interactions):]
+        bounds = np.searchsorted(interactions['window_index'].to_numpy(), np.arange(len(windows) + 1))
+        
+        # Each window's graph is the previous one plus/minus its edge delta
+        running = RunningAdjacency(len(actors))
+        lineage = object() if warm_start else None
+        results = []
+        for index, (window_start, window_end) in enumerate(windows):
+            rows = slice(bounds[index], bounds[index + 1])
+            added, removed = running.update(running.edge_keys(src[rows], dst[rows]))
             
-            if len(interactions) == 0:
-                logger.warning(f"No interactions found for {current_start} to {current_end}")
-                current_start = current_end
+            if running.number_of_edges() == 0:
+                logger.warning(f"No interactions found for {window_start} to {window_end}")
                 continue
             
-            # Build graph
-            G = self.build_graph(interactions, directed=False)
-            
-            # Calculate metrics
-            density = nx.density(G)
-            avg_clustering = nx.average_clustering(G) if G.number_of_nodes() > 0 else 0.0
-            communities = self.detect_communities(G)
-            num_communities = len(set(communities.values()))
+            logger.debug(f"Window {window_start}: +{len(added)} / -{len(removed)} edges")
+            communities = self.detect_communities(
+                self.build_graph(interactions.iloc[rows], directed=False), lineage=lineage
+            )
             
             results.append({
-                'window_start': current_start,
-                'window_end': current_end,
-                'num_nodes': G.number_of_nodes(),
-                'num_edges': G.number_of_edges(),
-                'density': density,
-                'avg_clustering': avg_clustering,
-                'num_communities': num_communities
+                'window_start': window_start,
+                'window_end': window_end,
+                'num_nodes': running.number_of_nodes(),
+                'num_edges': running.number_of_edges(),
+                'density': running.density(),
+                'avg_clustering': running.average_clustering(),
+                'num_communities': len(set(communities.values()))
             })
-            
-            current_start = current_end
         
+        self._lineages.pop(lineage, None)
         logger.info(f"Analyzed {len(results)} time windows")
         return results
     
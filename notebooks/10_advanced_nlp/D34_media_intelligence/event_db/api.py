@@ -16,12 +16,15 @@ from typing import Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
 from .actor_networks import ActorNetworkAnalyzer
 from .cameo_mapping import CAMEOMapper
 from .event_ingestion import GDELTEventIngestion
 from .geo_analysis import GeoEventAnalyzer
+from .pool import get_pool
+from .telemetry import IngestionTelemetry, aggregate_stages, prometheus_text
 
 # Configure logging
 logging.basicConfig(
@@ -93,7 +96,9 @@ def read_root():
             "/network/actors",
             "/network/communities",
             "/geo/hotspots",
-            "/geo/country-stats"
+            "/geo/country-stats",
+            "/pool/metrics",
+            "/ingestion/metrics"
         ]
     }
 
@@ -311,6 +316,32 @@ def get_country_stats(params: GeoParams):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Operational endpoints
+@app.get("/pool/metrics")
+def get_pool_metrics():
+    """Shared connection pool sizes and wait metrics."""
+    try:
+        return get_pool().metrics()
+    except Exception as e:
+        logger.error(f"Pool metrics failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/ingestion/metrics", response_class=PlainTextResponse)
+def get_ingestion_metrics(
+    runs: int = Query(24, description="Most recent ingestion runs to aggregate")
+):
+    """Per-stage ingestion throughput over recent runs, in Prometheus text format.
+
+    The totals cover a sliding window of runs, so they are served as gauges.
+    """
+    try:
+        return prometheus_text(aggregate_stages(IngestionTelemetry().recent_runs(runs)), windowed=True)
+    except Exception as e:
+        logger.error(f"Ingestion metrics failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # Run with: uvicorn api:app --reload
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,418 @@
+"""
+Resumable Backfill Work Queue
+
+Persists a backfill plan as one backfill_queue row per date so a crashed or
+interrupted backfill resumes where it stopped, and so several processes (or
+hosts sharing the database) can drain the same backfill without duplicate
+work:
+- Workers claim dates with SELECT ... FOR UPDATE SKIP LOCKED
+- Failed dates are retried with exponential backoff and jitter
+- Dates that keep failing are marked 'failed' after a bounded number of attempts
+- Dates held by a worker that died are reclaimed once their lease expires
+
+Each row records the date's state, attempts, last error and the duration of
+the last attempt.
+
+Usage:
+    python -m event_db.backfill plan --start 2024-01-01 --end 2024-03-31
+    python -m event_db.backfill work          # run in as many processes as wanted
+    python -m event_db.backfill status
+    python -m event_db.backfill retry         # re-queue permanently failed dates
+
+Author: KRL Team
+"""
+
+import argparse
+import logging
+import os
+import random
+import socket
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from .config import INGESTION_CONFIG
+from .event_ingestion import GDELTEventIngestion
+from .schema import TableOnFirstUse
+
+logger = logging.getLogger(__name__)
+
+STATES = ('pending', 'running', 'completed', 'failed')
+
+# Longest single sleep while waiting for a retry to become due
+MAX_IDLE_SLEEP = 30.0
+
+
+def backoff_delay(attempts: int, base: float, cap: float, rng=random) -> float:
+    """Retry delay after a failed attempt: exponential backoff with jitter.
+
+    The delay doubles with each attempt up to cap; the second half of it is
+    randomized so workers that failed together do not retry in lockstep.
+
+    Args:
+        attempts: Attempts made so far (>= 1)
+        base: Delay after the first attempt, in seconds
+        cap: Maximum delay, in seconds
+        rng: Random source (anything with uniform())
+
+    Returns:
+        Delay in seconds, between half and all of min(cap, base * 2**(attempts - 1))
+    """
+    delay = min(cap, base * 2 ** max(attempts - 1, 0))
+    return delay / 2 + rng.uniform(0, delay / 2)
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class BackfillQueue:
+    """Database-backed work queue of dates to ingest."""
+
+    # Oldest due date first; running rows whose lease expired count as due
+    CLAIM_SQL = """
+        UPDATE backfill_queue SET
+            state = 'running',
+            attempts = attempts + 1,
+            claimed_by = %(worker)s,
+            claimed_at = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE work_date = (
+            SELECT work_date FROM backfill_queue
+            WHERE (
+                (state = 'pending' AND next_attempt_at <= CURRENT_TIMESTAMP)
+                OR (state = 'running'
+                    AND claimed_at < CURRENT_TIMESTAMP - %(lease)s * INTERVAL '1 second')
+            )
+            AND work_date BETWEEN %(start)s AND %(end)s
+            ORDER BY work_date
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING work_date, attempts
+    """
+
+    def __init__(
+        self,
+        ingestion: Optional[GDELTEventIngestion] = None,
+        worker_id: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        lease: Optional[float] = None
+    ):
+        """Initialize backfill queue.
+
+        Args:
+            ingestion: Ingestion pipeline used to ingest claimed dates
+                (defaults to a new GDELTEventIngestion); its db_config holds the queue
+            worker_id: Name recorded in claimed_by (defaults to '<host>:<pid>')
+            max_attempts: Attempts before a date is marked failed
+                (defaults to INGESTION_CONFIG['backfill_max_attempts'])
+            backoff_base: First retry delay in seconds
+                (defaults to INGESTION_CONFIG['backfill_backoff_base'])
+            backoff_max: Retry delay cap in seconds
+                (defaults to INGESTION_CONFIG['backfill_backoff_max'])
+            lease: Seconds after which a running date is considered abandoned
+                (defaults to INGESTION_CONFIG['backfill_lease'])
+        """
+        self.ingestion = ingestion or GDELTEventIngestion()
+        self.db_config = self.ingestion.db_config
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.max_attempts = max_attempts or INGESTION_CONFIG['backfill_max_attempts']
+        self.backoff_base = backoff_base if backoff_base is not None else INGESTION_CONFIG['backfill_backoff_base']
+        self.backoff_max = backoff_max if backoff_max is not None else INGESTION_CONFIG['backfill_backoff_max']
+        self.lease = lease if lease is not None else INGESTION_CONFIG['backfill_lease']
+        # Queue table, created from schema_events.sql if missing
+        self._table = TableOnFirstUse('backfill_queue', self.db_config)
+
+    def plan(self, start_date: date, end_date: date) -> int:
+        """Queue every date in a range (inclusive) that is not already queued.
+
+        Dates already in the queue keep their state, so re-planning a partly
+        finished backfill only adds what is missing.
+
+        Args:
+            start_date: First date to backfill
+            end_date: Last date to backfill
+
+        Returns:
+            Number of dates newly queued
+        """
+        start_date, end_date = _as_date(start_date), _as_date(end_date)
+        if end_date < start_date:
+            raise ValueError(f"end_date {end_date} is before start_date {start_date}")
+
+        with self._table.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    INSERT INTO backfill_queue (work_date)
+                    SELECT generate_series(%s::date, %s::date, INTERVAL '1 day')::date
+                    ON CONFLICT (work_date) DO NOTHING
+                """, (start_date, end_date))
+                queued = cursor.rowcount
+            conn.commit()
+
+        logger.info(f"Planned backfill {start_date} to {end_date}: {queued} new dates queued")
+        return queued
+
+    def claim(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[Tuple[date, int]]:
+        """Claim the oldest date that is due.
+
+        The claim is committed immediately; the row lock only guards the
+        pending -> running transition, so concurrent workers never block on
+        each other and never receive the same date.
+
+        Args:
+            start_date: Only claim dates on or after this date (optional)
+            end_date: Only claim dates on or before this date (optional)
+
+        Returns:
+            (date, attempt number) or None when nothing is due
+        """
+        params = {
+            'worker': self.worker_id,
+            'lease': self.lease,
+            'start': _as_date(start_date) or date.min,
+            'end': _as_date(end_date) or date.max,
+        }
+        with self._table.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(self.CLAIM_SQL, params)
+                row = cursor.fetchone()
+            conn.commit()
+        return row
+
+    def complete(self, work_date: date, stats: Dict, duration: float) -> bool:
+        """Mark a claimed date completed.
+
+        Args:
+            work_date: Date claimed by this worker
+            stats: Statistics returned by GDELTEventIngestion.ingest_date
+            duration: Seconds the attempt took
+
+        Returns:
+            False if the claim had been lost (lease expired and reclaimed)
+        """
+        return self._finish(work_date, """
+            UPDATE backfill_queue SET
+                state = 'completed', last_error = NULL, duration_sec = %(duration)s,
+                rows_inserted = %(inserted)s, updated_at = CURRENT_TIMESTAMP
+            WHERE work_date = %(date)s AND state = 'running' AND claimed_by = %(worker)s
+        """, {'duration': duration, 'inserted': stats['inserted']})
+
+    def fail(self, work_date: date, attempts: int, error: str, duration: float) -> str:
+        """Record a failed attempt, scheduling a retry or marking the date failed.
+
+        Args:
+            work_date: Date claimed by this worker
+            attempts: Attempts made so far, including this one
+            error: Description of the failure
+            duration: Seconds the attempt took
+
+        Returns:
+            New state: 'pending' (retry scheduled), 'failed' (permanent) or
+            'lost' (the claim had expired and was reclaimed)
+        """
+        if attempts >= self.max_attempts:
+            state, delay = 'failed', 0.0
+        else:
+            state, delay = 'pending', backoff_delay(attempts, self.backoff_base, self.backoff_max)
+
+        updated = self._finish(work_date, """
+            UPDATE backfill_queue SET
+                state = %(state)s, last_error = %(error)s, duration_sec = %(duration)s,
+                next_attempt_at = CURRENT_TIMESTAMP + %(delay)s * INTERVAL '1 second',
+                updated_at = CURRENT_TIMESTAMP
+            WHERE work_date = %(date)s AND state = 'running' AND claimed_by = %(worker)s
+        """, {'state': state, 'error': error, 'duration': duration, 'delay': delay})
+        if not updated:
+            return 'lost'
+
+        if state == 'failed':
+            logger.error(f"Backfill of {work_date} failed permanently after {attempts} attempts: {error}")
+        else:
+            logger.warning(f"Backfill of {work_date} failed (attempt {attempts}/{self.max_attempts}), "
+                           f"retrying in {delay:.0f}s: {error}")
+        return state
+
+    def _finish(self, work_date: date, query: str, params: Dict) -> bool:
+        """Apply a state update to a date this worker holds."""
+        params = dict(params, date=work_date, worker=self.worker_id)
+        with self._table.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                updated = cursor.rowcount == 1
+            conn.commit()
+        if not updated:
+            logger.warning(f"Lost claim on {work_date}; another worker reclaimed it")
+        return updated
+
+    @staticmethod
+    def _failure_reason(stats: Dict) -> Optional[str]:
+        """Why an ingest_date result counts as a failed attempt (None if it succeeded)."""
+        if stats['downloaded'] == 0:
+            return "No events downloaded"
+        if stats['errors']:
+            return f"{stats['errors']:,} rows failed to load"
+        return None
+
+    def process(self, work_date: date, attempts: int) -> Optional[Dict]:
+        """Ingest a claimed date and record the outcome.
+
+        Args:
+            work_date: Date returned by claim()
+            attempts: Attempt number returned by claim()
+
+        Returns:
+            The ingest_date statistics, or None if ingest_date raised
+        """
+        logger.info(f"Backfilling {work_date} (attempt {attempts}, worker {self.worker_id})")
+        start_time = time.time()
+        stats = None
+        try:
+            stats = self.ingestion.ingest_date(datetime.combine(work_date, datetime.min.time()))
+            error = self._failure_reason(stats)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        duration = time.time() - start_time
+
+        if error is None:
+            self.complete(work_date, stats, duration)
+        else:
+            self.fail(work_date, attempts, error, duration)
+        return stats
+
+    def next_due_in(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[float]:
+        """Seconds until the next pending date becomes due (None if none are pending)."""
+        with self._table.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT EXTRACT(EPOCH FROM MIN(next_attempt_at) - CURRENT_TIMESTAMP)
+                FROM backfill_queue
+                WHERE state = 'pending' AND work_date BETWEEN %s AND %s
+            """, (_as_date(start_date) or date.min, _as_date(end_date) or date.max))
+            seconds = cursor.fetchone()[0]
+        return None if seconds is None else max(float(seconds), 0.0)
+
+    def run_worker(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_dates: Optional[int] = None,
+        wait: bool = True
+    ) -> List[Dict]:
+        """Claim and ingest dates until the queue is drained.
+
+        Safe to run in any number of processes at once. The worker stops when
+        no pending dates remain (dates running in other workers are theirs to
+        finish), or, with wait=False, as soon as nothing is due right now.
+
+        Args:
+            start_date: Only work on dates on or after this date (optional)
+            end_date: Only work on dates on or before this date (optional)
+            max_dates: Stop after this many attempts (None = until drained)
+            wait: Sleep until scheduled retries become due instead of exiting
+
+        Returns:
+            ingest_date statistics for each attempt this worker made (attempts
+            where ingest_date raised have none)
+        """
+        results = []
+        attempts = 0
+        while max_dates is None or attempts < max_dates:
+            claimed = self.claim(start_date, end_date)
+            if claimed is None:
+                due_in = self.next_due_in(start_date, end_date)
+                if due_in is None or not wait:
+                    break
+                time.sleep(min(due_in, MAX_IDLE_SLEEP) + 0.01)
+                continue
+
+            stats = self.process(*claimed)
+            attempts += 1
+            if stats is not None:
+                results.append(stats)
+        return results
+
+    def status(self) -> Dict[str, int]:
+        """Number of queued dates in each state."""
+        with self._table.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT state, COUNT(*) FROM backfill_queue GROUP BY state")
+            counts = dict(cursor.fetchall())
+        return {state: counts.get(state, 0) for state in STATES}
+
+    def failures(self) -> List[Dict]:
+        """Permanently failed dates with their attempts and last error."""
+        with self._table.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT work_date, attempts, last_error FROM backfill_queue
+                WHERE state = 'failed' ORDER BY work_date
+            """)
+            return [{'date': r[0], 'attempts': r[1], 'last_error': r[2]} for r in cursor.fetchall()]
+
+    def retry_failed(self) -> int:
+        """Re-queue permanently failed dates with a fresh attempt budget.
+
+        Returns:
+            Number of dates re-queued
+        """
+        with self._table.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE backfill_queue SET
+                        state = 'pending', attempts = 0,
+                        next_attempt_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                    WHERE state = 'failed'
+                """)
+                requeued = cursor.rowcount
+            conn.commit()
+        logger.info(f"Re-queued {requeued} failed dates")
+        return requeued
+
+
+def main():
+    """Maintenance command: plan, drain and inspect a backfill."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Resumable GDELT backfill work queue")
+    commands = parser.add_subparsers(dest='command', required=True)
+    plan = commands.add_parser('plan', help='Queue a date range')
+    plan.add_argument('--start', required=True, type=date.fromisoformat, help='First date (YYYY-MM-DD)')
+    plan.add_argument('--end', required=True, type=date.fromisoformat, help='Last date (YYYY-MM-DD)')
+    work = commands.add_parser('work', help='Drain the queue in this process')
+    work.add_argument('--max-dates', type=int, help='Stop after this many attempts')
+    work.add_argument('--load-mode', choices=['batch', 'copy'], help='Override INGESTION_CONFIG load_mode')
+    commands.add_parser('status', help='Show queue counts and permanent failures')
+    commands.add_parser('retry', help='Re-queue permanently failed dates')
+    args = parser.parse_args()
+
+    if args.command == 'plan':
+        print(f"Queued {BackfillQueue().plan(args.start, args.end)} new dates")
+    elif args.command == 'work':
+        queue = BackfillQueue(GDELTEventIngestion(load_mode=args.load_mode))
+        results = queue.run_worker(max_dates=args.max_dates)
+        print(f"Worker {queue.worker_id} made {len(results)} attempts, "
+              f"inserted {sum(r['inserted'] for r in results):,} events")
+    elif args.command == 'status':
+        queue = BackfillQueue()
+        for state, n in queue.status().items():
+            print(f"  {state}: {n}")
+        for failure in queue.failures():
+            print(f"  {failure['date']} failed after {failure['attempts']} attempts: {failure['last_error']}")
+    elif args.command == 'retry':
+        print(f"Re-queued {BackfillQueue().retry_failed()} dates")
+
+
+if __name__ == '__main__':
+    main()
@@ -13,18 +13,158 @@ Domains:
 - governance_and_corruption: Government actions, corruption, reforms
 - climate_and_environment: Environmental disasters, climate policy
 
+The resolved lookup table is cached on disk as a versioned, compiled .npz
+artifact (sorted code array, domain/category codes, confidences) so worker
+processes load it instead of re-resolving every CAMEO code; see
+export_mapping() and load_artifact().
+
 Author: KRL Team
 """
 
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
-from .config import get_cameo_codes_path
+from .config import get_cameo_artifact_path, get_cameo_codes_path
+from .keyword_classifier import KeywordAutomaton
 
 logger = logging.getLogger(__name__)
 
+# Compiled artifact layout version; artifacts with another version are rebuilt
+ARTIFACT_VERSION = 1
+
+# Per-code columns of a compiled artifact's 'table' array
+ARTIFACT_TABLE_DTYPE = np.dtype([
+    ('domain', np.int16), ('category', np.int16), ('confidence', np.float64), ('is_mapping', np.bool_)
+])
+
+
+class CompiledMapping(NamedTuple):
+    """Resolved lookup table as sorted arrays (the contents of an artifact)."""
+    fingerprint: str
+    codes: np.ndarray        # sorted event codes
+    domains: List[str]
+    categories: List[str]
+    table: np.ndarray        # ARTIFACT_TABLE_DTYPE row per code
+    
+    def find(self, codes: List[str]) -> np.ndarray:
+        """Row of each code in the table (-1 where absent), by binary search."""
+        codes = np.array(codes, dtype=str)
+        if len(self.codes) == 0 or len(codes) == 0:
+            return np.full(len(codes), -1, dtype=np.intp)
+        rows = np.minimum(np.searchsorted(self.codes, codes), len(self.codes) - 1)
+        return np.where(self.codes[rows] == codes, rows, -1)
+    
+    def row(self, index: int) -> Tuple[str, str, float]:
+        """(domain, category, confidence) of one table row."""
+        domain, category, confidence, _ = self.table[index].tolist()
+        return self.domains[domain], self.categories[category], confidence
+    
+    def lookup(self) -> Dict[str, Tuple[str, str, float]]:
+        """The whole table as a code -> (domain, category, confidence) dict."""
+        return {code: self.row(i) for i, code in enumerate(self.codes.tolist())}
+    
+    def mapping(self) -> Dict[str, Tuple[str, str, float]]:
+        """The source mapping entries the table was compiled from."""
+        rows = np.flatnonzero(self.table['is_mapping'])
+        return {self.codes[i].item(): self.row(i) for i in rows}
+
+
+# Loaded artifacts keyed by (path, mtime, size), shared by every mapper in the process
+_ARTIFACTS: Dict[Tuple[str, int, int], CompiledMapping] = {}
+
+
+def mapping_fingerprint(mapping: Dict) -> str:
+    """Content hash of a code -> (domain, category, confidence) mapping."""
+    payload = json.dumps({code: list(value) for code, value in mapping.items()}, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def compile_mapping(mapping: Dict, lookup: Dict[str, Tuple[str, str, float]]) -> CompiledMapping:
+    """Compile a resolved lookup table into sorted arrays.
+    
+    Args:
+        mapping: Code -> (domain, category, confidence) source mapping
+        lookup: Resolved lookup table (see CAMEOMapper.lookup_table)
+        
+    Returns:
+        CompiledMapping with codes sorted for binary search
+    """
+    codes = sorted(lookup)
+    domains = sorted({lookup[code][0] for code in codes})
+    categories = sorted({lookup[code][1] for code in codes})
+    domain_index = {domain: i for i, domain in enumerate(domains)}
+    category_index = {category: i for i, category in enumerate(categories)}
+    table = np.array([
+        (domain_index[lookup[code][0]], category_index[lookup[code][1]], lookup[code][2], code in mapping)
+        for code in codes
+    ], dtype=ARTIFACT_TABLE_DTYPE)
+    return CompiledMapping(mapping_fingerprint(mapping), np.array(codes, dtype=str), domains, categories, table)
+
+
+def save_artifact(compiled: CompiledMapping, path: Path):
+    """Write a compiled mapping as an uncompressed .npz artifact.
+    
+    The file holds three arrays: 'meta' (JSON with the format version,
+    mapping fingerprint and label lists), 'codes' and 'table'. It is written
+    to a temporary file and renamed into place, so concurrent readers never
+    see a partial artifact.
+    
+    Args:
+        compiled: Table from compile_mapping()
+        path: Destination .npz path
+    """
+    path = Path(path)
+    meta = {
+        'version': ARTIFACT_VERSION, 'fingerprint': compiled.fingerprint,
+        'domains': compiled.domains, 'categories': compiled.categories,
+    }
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, meta=np.array(json.dumps(meta)), codes=compiled.codes, table=compiled.table)
+    os.replace(tmp_path, path)
+
+
+def load_artifact(path: Path) -> Optional[CompiledMapping]:
+    """Load a compiled mapping artifact, once per process per file version.
+    
+    Args:
+        path: Artifact written by save_artifact() / CAMEOMapper.export_mapping()
+        
+    Returns:
+        CompiledMapping, or None if the file is missing, unreadable or of
+        another ARTIFACT_VERSION
+    """
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key in _ARTIFACTS:
+        return _ARTIFACTS[key]
+    
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(data['meta'].item())
+            if meta['version'] != ARTIFACT_VERSION:
+                logger.info(f"Ignoring CAMEO mapping artifact {path} (version {meta['version']})")
+                return None
+            compiled = CompiledMapping(
+                meta['fingerprint'], data['codes'], meta['domains'], meta['categories'], data['table']
+            )
+    except Exception as e:
+        logger.error(f"Failed to load CAMEO mapping artifact {path}: {e}")
+        return None
+    
+    _ARTIFACTS[key] = compiled
+    return compiled
+
 
 class CAMEOMapper:
     """Maps CAMEO event codes to socioeconomic domains."""
@@ -75,6 +215,20 @@ class CAMEOMapper:
         '20': ('climate_and_environment', 'environmental_disaster', 0.80),  # Engage in unconventional mass violence
     }
     
+    # CAMEO root codes; with their 3- and 4-digit refinements these make up the
+    # code space compiled_table() precomputes
+    CAMEO_ROOTS = [f'{root:02d}' for root in range(1, 21)]
+    
+    # CAMEO quad classes; anything else categorizes as 'unknown'
+    QUAD_CLASSES = {
+        1: 'cooperation_verbal',      # Verbal Cooperation
+        2: 'cooperation_material',     # Material Cooperation
+        3: 'conflict_verbal',          # Verbal Conflict
+        4: 'conflict_material'         # Material Conflict
+    }
+    # Position 0 is 'unknown', positions 1-4 the quad classes
+    QUAD_LABELS = ['unknown'] + list(QUAD_CLASSES.values())
+    
     # Domain keywords for fallback categorization
     DOMAIN_KEYWORDS = {
         'labor_and_employment': ['strike', 'labor', 'worker', 'union', 'wage', 'employment', 'job'],
@@ -85,13 +239,22 @@ class CAMEOMapper:
         'climate_and_environment': ['climate', 'environment', 'pollut', 'disaster', 'flood', 'drought']
     }
     
-    def __init__(self, custom_mapping_path: Optional[Path] = None):
+    def __init__(self, custom_mapping_path: Optional[Path] = None, artifact_path: Optional[Path] = None):
         """Initialize CAMEO mapper.
         
         Args:
             custom_mapping_path: Optional path to custom JSON mapping file
+            artifact_path: Compiled mapping artifact this mapper owns; it is
+                loaded when it matches the mapping and rewritten when the
+                mapping changes. Without one, the shared default artifact
+                (get_cameo_artifact_path()) is used for the unmodified
+                CAMEO_MAPPING only.
         """
         self.mapping = self.CAMEO_MAPPING.copy()
+        self.artifact_path = artifact_path
+        self._compiled = None
+        self._extra_codes = {}
+        self._keyword_automaton = None
         
         # Load custom mappings if provided
         if custom_mapping_path and custom_mapping_path.exists():
@@ -107,6 +270,7 @@ class CAMEOMapper:
             with open(path, 'r') as f:
                 custom = json.load(f)
                 self.mapping.update(custom)
+                self._invalidate()
                 logger.info(f"Loaded {len(custom)} custom CAMEO mappings from {path}")
         except Exception as e:
             logger.error(f"Failed to load custom mapping: {e}")
@@ -163,6 +327,131 @@ class CAMEOMapper:
             'confidence': 0.0
         }
     
+    def _resolve(self, event_code: Optional[str]) -> Tuple[str, str, float]:
+        """categorize_event() result as a (domain, category, confidence) tuple."""
+        result = self.categorize_event(event_code)
+        return result['domain'], result['category'], result['confidence']
+    
+    def compiled_table(self) -> CompiledMapping:
+        """Resolved categorization for every CAMEO code, as sorted arrays.
+        
+        Covers the mapped codes plus every 2-, 3- and 4-digit code under the
+        CAMEO roots, with the exact / root x0.8 / base x0.6 fallbacks applied
+        once. Loaded from the compiled artifact when it matches the mapping,
+        otherwise built (and the artifact rewritten). Rebuilt after the
+        mapping changes.
+        
+        Returns:
+            CompiledMapping
+        """
+        if self._compiled is None:
+            path, writable = self._artifact_target()
+            compiled = load_artifact(path) if path else None
+            if compiled is not None and compiled.fingerprint == mapping_fingerprint(self.mapping):
+                self._compiled = compiled
+            else:
+                self._compiled = compile_mapping(self.mapping, self._build_lookup())
+                if writable:
+                    self.export_mapping(path)
+        return self._compiled
+    
+    def lookup_table(self) -> Dict[str, Tuple[str, str, float]]:
+        """compiled_table() as a dict.
+        
+        Returns:
+            Dict mapping event code -> (domain, category, confidence)
+        """
+        return self.compiled_table().lookup()
+    
+    def _build_lookup(self) -> Dict[str, Tuple[str, str, float]]:
+        """Resolve the mapped codes and every code under the CAMEO roots."""
+        suffixes = [''] + [f'{n}' for n in range(10)] + [f'{n:02d}' for n in range(100)]
+        codes = list(self.mapping) + [root + suffix for root in self.CAMEO_ROOTS for suffix in suffixes]
+        return {code: self._resolve(code) for code in codes}
+    
+    def _invalidate(self):
+        """Drop the compiled table after the mapping changes."""
+        self._compiled = None
+        self._extra_codes = {}
+    
+    def _artifact_target(self) -> Tuple[Optional[Path], bool]:
+        """(artifact path to load, whether to write it when stale)."""
+        if self.artifact_path is not None:
+            return Path(self.artifact_path), True
+        if self.mapping == self.CAMEO_MAPPING:
+            return get_cameo_artifact_path(), True
+        return None, False
+    
+    def _category_rows(self, categories: Iterable) -> List[Tuple[str, str, float]]:
+        """Compiled-table rows for categorical categories, plus a trailing row
+        for missing codes (categorical code -1)."""
+        categories = list(categories)
+        compiled = self.compiled_table()
+        strings = [i for i, code in enumerate(categories) if isinstance(code, str)]
+        found = dict(zip(strings, compiled.find([categories[i] for i in strings]).tolist()))
+        
+        rows = []
+        for i, code in enumerate(categories):
+            if found.get(i, -1) >= 0:
+                rows.append(compiled.row(found[i]))
+                continue
+            # Codes outside the CAMEO taxonomy: resolve once, then cache
+            if code not in self._extra_codes:
+                self._extra_codes[code] = self._resolve(code)
+            rows.append(self._extra_codes[code])
+        rows.append(self._resolve(None))
+        return rows
+    
+    def categorize_series(self, codes: pd.Series) -> pd.DataFrame:
+        """Categorize a whole column of CAMEO codes in one pass.
+        
+        Each distinct code is looked up in compiled_table() (codes outside the
+        CAMEO taxonomy are resolved on first sight and cached) and the results
+        are broadcast by categorical code, so values are identical to calling
+        categorize_event() row by row.
+        
+        Args:
+            codes: CAMEO event codes (str or categorical; missing values are
+                uncategorized)
+            
+        Returns:
+            DataFrame aligned with codes with 'domain' and 'category'
+            (categorical) and 'confidence' (float64) columns
+        """
+        codes = codes.astype('category')
+        domains, categories, confidences = zip(*self._category_rows(codes.cat.categories))
+        
+        positions = codes.cat.codes.to_numpy()
+        result = {}
+        for col, values in (('domain', domains), ('category', categories)):
+            values = pd.Categorical(values)
+            result[col] = pd.Categorical.from_codes(values.codes[positions], values.categories)
+        result['confidence'] = np.array(confidences, dtype='float64')[positions]
+        return pd.DataFrame(result, index=codes.index)
+    
+    def keyword_automaton(self) -> KeywordAutomaton:
+        """Aho-Corasick automaton over DOMAIN_KEYWORDS, built on first use."""
+        if self._keyword_automaton is None:
+            self._keyword_automaton = KeywordAutomaton(self.DOMAIN_KEYWORDS)
+        return self._keyword_automaton
+    
+    def classify_texts(self, texts: Iterable[Optional[str]]) -> pd.DataFrame:
+        """Count DOMAIN_KEYWORDS hits per domain in free-text documents.
+        
+        Each document is scanned once by a single multi-pattern automaton
+        (case-insensitive substring matches, see KeywordAutomaton).
+        
+        Args:
+            texts: Headlines or other documents (missing values count as empty)
+            
+        Returns:
+            DataFrame with one int64 hit-count column per domain, one row per
+            document (indexed like texts when it is a Series)
+        """
+        automaton = self.keyword_automaton()
+        index = texts.index if isinstance(texts, pd.Series) else None
+        return pd.DataFrame(automaton.count_many(texts), columns=automaton.labels, index=index)
+    
     def categorize_by_quad_class(self, quad_class: int) -> str:
         """Map quad class to general domain.
         
@@ -172,37 +461,123 @@ class CAMEOMapper:
         Returns:
             General domain string
         """
-        quad_map = {
-            1: 'cooperation_verbal',      # Verbal Cooperation
-            2: 'cooperation_material',     # Material Cooperation
-            3: 'conflict_verbal',          # Verbal Conflict
-            4: 'conflict_material'         # Material Conflict
-        }
-        return quad_map.get(quad_class, 'unknown')
+        return self.QUAD_CLASSES.get(quad_class, 'unknown')
     
-    def get_domain_distribution(self, event_codes: List[str]) -> Dict[str, int]:
-        """Count events by socioeconomic domain.
+    def _quad_positions(self, quad_classes) -> np.ndarray:
+        """QUAD_LABELS position of each quad class (0 for unknown)."""
+        values = quad_classes if isinstance(quad_classes, pd.Series) else pd.Series(quad_classes)
+        if pd.api.types.is_numeric_dtype(values):
+            numbers = values.to_numpy(dtype='float64', na_value=np.nan)
+            return np.where(np.isin(numbers, list(self.QUAD_CLASSES)), numbers, 0).astype(np.intp)
+        
+        # Object or categorical values: apply the scalar rule once per distinct value
+        codes, uniques = pd.factorize(values)
+        labels = [self.categorize_by_quad_class(value) for value in uniques] + ['unknown']
+        lookup = np.array([self.QUAD_LABELS.index(label) for label in labels], dtype=np.intp)
+        return lookup[codes]
+    
+    def categorize_quad_classes(self, quad_classes) -> pd.Series:
+        """Vectorized categorize_by_quad_class.
         
         Args:
-            event_codes: List of CAMEO event codes
+            quad_classes: Array or Series of CAMEO quad classes
             
         Returns:
-            Dict mapping domain -> count
+            Categorical Series of general domains (indexed like quad_classes
+            when it is a Series)
         """
+        index = quad_classes.index if isinstance(quad_classes, pd.Series) else None
+        positions = self._quad_positions(quad_classes)
+        return pd.Series(pd.Categorical.from_codes(positions, self.QUAD_LABELS), index=index)
+    
+    @staticmethod
+    def _ordered_counts(positions: np.ndarray, labels: List[str]) -> Dict[str, int]:
+        """Count label positions, keyed in order of first occurrence."""
+        counts = np.bincount(positions, minlength=len(labels))
         distribution = {}
-        for code in event_codes:
-            result = self.categorize_event(code)
-            domain = result['domain']
-            distribution[domain] = distribution.get(domain, 0) + 1
+        for position in pd.unique(positions):
+            label = labels[position]
+            distribution[label] = distribution.get(label, 0) + int(counts[position])
         return distribution
     
+    @staticmethod
+    def _merge_counts(total: Dict[str, int], counts: Dict[str, int]) -> Dict[str, int]:
+        """Add counts into total in place, appending new labels."""
+        for label, count in counts.items():
+            total[label] = total.get(label, 0) + count
+        return total
+    
+    def get_domain_distribution(self, event_codes) -> Dict[str, int]:
+        """Count events by socioeconomic domain.
+        
+        Counts are taken per distinct code with np.bincount over categorical
+        codes, then summed per domain.
+        
+        Args:
+            event_codes: List, array or Series of CAMEO event codes
+            
+        Returns:
+            Dict mapping domain -> count, in order of first occurrence
+        """
+        codes = event_codes if isinstance(event_codes, pd.Series) else pd.Series(event_codes, dtype=object)
+        codes = codes.astype('category')
+        rows = self._category_rows(codes.cat.categories)
+        # Missing codes (-1) wrap to the trailing row
+        positions = codes.cat.codes.to_numpy().astype(np.intp) % len(rows)
+        return self._ordered_counts(positions, [domain for domain, _, _ in rows])
+    
+    def get_quad_class_distribution(self, quad_classes) -> Dict[str, int]:
+        """Count events by quad class general domain (see categorize_by_quad_class).
+        
+        Args:
+            quad_classes: List, array or Series of CAMEO quad classes
+            
+        Returns:
+            Dict mapping general domain -> count, in order of first occurrence
+        """
+        return self._ordered_counts(self._quad_positions(quad_classes), self.QUAD_LABELS)
+    
+    def summarize_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        event_code_col: str = 'EventCode',
+        quad_class_col: str = 'QuadClass'
+    ) -> Dict[str, Dict[str, int]]:
+        """Domain and quad class distributions over a stream of event frames.
+        
+        Only one chunk is held at a time, so e.g.
+        GDELTEventIngestion.iter_export_chunks() output can be summarized
+        without materializing the full frame.
+        
+        Args:
+            chunks: DataFrames with event code and quad class columns
+            event_code_col: Name of the CAMEO event code column
+            quad_class_col: Name of the quad class column
+            
+        Returns:
+            {'domains': domain -> count, 'quad_classes': general domain -> count}
+        """
+        summary = {'domains': {}, 'quad_classes': {}}
+        for chunk in chunks:
+            self._merge_counts(summary['domains'], self.get_domain_distribution(chunk[event_code_col]))
+            self._merge_counts(summary['quad_classes'], self.get_quad_class_distribution(chunk[quad_class_col]))
+        return summary
+    
     def export_mapping(self, output_path: Path):
-        """Export current mapping to JSON file.
+        """Export current mapping to JSON file, or compile it to an artifact.
+        
+        A path ending in .npz gets the compiled artifact (see save_artifact).
         
         Args:
-            output_path: Path to save JSON mapping
+            output_path: Path to save JSON mapping or .npz artifact
         """
+        output_path = Path(output_path)
         try:
+            if output_path.suffix == '.npz':
+                compiled = self.compiled_table()
+                save_artifact(compiled, output_path)
+                logger.info(f"Compiled CAMEO mapping ({len(compiled.codes):,} codes) to {output_path}")
+                return
             with open(output_path, 'w') as f:
                 json.dump(self.mapping, f, indent=2)
                 logger.info(f"Exported CAMEO mapping to {output_path}")
@@ -222,7 +597,13 @@ class CAMEOMapper:
             raise ValueError("Confidence must be between 0.0 and 1.0")
         
         self.mapping[event_code] = (domain, category, confidence)
+        self._invalidate()
         logger.info(f"Added mapping: {event_code} -> {domain}/{category} ({confidence})")
+        
+        # Rebuild this mapper's own artifact now (the shared default one only
+        # ever holds CAMEO_MAPPING)
+        if self.artifact_path is not None:
+            self.compiled_table()
 
 
 def main():
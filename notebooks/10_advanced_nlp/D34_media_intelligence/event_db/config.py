@@ -13,6 +13,11 @@ DATABASE_CONFIG = {
     "database": os.getenv("POSTGRES_DB", "gdelt_events"),
     "user": os.getenv("POSTGRES_USER", "postgres"),
     "password": os.getenv("POSTGRES_PASSWORD", ""),
+    # Shared connection pool (event_db.pool); stripped before psycopg2.connect()
+    "pool_min_size": int(os.getenv("POSTGRES_POOL_MIN", "1")),
+    "pool_max_size": int(os.getenv("POSTGRES_POOL_MAX", "10")),
+    "pool_timeout": float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),  # seconds to wait for a free connection
+    "pool_check_idle": 30,  # seconds idle before a borrowed connection is pinged
 }
 
 # GDELT Configuration
@@ -21,19 +26,46 @@ GDELT_CONFIG = {
     "timeout": 60,  # seconds
     "max_retries": 3,
     "retry_delay": 5,  # seconds
+    "poll_interval": 900,  # seconds between 15-minute feed polls
+    "cache_mode": "revalidate",  # raw download cache: "off", "revalidate" or "offline"
 }
 
 # Ingestion Configuration
 INGESTION_CONFIG = {
     "batch_size": 1000,  # rows per insert
-    "parallel_workers": 4,  # for parallel processing
+    "parallel_workers": 4,  # download/parse pool size for multi-day ingestion
+    "queue_depth": 2,  # dates buffered between pipeline stages (caps memory)
     "chunk_size": 10000,  # rows per chunk
+    "streaming": False,  # parse/preprocess/load each file chunk_size rows at a time
+    "load_mode": "batch",  # "batch" (execute_batch) or "copy" (COPY into staging + merge)
+    "parser": "pandas",  # "pandas" (C engine) or "arrow" (multithreaded pyarrow.csv, optional)
+    "arrow_block_size": 1 << 24,  # bytes per block parsed in parallel by the arrow parser
+    "rollups": True,  # refresh event_statistics / actor_relationships for ingested dates
+    "prefilter_known": False,  # drop event IDs already in gdelt_events before loading
+    "prefilter_max_ids": 2_000_000,  # cap on known IDs fetched per batch (8 bytes each)
+    "telemetry": True,  # record per-stage timings of each ingest_date run in the run ledger
+    "runs_log": "ingestion_runs.jsonl",  # JSON-lines run ledger (relative to LOGS_DIR)
+    "backfill_max_attempts": 5,  # attempts per date before it is marked permanently failed
+    "backfill_backoff_base": 60,  # seconds before the first retry (doubles per attempt)
+    "backfill_backoff_max": 3600,  # cap on the retry delay, in seconds
+    "backfill_lease": 3600,  # seconds before a running date held by a dead worker is reclaimed
+}
+
+# Network Analysis Configuration
+NETWORK_CONFIG = {
+    "betweenness_pivots": 1000,  # sampled BFS sources on graphs with more nodes than this
+    "betweenness_batch_size": 32,  # pivots per worker task (each holds a few nodes x batch float arrays)
+    "betweenness_workers": 4,  # process pool size for pivot batches (1 runs in-process)
+    "betweenness_seed": 0,  # pivot sampling seed, so estimates are reproducible
+    "betweenness_tolerance": None,  # stop sampling once every node's standard error is below this
+    "betweenness_min_pivots": 100,  # pivots sampled before the tolerance rule may stop
 }
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
+RAW_CACHE_DIR = DATA_DIR / "raw_cache"
 
 # Ensure directories exist
 DATA_DIR.mkdir(exist_ok=True)
@@ -84,3 +116,8 @@ def get_database_url() -> str:
 def get_cameo_codes_path() -> Path:
     """Get path to CAMEO codes JSON file."""
     return DATA_DIR / "cameo_codes.json"
+
+
+def get_cameo_artifact_path() -> Path:
+    """Get path to the compiled CAMEO mapping artifact (see CAMEOMapper.export_mapping)."""
+    return DATA_DIR / "cameo_mapping.npz"
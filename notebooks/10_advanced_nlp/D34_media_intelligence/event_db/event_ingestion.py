@@ -3,24 +3,38 @@ GDELT Event Database Ingestion Pipeline
 
 Downloads GDELT 2.0 Event Database CSV files and loads them into PostgreSQL.
 Handles:
-- CSV download with retry logic
-- Parsing 58-column GDELT schema
+- CSV download with retry logic and an on-disk raw download cache
+- Parsing 58-column GDELT schema (whole-file or bounded-memory streaming)
+  into a compact typed frame (categoricals, narrow integers, float32)
+- Optional multithreaded pyarrow.csv parser backend for whole-file parsing
 - Batch insertion with error handling
+- COPY-based bulk loading through an unlogged staging table
+- Pipelined multi-day ingestion (parallel download/parse, single loader)
 - CAMEO code categorization
-- Duplicate detection
+- Duplicate detection (optionally pre-filtering known event IDs before loading)
+- Monthly partition creation for the partitioned schema variant
+- Two-table loads for the hot/cold split schema variant (gdelt_events_detail)
+- Interned integer actor IDs (actors dictionary table)
+- Incremental event_statistics / actor_relationships rollups
+- Per-stage telemetry (wall/CPU time, rows, bytes) and an ingestion run ledger
 
 Author: KRL Team
 """
 
+import io
 import logging
+import queue
+import threading
 import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
+import numpy as np
 import pandas as pd
-import psycopg2
 import requests
 from psycopg2 import sql
 from psycopg2.extras import execute_batch
@@ -29,7 +43,22 @@ from .config import (
     DATABASE_CONFIG, GDELT_CONFIG, INGESTION_CONFIG,
     get_database_url, DATA_DIR
 )
+from .actor_dictionary import ID_COLUMNS, ActorDictionary
 from .cameo_mapping import CAMEOMapper
+from .known_events import KnownEventFilter
+from .partitions import PartitionManager
+from .pool import get_pool
+from .raw_cache import RawDownloadCache
+from .rollups import EventRollups
+from .telemetry import IngestionRun, IngestionTelemetry
+
+# Optional dependency: multithreaded CSV parsing (parser='arrow')
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +86,179 @@ class GDELTEventIngestion:
         'DATEADDED', 'SOURCEURL'
     ]
     
-    def __init__(self, db_config: Optional[Dict] = None):
+    # GDELT 2.0 15-minute exports add an ADM2 code after each ADM1 code (61 columns)
+    GDELT_V2_COLUMNS = [
+        col
+        for name in GDELT_COLUMNS
+        for col in ([name, name.replace('ADM1', 'ADM2')] if name.endswith('_ADM1Code') else [name])
+    ]
+    
+    # Preprocessed DataFrame column -> gdelt_events column, in load order
+    COLUMN_MAP = [
+        ('GLOBALEVENTID', 'event_id'), ('event_date', 'event_date'),
+        ('MonthYear', 'month_year'), ('Year', 'year'), ('FractionDate', 'fraction_date'),
+        ('Actor1Code', 'actor1_code'), ('Actor1Name', 'actor1_name'),
+        ('Actor1CountryCode', 'actor1_country_code'), ('Actor1KnownGroupCode', 'actor1_known_group_code'),
+        ('Actor1EthnicCode', 'actor1_ethnic_code'), ('Actor1Religion1Code', 'actor1_religion1_code'),
+        ('Actor1Religion2Code', 'actor1_religion2_code'), ('Actor1Type1Code', 'actor1_type1_code'),
+        ('Actor1Type2Code', 'actor1_type2_code'), ('Actor1Type3Code', 'actor1_type3_code'),
+        ('Actor2Code', 'actor2_code'), ('Actor2Name', 'actor2_name'),
+        ('Actor2CountryCode', 'actor2_country_code'), ('Actor2KnownGroupCode', 'actor2_known_group_code'),
+        ('Actor2EthnicCode', 'actor2_ethnic_code'), ('Actor2Religion1Code', 'actor2_religion1_code'),
+        ('Actor2Religion2Code', 'actor2_religion2_code'), ('Actor2Type1Code', 'actor2_type1_code'),
+        ('Actor2Type2Code', 'actor2_type2_code'), ('Actor2Type3Code', 'actor2_type3_code'),
+        ('IsRootEvent', 'is_root_event'), ('EventCode', 'event_code'),
+        ('EventBaseCode', 'event_base_code'), ('EventRootCode', 'event_root_code'),
+        ('QuadClass', 'quad_class'), ('GoldsteinScale', 'goldstein_scale'),
+        ('NumMentions', 'num_mentions'), ('NumSources', 'num_sources'),
+        ('NumArticles', 'num_articles'), ('AvgTone', 'avg_tone'),
+        ('Actor1Geo_Type', 'actor1_geo_type'), ('Actor1Geo_FullName', 'actor1_geo_fullname'),
+        ('Actor1Geo_CountryCode', 'actor1_geo_country_code'), ('Actor1Geo_ADM1Code', 'actor1_geo_adm1_code'),
+        ('Actor1Geo_Lat', 'actor1_geo_lat'), ('Actor1Geo_Long', 'actor1_geo_long'),
+        ('Actor1Geo_FeatureID', 'actor1_geo_feature_id'),
+        ('Actor2Geo_Type', 'actor2_geo_type'), ('Actor2Geo_FullName', 'actor2_geo_fullname'),
+        ('Actor2Geo_CountryCode', 'actor2_geo_country_code'), ('Actor2Geo_ADM1Code', 'actor2_geo_adm1_code'),
+        ('Actor2Geo_Lat', 'actor2_geo_lat'), ('Actor2Geo_Long', 'actor2_geo_long'),
+        ('Actor2Geo_FeatureID', 'actor2_geo_feature_id'),
+        ('ActionGeo_Type', 'action_geo_type'), ('ActionGeo_FullName', 'action_geo_fullname'),
+        ('ActionGeo_CountryCode', 'action_geo_country_code'), ('ActionGeo_ADM1Code', 'action_geo_adm1_code'),
+        ('ActionGeo_Lat', 'action_geo_lat'), ('ActionGeo_Long', 'action_geo_long'),
+        ('ActionGeo_FeatureID', 'action_geo_feature_id'),
+        ('DATEADDED', 'date_added'), ('SOURCEURL', 'source_url'),
+        ('socioeconomic_domain', 'socioeconomic_domain'),
+        ('socioeconomic_category', 'socioeconomic_category'),
+        ('category_confidence', 'category_confidence'),
+        ('ingestion_timestamp', 'ingestion_timestamp'), ('ingestion_batch_id', 'ingestion_batch_id'),
+    ]
+    
+    # gdelt_events columns declared INTEGER/BIGINT (GDELT floats like 1.0 must be cast)
+    INTEGER_COLUMNS = [
+        'event_id', 'month_year', 'year', 'quad_class',
+        'num_mentions', 'num_sources', 'num_articles',
+        'actor1_geo_type', 'actor2_geo_type', 'action_geo_type',
+    ]
+    
+    # Unlogged table used by copy_batch() to stage COPY loads before merging
+    STAGING_TABLE = 'gdelt_events_staging'
+    
+    # Hot/cold split schema (schema_events_split.sql): rarely read wide columns
+    # live in DETAIL_TABLE keyed by event_id; FULL_VIEW joins both back together
+    DETAIL_TABLE = 'gdelt_events_detail'
+    DETAIL_COLUMNS = [
+        'actor1_name', 'actor2_name', 'actor1_geo_fullname', 'actor2_geo_fullname', 'source_url',
+    ]
+    FULL_VIEW = 'gdelt_events_full'
+    
+    # Compact in-memory schema applied at parse time. Repetitive codes and names
+    # are categoricals, small enumerations are Int8, counts Int32 and scores and
+    # coordinates float32 (~1e-5 degree resolution, finer than GDELT geocoding).
+    # Integers are nullable so a blank field does not fail the whole file.
+    PARSE_DTYPES = {
+        'GLOBALEVENTID': 'Int64',
+        'SQLDATE': 'Int32',
+        'MonthYear': 'Int32',
+        'Year': 'Int16',
+        'FractionDate': 'float64',
+        **{
+            f'{actor}{field}': 'category'
+            for actor in ('Actor1', 'Actor2')
+            for field in (
+                'Code', 'Name', 'CountryCode', 'KnownGroupCode', 'EthnicCode',
+                'Religion1Code', 'Religion2Code', 'Type1Code', 'Type2Code', 'Type3Code'
+            )
+        },
+        'IsRootEvent': 'Int8',
+        # CAMEO codes keep their leading zeros ('071' != '71'); categoricals parse as str
+        'EventCode': 'category',
+        'EventBaseCode': 'category',
+        'EventRootCode': 'category',
+        'QuadClass': 'Int8',
+        'GoldsteinScale': 'float32',
+        'NumMentions': 'Int32',
+        'NumSources': 'Int32',
+        'NumArticles': 'Int32',
+        'AvgTone': 'float32',
+        **{
+            f'{geo}_{field}': dtype
+            for geo in ('Actor1Geo', 'Actor2Geo', 'ActionGeo')
+            for field, dtype in (
+                ('Type', 'Int8'), ('FullName', 'category'), ('CountryCode', 'category'),
+                ('ADM1Code', 'category'), ('ADM2Code', 'category'),
+                ('Lat', 'float32'), ('Long', 'float32'), ('FeatureID', 'category'),
+            )
+        },
+        'DATEADDED': 'Int64',
+        'SOURCEURL': 'object',
+    }
+    
+    # PARSE_DTYPES entry -> Arrow type for the pyarrow.csv backend; categoricals
+    # are read dictionary-encoded so to_pandas() builds them without re-hashing
+    ARROW_TYPES = {
+        'Int64': 'int64', 'Int32': 'int32', 'Int16': 'int16', 'Int8': 'int8',
+        'float64': 'float64', 'float32': 'float32', 'category': 'dictionary', 'object': 'string',
+    }
+    
+    LOAD_MODES = ('batch', 'copy')
+    PARSERS = ('pandas', 'arrow')
+    CACHE_MODES = ('off', 'revalidate', 'offline')
+    
+    def __init__(
+        self,
+        db_config: Optional[Dict] = None,
+        load_mode: Optional[str] = None,
+        cache_mode: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        streaming: Optional[bool] = None,
+        rollups: Optional[bool] = None,
+        parser: Optional[str] = None,
+        prefilter_known: Optional[bool] = None,
+        telemetry: Optional[bool] = None
+    ):
         """Initialize ingestion pipeline.
         
         Args:
             db_config: PostgreSQL connection config (defaults to DATABASE_CONFIG)
+            load_mode: 'batch' (execute_batch inserts) or 'copy' (COPY into a
+                staging table, then merge); defaults to INGESTION_CONFIG['load_mode']
+            cache_mode: Raw download cache behaviour; 'off', 'revalidate'
+                (conditional GET against cached copies) or 'offline' (cache
+                only, never touch the network); defaults to GDELT_CONFIG['cache_mode']
+            cache_dir: Raw download cache directory (defaults to RAW_CACHE_DIR)
+            streaming: Parse, preprocess and load each date in chunk_size row
+                chunks so peak memory does not grow with file size; defaults
+                to INGESTION_CONFIG['streaming']
+            rollups: Refresh the rollup tables for the event dates each load
+                touches; defaults to INGESTION_CONFIG['rollups']
+            parser: Whole-file CSV parser; 'pandas' (single-threaded C engine) or
+                'arrow' (multithreaded pyarrow.csv, falls back to pandas when
+                pyarrow is not installed); defaults to INGESTION_CONFIG['parser']
+            prefilter_known: Drop events already in gdelt_events before sending
+                a batch (see KnownEventFilter); defaults to INGESTION_CONFIG['prefilter_known']
+            telemetry: Record each ingest_date run's per-stage timings in the
+                run ledger (see IngestionTelemetry); defaults to INGESTION_CONFIG['telemetry']
         """
         self.db_config = db_config or DATABASE_CONFIG
+        self.load_mode = load_mode or INGESTION_CONFIG['load_mode']
+        if self.load_mode not in self.LOAD_MODES:
+            raise ValueError(f"Unknown load_mode: {self.load_mode} (expected one of {self.LOAD_MODES})")
+        self.cache_mode = cache_mode or GDELT_CONFIG['cache_mode']
+        if self.cache_mode not in self.CACHE_MODES:
+            raise ValueError(f"Unknown cache_mode: {self.cache_mode} (expected one of {self.CACHE_MODES})")
+        self.raw_cache = RawDownloadCache(cache_dir) if self.cache_mode != 'off' else None
+        self.parser = parser or INGESTION_CONFIG['parser']
+        if self.parser not in self.PARSERS:
+            raise ValueError(f"Unknown parser: {self.parser} (expected one of {self.PARSERS})")
+        if self.parser == 'arrow' and not ARROW_AVAILABLE:
+            logger.warning("pyarrow not installed, using the pandas CSV parser")
+            self.parser = 'pandas'
+        self.streaming = INGESTION_CONFIG['streaming'] if streaming is None else streaming
+        rollups = INGESTION_CONFIG['rollups'] if rollups is None else rollups
+        self.rollups = EventRollups(self.db_config) if rollups else None
+        self.partitions = PartitionManager(self.db_config)
+        prefilter_known = INGESTION_CONFIG['prefilter_known'] if prefilter_known is None else prefilter_known
+        self.known_filter = KnownEventFilter() if prefilter_known else None
+        self.telemetry = IngestionTelemetry(self.db_config, record_runs=telemetry)
+        self.actor_dictionary = ActorDictionary(self.db_config)
         self.cameo_mapper = CAMEOMapper()
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'GDELT-Event-Ingestion/1.0'})
@@ -81,253 +276,798 @@ class GDELTEventIngestion:
         filename = f"{date_str}.export.CSV.zip"
         return urljoin(GDELT_CONFIG['base_url'], filename)
     
-    def download_csv(self, url: str, retries: int = 3) -> Optional[pd.DataFrame]:
-        """Download and parse GDELT CSV with retry logic.
+    def fetch_export(self, url: str, retries: int = 3) -> Optional[bytes]:
+        """Download a raw GDELT export zip with retry logic.
         
         Args:
             url: Full URL to CSV.zip file
             retries: Number of retry attempts
             
         Returns:
-            DataFrame with GDELT events, or None if download fails
+            Zip file bytes, or None if download fails
         """
+        with self.telemetry.stage('download') as counts:
+            raw = self._fetch_export(url, retries)
+            counts['bytes'] = len(raw) if raw else 0
+        return raw
+    
+    def _fetch_export(self, url: str, retries: int) -> Optional[bytes]:
+        """fetch_export() without the stage timer."""
+        if self.cache_mode == 'offline':
+            raw = self.raw_cache.read_offline(url)
+            if raw is None:
+                logger.error(f"Offline mode: {url} is not in the raw download cache")
+            return raw
+        
         for attempt in range(retries):
             try:
                 logger.info(f"Downloading {url} (attempt {attempt+1}/{retries})")
                 
-                response = self.session.get(
-                    url,
-                    timeout=GDELT_CONFIG['timeout'],
-                    stream=True
-                )
-                response.raise_for_status()
-                
-                # GDELT CSVs are tab-delimited, no headers
-                df = pd.read_csv(
-                    response.raw,
-                    sep='\t',
-                    header=None,
-                    names=self.GDELT_COLUMNS,
-                    compression='zip',
-                    low_memory=False,
-                    dtype={
-                        'GLOBALEVENTID': 'Int64',
-                        'SQLDATE': 'Int64',
-                        'MonthYear': 'Int64',
-                        'Year': 'Int64',
-                        'QuadClass': 'Int64',
-                        'NumMentions': 'Int64',
-                        'NumSources': 'Int64',
-                        'NumArticles': 'Int64'
-                    }
-                )
+                if self.raw_cache is not None:
+                    return self.raw_cache.fetch(url, self.session, GDELT_CONFIG['timeout'])
                 
-                logger.info(f"Downloaded {len(df):,} events from {url}")
-                return df
+                response = self.session.get(url, timeout=GDELT_CONFIG['timeout'])
+                response.raise_for_status()
+                return response.content
                 
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Download failed (attempt {attempt+1}): {e}")
                 if attempt < retries - 1:
                     time.sleep(GDELT_CONFIG['retry_delay'])
-                    
-            except Exception as e:
-                logger.error(f"Parsing failed: {e}")
-                return None
                 
         logger.error(f"Failed to download {url} after {retries} attempts")
         return None
     
-    def preprocess_events(self, df: pd.DataFrame) -> pd.DataFrame:
+    def parse_export(self, raw: bytes, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """Parse a raw GDELT export zip into a DataFrame.
+        
+        Uses the parser backend chosen at construction (see parse_export_table
+        for the Arrow one); both produce the same PARSE_DTYPES frame.
+        
+        Args:
+            raw: Zip file bytes from fetch_export()
+            columns: Column layout of the file (defaults to GDELT_COLUMNS; pass
+                GDELT_V2_COLUMNS for 15-minute exports)
+            
+        Returns:
+            DataFrame with GDELT_COLUMNS, or None if parsing fails
+        """
+        with self.telemetry.stage('parse', nbytes=len(raw)) as counts:
+            df = self._parse_export(raw, columns)
+            counts['rows'] = 0 if df is None else len(df)
+        return df
+    
+    def _parse_export(self, raw: bytes, columns: Optional[List[str]]) -> Optional[pd.DataFrame]:
+        """parse_export() without the stage timer."""
+        if self.parser == 'arrow':
+            table = self.parse_export_table(raw, columns)
+            return None if table is None else self.arrow_to_pandas(table)
+        
+        columns = columns or self.GDELT_COLUMNS
+        try:
+            # GDELT CSVs are tab-delimited, no headers
+            df = pd.read_csv(
+                io.BytesIO(raw),
+                sep='\t',
+                header=None,
+                names=columns,
+                compression='zip',
+                low_memory=False,
+                dtype=self.PARSE_DTYPES
+            )
+        except Exception as e:
+            logger.error(f"Parsing failed: {e}")
+            return None
+        
+        if columns != self.GDELT_COLUMNS:
+            df = df[self.GDELT_COLUMNS]
+        return df
+    
+    @classmethod
+    def arrow_schema(cls) -> 'pa.Schema':
+        """Explicit Arrow schema for GDELT_COLUMNS, mirroring PARSE_DTYPES."""
+        types = {
+            name: pa.dictionary(pa.int32(), pa.string()) if name == 'dictionary' else getattr(pa, name)()
+            for name in set(cls.ARROW_TYPES.values())
+        }
+        return pa.schema([
+            (col, types[cls.ARROW_TYPES[cls.PARSE_DTYPES[col]]]) for col in cls.GDELT_COLUMNS
+        ])
+    
+    def parse_export_table(
+        self,
+        raw: bytes,
+        columns: Optional[List[str]] = None
+    ) -> Optional['pa.Table']:
+        """Parse a raw GDELT export zip into an Arrow table with pyarrow.csv.
+        
+        The CSV is split into blocks that are parsed and converted on all
+        cores, against the explicit arrow_schema() so no type inference runs.
+        Callers that can work on Arrow data directly avoid the pandas
+        conversion; parse_export() converts with arrow_to_pandas().
+        
+        Args:
+            raw: Zip file bytes from fetch_export()
+            columns: Column layout of the file (defaults to GDELT_COLUMNS; pass
+                GDELT_V2_COLUMNS for 15-minute exports, whose ADM2 columns are skipped)
+            
+        Returns:
+            Table with GDELT_COLUMNS, or None if parsing fails
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("parse_export_table requires pyarrow")
+        
+        columns = columns or self.GDELT_COLUMNS
+        try:
+            with zipfile.ZipFile(io.BytesIO(raw)) as archive:
+                data = archive.read(archive.namelist()[0])
+            return pa_csv.read_csv(
+                pa.BufferReader(data),
+                read_options=pa_csv.ReadOptions(
+                    column_names=columns,
+                    use_threads=True,
+                    block_size=INGESTION_CONFIG['arrow_block_size']
+                ),
+                parse_options=pa_csv.ParseOptions(delimiter='\t'),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=self.arrow_schema(),
+                    include_columns=self.GDELT_COLUMNS,
+                    strings_can_be_null=True
+                )
+            )
+        except Exception as e:
+            logger.error(f"Parsing failed: {e}")
+            return None
+    
+    @classmethod
+    def arrow_to_pandas(cls, table: 'pa.Table') -> pd.DataFrame:
+        """Convert a parse_export_table() result to the PARSE_DTYPES frame.
+        
+        Non-null numeric columns are handed over without copying; nullable
+        integers map to the pandas masked dtypes and dictionaries to categoricals.
+        """
+        nullable = {
+            pa.int64(): pd.Int64Dtype(), pa.int32(): pd.Int32Dtype(),
+            pa.int16(): pd.Int16Dtype(), pa.int8(): pd.Int8Dtype(),
+        }
+        df = table.to_pandas(types_mapper=nullable.get, split_blocks=True)
+        # pandas would otherwise keep Arrow-backed str columns
+        for col in df.columns:
+            if cls.PARSE_DTYPES[col] == 'object':
+                df[col] = df[col].astype(object)
+        return df
+    
+    def iter_export_chunks(
+        self,
+        source: Union[bytes, str, Path],
+        chunk_size: Optional[int] = None,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a raw GDELT export zip as parsed DataFrame chunks.
+        
+        The archive member is decompressed incrementally, so only one chunk of
+        rows is materialized at a time.
+        
+        Args:
+            source: Zip file bytes from fetch_export(), or a path to a zip file
+            chunk_size: Rows per chunk (defaults to INGESTION_CONFIG['chunk_size'])
+            columns: Column layout of the file (defaults to GDELT_COLUMNS)
+            
+        Yields:
+            DataFrames with GDELT_COLUMNS
+        """
+        chunk_size = chunk_size or INGESTION_CONFIG['chunk_size']
+        columns = columns or self.GDELT_COLUMNS
+        archive = zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source)
+        
+        with archive, archive.open(archive.namelist()[0]) as member:
+            reader = pd.read_csv(
+                member,
+                sep='\t',
+                header=None,
+                names=columns,
+                dtype=self.PARSE_DTYPES,
+                chunksize=chunk_size
+            )
+            for chunk in reader:
+                yield chunk[self.GDELT_COLUMNS] if columns != self.GDELT_COLUMNS else chunk
+    
+    def download_csv(self, url: str, retries: int = 3) -> Optional[pd.DataFrame]:
+        """Download and parse GDELT CSV with retry logic.
+        
+        Args:
+            url: Full URL to CSV.zip file
+            retries: Number of retry attempts
+            
+        Returns:
+            DataFrame with GDELT events, or None if download fails
+        """
+        raw = self.fetch_export(url, retries=retries)
+        if raw is None:
+            return None
+        
+        df = self.parse_export(raw)
+        if df is not None:
+            logger.info(f"Downloaded {len(df):,} events from {url}")
+        return df
+    
+    def preprocess_events(self, df: pd.DataFrame, batch_id: Optional[str] = None) -> pd.DataFrame:
         """Clean and categorize events before insertion.
         
         Args:
             df: Raw GDELT DataFrame
+            batch_id: ingestion_batch_id to stamp (defaults to the current time,
+                pass one explicitly to share it across chunks of a file)
             
         Returns:
             Processed DataFrame with socioeconomic categorization
         """
-        # Convert SQLDATE to proper date format
-        df['event_date'] = pd.to_datetime(df['SQLDATE'].astype(str), format='%Y%m%d')
-        
-        # Apply CAMEO categorization
-        categorization = df['EventCode'].apply(
-            lambda code: self.cameo_mapper.categorize_event(code)
-        )
-        df['socioeconomic_domain'] = categorization.apply(lambda x: x['domain'])
-        df['socioeconomic_category'] = categorization.apply(lambda x: x['category'])
-        df['category_confidence'] = categorization.apply(lambda x: x['confidence'])
-        
-        # Add ingestion metadata
-        df['ingestion_timestamp'] = datetime.now()
-        df['ingestion_batch_id'] = datetime.now().strftime('%Y%m%d_%H%M%S')
+        with self.telemetry.stage('preprocess', rows=len(df)):
+            # Convert SQLDATE to proper date format
+            df['event_date'] = pd.to_datetime(df['SQLDATE'].astype(str), format='%Y%m%d')
+            
+            # DATEADDED is YYYYMMDD in daily exports, YYYYMMDDHHMMSS in 15-minute exports
+            date_added = df['DATEADDED'].astype(str).str.slice(0, 14).str.ljust(14, '0')
+            df['DATEADDED'] = pd.to_datetime(date_added, format='%Y%m%d%H%M%S', errors='coerce')
+            
+            # Apply CAMEO categorization to the whole column at once
+            categorized = self.cameo_mapper.categorize_series(df['EventCode'])
+            df['socioeconomic_domain'] = categorized['domain']
+            df['socioeconomic_category'] = categorized['category']
+            df['category_confidence'] = categorized['confidence']
+            
+            # Add ingestion metadata
+            df['ingestion_timestamp'] = datetime.now()
+            batch_id = batch_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+            df['ingestion_batch_id'] = pd.Categorical.from_codes(np.zeros(len(df), dtype='int8'), [batch_id])
         
         return df
     
-    def insert_batch(self, conn, cursor, batch: pd.DataFrame) -> Tuple[int, int]:
+    def _load_frame(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """Project a preprocessed batch onto gdelt_events columns with DB-ready types.
+        
+        Args:
+            batch: Preprocessed DataFrame chunk
+            
+        Returns:
+            DataFrame whose columns are the gdelt_events columns in COLUMN_MAP
+            order, followed by actor1_id and actor2_id when the batch has them
+            (see ActorDictionary.assign_ids)
+        """
+        frame = pd.DataFrame(
+            {db_col: batch[src_col] for src_col, db_col in self.COLUMN_MAP},
+            index=batch.index
+        )
+        for col in ID_COLUMNS.values():
+            if col in batch:
+                frame[col] = batch[col]
+        for col in self.INTEGER_COLUMNS:
+            frame[col] = pd.to_numeric(frame[col], errors='coerce').astype('Int64')
+        frame['is_root_event'] = frame['is_root_event'].astype('boolean')
+        return frame
+    
+    @classmethod
+    def has_detail_table(cls, cursor) -> bool:
+        """Whether the schema (as resolved by search_path) is the hot/cold split variant."""
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (cls.DETAIL_TABLE,))
+        return cursor.fetchone()[0]
+    
+    def _load_targets(self, split: bool, interned: bool = False) -> List[Tuple[str, List[str]]]:
+        """(table, columns) pairs a batch is loaded into, gdelt_events first."""
+        columns = [db_col for _, db_col in self.COLUMN_MAP]
+        if interned:
+            columns += list(ID_COLUMNS.values())
+        if not split:
+            return [('gdelt_events', columns)]
+        hot = [col for col in columns if col not in self.DETAIL_COLUMNS]
+        return [('gdelt_events', hot), (self.DETAIL_TABLE, ['event_id'] + self.DETAIL_COLUMNS)]
+    
+    def insert_batch(self, conn, cursor, batch: pd.DataFrame, split: Optional[bool] = None) -> Tuple[int, int]:
         """Insert batch of events into PostgreSQL.
         
         Args:
             conn: psycopg2 connection
             cursor: psycopg2 cursor
             batch: DataFrame chunk to insert
+            split: Load gdelt_events and gdelt_events_detail in one transaction;
+                detected from the schema when None
             
         Returns:
             (inserted_count, error_count)
         """
-        insert_query = sql.SQL("""
-            INSERT INTO gdelt_events (
-                event_id, event_date, month_year, year, fraction_date,
-                actor1_code, actor1_name, actor1_country_code, actor1_known_group_code,
-                actor1_ethnic_code, actor1_religion1_code, actor1_religion2_code,
-                actor1_type1_code, actor1_type2_code, actor1_type3_code,
-                actor2_code, actor2_name, actor2_country_code, actor2_known_group_code,
-                actor2_ethnic_code, actor2_religion1_code, actor2_religion2_code,
-                actor2_type1_code, actor2_type2_code, actor2_type3_code,
-                is_root_event, event_code, event_base_code, event_root_code, quad_class,
-                goldstein_scale, num_mentions, num_sources, num_articles, avg_tone,
-                actor1_geo_type, actor1_geo_fullname, actor1_geo_country_code,
-                actor1_geo_adm1_code, actor1_geo_lat, actor1_geo_long, actor1_geo_feature_id,
-                actor2_geo_type, actor2_geo_fullname, actor2_geo_country_code,
-                actor2_geo_adm1_code, actor2_geo_lat, actor2_geo_long, actor2_geo_feature_id,
-                action_geo_type, action_geo_fullname, action_geo_country_code,
-                action_geo_adm1_code, action_geo_lat, action_geo_long, action_geo_feature_id,
-                date_added, source_url,
-                socioeconomic_domain, socioeconomic_category, category_confidence,
-                ingestion_timestamp, ingestion_batch_id
-            ) VALUES (
-                %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s,
-                %s, %s,
-                %s, %s, %s,
-                %s, %s
-            )
-            ON CONFLICT (event_id) DO NOTHING
-        """)
+        if split is None:
+            split = self.has_detail_table(cursor)
         
-        # Prepare data tuples
-        data = []
-        for _, row in batch.iterrows():
-            data.append((
-                row['GLOBALEVENTID'], row['event_date'], row['MonthYear'], row['Year'], row['FractionDate'],
-                row['Actor1Code'], row['Actor1Name'], row['Actor1CountryCode'], row['Actor1KnownGroupCode'],
-                row['Actor1EthnicCode'], row['Actor1Religion1Code'], row['Actor1Religion2Code'],
-                row['Actor1Type1Code'], row['Actor1Type2Code'], row['Actor1Type3Code'],
-                row['Actor2Code'], row['Actor2Name'], row['Actor2CountryCode'], row['Actor2KnownGroupCode'],
-                row['Actor2EthnicCode'], row['Actor2Religion1Code'], row['Actor2Religion2Code'],
-                row['Actor2Type1Code'], row['Actor2Type2Code'], row['Actor2Type3Code'],
-                row['IsRootEvent'], row['EventCode'], row['EventBaseCode'], row['EventRootCode'], row['QuadClass'],
-                row['GoldsteinScale'], row['NumMentions'], row['NumSources'], row['NumArticles'], row['AvgTone'],
-                row['Actor1Geo_Type'], row['Actor1Geo_FullName'], row['Actor1Geo_CountryCode'],
-                row['Actor1Geo_ADM1Code'], row['Actor1Geo_Lat'], row['Actor1Geo_Long'], row['Actor1Geo_FeatureID'],
-                row['Actor2Geo_Type'], row['Actor2Geo_FullName'], row['Actor2Geo_CountryCode'],
-                row['Actor2Geo_ADM1Code'], row['Actor2Geo_Lat'], row['Actor2Geo_Long'], row['Actor2Geo_FeatureID'],
-                row['ActionGeo_Type'], row['ActionGeo_FullName'], row['ActionGeo_CountryCode'],
-                row['ActionGeo_ADM1Code'], row['ActionGeo_Lat'], row['ActionGeo_Long'], row['ActionGeo_FeatureID'],
-                row['DATEADDED'], row['SOURCEURL'],
-                row['socioeconomic_domain'], row['socioeconomic_category'], row['category_confidence'],
-                row['ingestion_timestamp'], row['ingestion_batch_id']
-            ))
+        # Prepare data tuples (object dtype yields native Python values, nulls become None)
+        frame = self._load_frame(batch).astype(object)
+        frame = frame.where(frame.notna(), None)
+        interned = 'actor1_id' in frame
         
         try:
-            execute_batch(cursor, insert_query, data, page_size=INGESTION_CONFIG['batch_size'])
+            for table, columns in self._load_targets(split, interned):
+                insert_query = sql.SQL("""
+                    INSERT INTO {table} ({columns})
+                    VALUES ({placeholders})
+                    ON CONFLICT DO NOTHING
+                """).format(
+                    table=sql.Identifier(table),
+                    columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
+                    placeholders=sql.SQL(', ').join(sql.Placeholder() * len(columns))
+                )
+                data = list(frame[columns].itertuples(index=False, name=None))
+                execute_batch(cursor, insert_query, data, page_size=INGESTION_CONFIG['batch_size'])
             conn.commit()
-            return len(data), 0
+            return len(frame), 0
         except Exception as e:
             conn.rollback()
             logger.error(f"Batch insertion failed: {e}")
-            return 0, len(data)
+            return 0, len(frame)
     
-    def ingest_date(self, date: datetime) -> Dict:
-        """Download and ingest all events for a single date.
+    def copy_batch(self, conn, cursor, batch: pd.DataFrame, split: Optional[bool] = None) -> Tuple[int, int, int]:
+        """Bulk-load a batch with COPY through the unlogged staging table.
+        
+        The batch is streamed as CSV into ``gdelt_events_staging`` and merged
+        into ``gdelt_events`` with a single ``INSERT ... SELECT ... ON CONFLICT
+        DO NOTHING``. With the hot/cold split schema the same statement also
+        writes the detail columns of the newly inserted events to
+        ``gdelt_events_detail``. Truncating the staging table locks it until
+        commit, so concurrent loaders against the same database are serialized.
         
         Args:
-            date: Date to ingest
+            conn: psycopg2 connection
+            cursor: psycopg2 cursor
+            batch: DataFrame chunk to insert
+            split: Merge into gdelt_events and gdelt_events_detail; detected
+                from the schema when None
             
         Returns:
-            Statistics: {'date', 'downloaded', 'inserted', 'errors', 'duration_sec'}
+            (inserted_count, skipped_count, error_count) where skipped rows are
+            events already present in gdelt_events
         """
-        start_time = time.time()
-        url = self.get_event_file_url(date)
+        if split is None:
+            split = self.has_detail_table(cursor)
         
-        # Download CSV
-        df = self.download_csv(url)
-        if df is None:
-            return {
-                'date': date.strftime('%Y-%m-%d'),
-                'downloaded': 0,
-                'inserted': 0,
-                'errors': 0,
-                'duration_sec': time.time() - start_time
-            }
+        def identifiers(columns):
+            return sql.SQL(', ').join(map(sql.Identifier, columns))
         
-        # Preprocess
-        df = self.preprocess_events(df)
+        frame = self._load_frame(batch)
+        interned = 'actor1_id' in frame
+        columns = identifiers(frame.columns)
+        copy_query = sql.SQL(
+            "COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        ).format(staging=sql.Identifier(self.STAGING_TABLE), columns=columns)
+        if split:
+            (_, hot), (detail_table, detail) = self._load_targets(split, interned)
+            merge_query = sql.SQL("""
+                WITH inserted AS (
+                    INSERT INTO gdelt_events ({hot})
+                    SELECT {hot} FROM {staging}
+                    ON CONFLICT DO NOTHING
+                    RETURNING event_id
+                ), detail AS (
+                    INSERT INTO {detail_table} ({detail})
+                    SELECT {detail} FROM {staging} JOIN inserted USING (event_id)
+                    ON CONFLICT DO NOTHING
+                )
+                SELECT COUNT(*) FROM inserted
+            """).format(
+                staging=sql.Identifier(self.STAGING_TABLE), hot=identifiers(hot),
+                detail_table=sql.Identifier(detail_table), detail=identifiers(detail)
+            )
+        else:
+            merge_query = sql.SQL("""
+                INSERT INTO gdelt_events ({columns})
+                SELECT {columns} FROM {staging}
+                ON CONFLICT DO NOTHING
+            """).format(staging=sql.Identifier(self.STAGING_TABLE), columns=columns)
+        truncate_query = sql.SQL("TRUNCATE {}").format(sql.Identifier(self.STAGING_TABLE))
+        
+        buffer = io.StringIO()
+        frame.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
         
-        # Insert in batches
-        conn = psycopg2.connect(**self.db_config)
-        cursor = conn.cursor()
+        try:
+            cursor.execute(sql.SQL(
+                "CREATE UNLOGGED TABLE IF NOT EXISTS {} (LIKE {} INCLUDING DEFAULTS)"
+            ).format(sql.Identifier(self.STAGING_TABLE),
+                     sql.Identifier(self.FULL_VIEW if split else 'gdelt_events')))
+            cursor.execute(truncate_query)
+            cursor.copy_expert(copy_query.as_string(cursor), buffer)
+            cursor.execute(merge_query)
+            inserted = cursor.fetchone()[0] if split else cursor.rowcount
+            cursor.execute(truncate_query)
+            conn.commit()
+            return inserted, len(batch) - inserted, 0
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"COPY load failed: {e}")
+            return 0, 0, len(batch)
+    
+    def load_batches(self, batches: Iterable[pd.DataFrame]) -> Tuple[int, int, int]:
+        """Load preprocessed batches into PostgreSQL over one pooled connection.
+        
+        Batches are loaded as they are produced, so a generator keeps only one
+        batch in memory. With prefilter_known, events already stored are
+        dropped first and counted as skipped. When gdelt_events is partitioned,
+        missing monthly partitions are created before each batch is loaded;
+        with the hot/cold split schema each batch also fills gdelt_events_detail.
+        When the schema has the actors dictionary and ID columns, each batch's actors are
+        interned and loaded as actor1_id / actor2_id.
         
+        Args:
+            batches: Preprocessed DataFrame chunks
+            
+        Returns:
+            (inserted_count, skipped_count, error_count)
+        """
         total_inserted = 0
+        total_skipped = 0
         total_errors = 0
         
+        with get_pool(self.db_config).connection() as conn, conn.cursor() as cursor:
+            partitioned = self.partitions.is_partitioned(cursor)
+            split = self.has_detail_table(cursor)
+            interned = self.actor_dictionary.has_actor_ids(cursor)
+            for batch_number, batch in enumerate(batches, start=1):
+                with self.telemetry.stage('load', rows=len(batch)):
+                    known = 0
+                    if self.known_filter is not None:
+                        batch, known = self.known_filter.drop_known(cursor, batch)
+                    
+                    if batch.empty:
+                        inserted = skipped = errors = 0
+                    else:
+                        if interned:
+                            batch = self.actor_dictionary.assign_ids(conn, cursor, batch)
+                        if partitioned:
+                            self.partitions.ensure_partitions(conn, cursor, batch['event_date'].dt.date.unique())
+                        if self.load_mode == 'copy':
+                            inserted, skipped, errors = self.copy_batch(conn, cursor, batch, split=split)
+                        else:
+                            inserted, errors = self.insert_batch(conn, cursor, batch, split=split)
+                            skipped = 0
+                skipped += known
+                total_inserted += inserted
+                total_skipped += skipped
+                total_errors += errors
+                
+                logger.info(f"Batch {batch_number}: {inserted:,} inserted, "
+                            f"{skipped:,} skipped, {errors:,} errors")
+        
+        return total_inserted, total_skipped, total_errors
+    
+    def _split(self, df: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """Split a frame into chunk_size row batches."""
         for i in range(0, len(df), INGESTION_CONFIG['chunk_size']):
-            batch = df.iloc[i:i + INGESTION_CONFIG['chunk_size']]
-            inserted, errors = self.insert_batch(conn, cursor, batch)
-            total_inserted += inserted
-            total_errors += errors
+            yield df.iloc[i:i + INGESTION_CONFIG['chunk_size']]
+    
+    def load_events(self, df: pd.DataFrame) -> Tuple[int, int, int]:
+        """Load a preprocessed frame into PostgreSQL in chunk_size batches.
+        
+        Args:
+            df: Preprocessed DataFrame from preprocess_events()
             
-            logger.info(f"Batch {i//INGESTION_CONFIG['chunk_size']+1}: {inserted:,} inserted, {errors:,} errors")
+        Returns:
+            (inserted_count, skipped_count, error_count)
+        """
+        return self.load_batches(self._split(df))
+    
+    def _stream_preprocessed(self, raw: bytes) -> Iterator[pd.DataFrame]:
+        """Parse and preprocess a raw export chunk by chunk.
         
-        cursor.close()
-        conn.close()
+        A file that cannot be parsed at all ends the stream before the first
+        chunk, as parse_export() returns None for it. A parse error after
+        chunks were yielded is raised: those chunks are already loaded, so the
+        date must fail rather than be reported complete.
+        """
+        batch_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        chunks = self.iter_export_chunks(raw)
+        parsed = 0
+        while True:
+            with self.telemetry.stage('parse') as counts:
+                try:
+                    chunk = next(chunks, None)
+                except Exception as e:
+                    if not parsed:
+                        logger.error(f"Parsing failed: {e}")
+                        return
+                    logger.error(f"Parsing failed after {parsed:,} rows: {e}")
+                    raise
+                counts['rows'] = 0 if chunk is None else len(chunk)
+            if chunk is None:
+                return
+            parsed += len(chunk)
+            yield self.preprocess_events(chunk, batch_id=batch_id)
+    
+    def update_rollups(self, event_dates: Iterable) -> Optional[Dict[str, int]]:
+        """Refresh rollups for the given event dates (no-op when rollups are off).
+        
+        Rollup failures are logged rather than raised: the events are already
+        loaded and rebuild_rollups() can repair the summaries later.
+        
+        Args:
+            event_dates: Event dates touched by a load
+            
+        Returns:
+            Row counts from EventRollups.refresh_dates(), or None if skipped or failed
+        """
+        if self.rollups is None:
+            return None
+        try:
+            with self.telemetry.stage('rollups'):
+                return self.rollups.refresh_dates(event_dates)
+        except Exception as e:
+            logger.error(f"Rollup refresh failed: {e}")
+            return None
+    
+    def _date_stats(
+        self,
+        date: datetime,
+        batches: Optional[Iterable[pd.DataFrame]],
+        start_time: float
+    ) -> Dict:
+        """Load a date's preprocessed batches (if any) and build its statistics dict."""
+        downloaded = 0
+        event_dates = set()
+        
+        def counted():
+            nonlocal downloaded
+            for batch in batches:
+                downloaded += len(batch)
+                event_dates.update(batch['event_date'].dt.date.unique())
+                yield batch
+        
+        if batches is None:
+            inserted = skipped = errors = 0
+        else:
+            inserted, skipped, errors = self.load_batches(counted())
+        
+        # Daily files also carry late-reported events for earlier dates
+        if inserted:
+            self.update_rollups(event_dates)
         
         duration = time.time() - start_time
-        logger.info(f"Ingestion complete: {total_inserted:,} events in {duration:.1f}s")
+        if batches is not None:
+            logger.info(f"Ingestion complete: {inserted:,} events in {duration:.1f}s")
         
         return {
             'date': date.strftime('%Y-%m-%d'),
-            'downloaded': len(df),
-            'inserted': total_inserted,
-            'errors': total_errors,
+            'downloaded': downloaded,
+            'inserted': inserted,
+            'skipped': skipped,
+            'errors': errors,
             'duration_sec': duration
         }
     
-    def ingest_date_range(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+    def ingest_date(self, date: datetime) -> Dict:
+        """Download and ingest all events for a single date.
+        
+        In streaming mode each chunk_size chunk is parsed, categorized and
+        loaded before the next is read; otherwise the whole file is parsed
+        and preprocessed first. Once loaded, the rollup tables are refreshed
+        for every event date the file touched.
+        
+        Args:
+            date: Date to ingest
+            
+        Returns:
+            Statistics: {'date', 'downloaded', 'inserted', 'skipped', 'errors', 'duration_sec'}
+            
+        Raises:
+            Exception: When a streamed file fails to parse partway through (the
+                chunks before it stay loaded; re-ingesting the date is idempotent)
+        """
+        run = self.telemetry.start_run(date)
+        with self.telemetry.activate(run):
+            stats = self._ingest_date(date)
+        self.telemetry.finish_run(run, stats)
+        return stats
+    
+    def _ingest_date(self, date: datetime) -> Dict:
+        """ingest_date() without the run ledger."""
+        start_time = time.time()
+        url = self.get_event_file_url(date)
+        
+        if self.streaming:
+            raw = self.fetch_export(url)
+            batches = None if raw is None else self._stream_preprocessed(raw)
+            return self._date_stats(date, batches, start_time)
+        
+        # Download CSV
+        df = self.download_csv(url)
+        
+        # Preprocess
+        if df is not None:
+            df = self.preprocess_events(df)
+        
+        return self._date_stats(date, None if df is None else self._split(df), start_time)
+    
+    def _ingest_pipelined(self, dates: List[datetime], workers: int) -> List[Dict]:
+        """Ingest dates through overlapping download, parse and load stages.
+        
+        Download threads feed raw zips into a bounded queue; parse threads hand
+        them to a process pool for parsing and CAMEO categorization and feed a
+        second bounded queue; the calling thread is the single loader. At most
+        ``2 * queue_depth + 2 * workers + 1`` dates are held in memory at once.
+        If the loader raises, the download and parse threads are stopped and
+        joined before the error propagates.
+        
+        Args:
+            dates: Dates to ingest
+            workers: Size of the download and parse pools
+            
+        Returns:
+            List of statistics dicts, one per date, in completion order
+        """
+        queue_depth = INGESTION_CONFIG['queue_depth']
+        pending = queue.Queue()
+        raw_queue = queue.Queue(maxsize=queue_depth)
+        parsed_queue = queue.Queue(maxsize=queue_depth)
+        stop = threading.Event()
+        start_times = {}
+        runs = {}
+        
+        for date in dates:
+            pending.put(date)
+        
+        def download_stage():
+            while not stop.is_set():
+                try:
+                    date = pending.get_nowait()
+                except queue.Empty:
+                    return
+                start_times[date] = time.time()
+                runs[date] = self.telemetry.start_run(date)
+                try:
+                    with self.telemetry.activate(runs[date]):
+                        raw = self.fetch_export(self.get_event_file_url(date))
+                except Exception as e:
+                    logger.error(f"Download stage failed for {date:%Y-%m-%d}: {e}")
+                    raw = None
+                raw_queue.put((date, raw))
+        
+        def parse_stage(pool):
+            while True:
+                item = raw_queue.get()
+                if item is None:
+                    return
+                date, raw = item
+                df = None
+                if raw is not None and not stop.is_set():
+                    try:
+                        df, stages = pool.submit(_parse_and_preprocess, raw, self.parser).result()
+                        runs[date].merge(stages)
+                    except Exception as e:
+                        logger.error(f"Parse stage failed for {date:%Y-%m-%d}: {e}")
+                parsed_queue.put((date, df))
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Start worker processes before any pipeline threads exist
+            pool.submit(int).result()
+            
+            threads = [threading.Thread(target=download_stage, daemon=True) for _ in range(workers)]
+            threads += [threading.Thread(target=parse_stage, args=(pool,), daemon=True) for _ in range(workers)]
+            for thread in threads:
+                thread.start()
+            
+            try:
+                for _ in dates:
+                    date, df = parsed_queue.get()
+                    logger.info(f"Loading {date.strftime('%Y-%m-%d')}")
+                    batches = None if df is None else self._split(df)
+                    with self.telemetry.activate(runs[date]):
+                        stats = self._date_stats(date, batches, start_times[date])
+                    self.telemetry.finish_run(runs[date], stats)
+                    results.append(stats)
+                    del df
+            finally:
+                self._stop_pipeline(stop, threads, raw_queue, parsed_queue, workers)
+        
+        return results
+    
+    @staticmethod
+    def _stop_pipeline(
+        stop: threading.Event,
+        threads: List[threading.Thread],
+        raw_queue: queue.Queue,
+        parsed_queue: queue.Queue,
+        workers: int
+    ):
+        """Stop and join the _ingest_pipelined() stage threads.
+        
+        Download threads stop taking dates once stop is set; both queues are
+        drained so no stage stays blocked on a full queue, and each parse
+        thread gets a None sentinel. After a normal run the queues are already
+        empty and this only sends the sentinels.
+        """
+        stop.set()
+        sentinels = 0
+        while any(thread.is_alive() for thread in threads):
+            for q in (raw_queue, parsed_queue):
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        sentinels -= 1
+            while sentinels < workers:
+                try:
+                    raw_queue.put_nowait(None)
+                except queue.Full:
+                    break
+                sentinels += 1
+            for thread in threads:
+                thread.join(timeout=0.05)
+    
+    def ingest_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        workers: Optional[int] = None,
+        resumable: bool = False
+    ) -> List[Dict]:
         """Ingest events for a date range.
         
+        With more than one worker, downloads, parsing and database loads for
+        different dates overlap (see _ingest_pipelined); each date is still
+        loaded as a unit by a single loader.
+        
+        With resumable set, the range is planned into the backfill_queue table
+        and drained one date at a time (see event_db.backfill.BackfillQueue):
+        a rerun after a crash skips completed dates, failed dates are retried
+        with backoff, and other processes running the same range share the work.
+        
         Args:
             start_date: First date to ingest (inclusive)
             end_date: Last date to ingest (inclusive)
+            workers: Download/parse pool size (defaults to INGESTION_CONFIG['parallel_workers'];
+                1 ingests dates strictly one at a time; ignored when resumable)
+            resumable: Drive the range through the persistent backfill queue
             
         Returns:
-            List of statistics dicts for each date
+            List of statistics dicts for each date, ordered by date (when
+            resumable, one per attempt this process made)
         """
-        results = []
-        current_date = start_date
+        workers = workers or INGESTION_CONFIG['parallel_workers']
+        range_start = time.time()
         
+        dates = []
+        current_date = start_date
         while current_date <= end_date:
-            logger.info(f"Ingesting {current_date.strftime('%Y-%m-%d')}")
-            result = self.ingest_date(current_date)
-            results.append(result)
+            dates.append(current_date)
             current_date += timedelta(days=1)
         
+        if resumable:
+            from .backfill import BackfillQueue  # backfill imports this module
+            
+            backfill = BackfillQueue(self)
+            backfill.plan(start_date, end_date)
+            results = backfill.run_worker(start_date, end_date)
+            results.sort(key=lambda r: r['date'])
+        elif workers > 1 and len(dates) > 1:
+            results = self._ingest_pipelined(dates, min(workers, len(dates)))
+            results.sort(key=lambda r: r['date'])
+        else:
+            results = []
+            for date in dates:
+                logger.info(f"Ingesting {date.strftime('%Y-%m-%d')}")
+                results.append(self.ingest_date(date))
+        
         # Summary
         total_downloaded = sum(r['downloaded'] for r in results)
         total_inserted = sum(r['inserted'] for r in results)
+        total_skipped = sum(r['skipped'] for r in results)
         total_errors = sum(r['errors'] for r in results)
-        total_duration = sum(r['duration_sec'] for r in results)
+        total_duration = time.time() - range_start
         
         logger.info(f"""
         Ingestion Summary:
         - Dates: {len(results)}
         - Downloaded: {total_downloaded:,}
         - Inserted: {total_inserted:,}
+        - Skipped (already loaded): {total_skipped:,}
         - Errors: {total_errors:,}
         - Duration: {total_duration:.1f}s
         """)
@@ -335,6 +1075,31 @@ class GDELTEventIngestion:
         return results
 
 
+# Per-process ingestion instance used by the parse stage of _ingest_pipelined
+_worker_ingestion: Optional[GDELTEventIngestion] = None
+
+
+def _parse_and_preprocess(
+    raw: bytes,
+    parser: str = 'pandas'
+) -> Tuple[Optional[pd.DataFrame], Dict[str, Dict]]:
+    """Process-pool task: parse a raw export zip and categorize its events.
+    
+    Returns the preprocessed frame (None if parsing failed) and the stage
+    timings measured in this process, for the caller's run ledger.
+    """
+    global _worker_ingestion
+    if _worker_ingestion is None or _worker_ingestion.parser != parser:
+        _worker_ingestion = GDELTEventIngestion(parser=parser, telemetry=False)
+    
+    run = IngestionRun()
+    with _worker_ingestion.telemetry.activate(run):
+        df = _worker_ingestion.parse_export(raw)
+        if df is not None:
+            df = _worker_ingestion.preprocess_events(df)
+    return df, run.stages
+
+
 def main():
     """Example usage: ingest last 7 days of events."""
     logging.basicConfig(
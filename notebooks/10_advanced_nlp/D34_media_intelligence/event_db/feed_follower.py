@@ -0,0 +1,256 @@
+"""
+Incremental GDELT 2.0 Feed Follower
+
+Keeps gdelt_events current from the 15-minute GDELT 2.0 export files instead
+of re-ingesting whole days:
+- Reads the lastupdate.txt manifest (and masterfilelist.txt to fill gaps)
+- Ingests only export files not yet completed
+- Verifies each file's size and MD5 checksum against the manifest
+- Records URL, size, checksum and row counts in the ingestion_files
+  checkpoint table so restarts resume exactly where they stopped
+
+Author: KRL Team
+"""
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+from urllib.parse import urljoin
+
+from .config import GDELT_CONFIG
+from .event_ingestion import GDELTEventIngestion
+from .schema import TableOnFirstUse
+
+logger = logging.getLogger(__name__)
+
+# GDELT 2.0 publishes one export file every 15 minutes
+UPDATE_INTERVAL = timedelta(minutes=15)
+
+
+@dataclass
+class ManifestEntry:
+    """One line of a GDELT 2.0 manifest: '<size> <md5> <url>'."""
+    size: int
+    md5: str
+    url: str
+
+    @property
+    def timestamp(self) -> datetime:
+        """File timestamp encoded in the filename (YYYYMMDDHHMMSS.export.CSV.zip)."""
+        return datetime.strptime(self.url.rsplit('/', 1)[-1][:14], '%Y%m%d%H%M%S')
+
+    @property
+    def is_export(self) -> bool:
+        return self.url.endswith('.export.CSV.zip')
+
+
+class GDELTFeedFollower:
+    """Follows the GDELT 2.0 15-minute export feed with a checkpoint table."""
+
+    def __init__(
+        self,
+        ingestion: Optional[GDELTEventIngestion] = None,
+        base_url: Optional[str] = None
+    ):
+        """Initialize feed follower.
+
+        Args:
+            ingestion: Ingestion pipeline used to parse and load files
+                (defaults to a new GDELTEventIngestion)
+            base_url: Directory holding the manifests (defaults to GDELT_CONFIG['base_url'])
+        """
+        self.ingestion = ingestion or GDELTEventIngestion()
+        self.db_config = self.ingestion.db_config
+        self.base_url = base_url or GDELT_CONFIG['base_url']
+        # Checkpoint table, created from schema_events.sql if missing
+        self._checkpoints = TableOnFirstUse('ingestion_files', self.db_config)
+
+    def fetch_manifest(self, name: str) -> List[ManifestEntry]:
+        """Download a manifest and return its export-file entries.
+
+        Args:
+            name: 'lastupdate.txt' or 'masterfilelist.txt'
+
+        Returns:
+            Export entries ordered by file timestamp
+        """
+        url = urljoin(self.base_url, name)
+        response = self.ingestion.session.get(url, timeout=GDELT_CONFIG['timeout'])
+        response.raise_for_status()
+
+        entries = []
+        for line in response.text.splitlines():
+            parts = line.split()
+            if len(parts) != 3:
+                continue  # masterfilelist.txt has occasional malformed lines
+            try:
+                entry = ManifestEntry(size=int(parts[0]), md5=parts[1], url=parts[2])
+                if entry.is_export:
+                    entry.timestamp  # validate filename
+                    entries.append(entry)
+            except ValueError:
+                logger.warning(f"Skipping malformed manifest line: {line!r}")
+
+        return sorted(entries, key=lambda e: e.timestamp)
+
+    def _checkpoint_state(self) -> Dict:
+        """Read completed URLs, the completed high-water mark and failed files."""
+        with self._checkpoints.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT file_url FROM ingestion_files WHERE status = 'completed'")
+            completed = {row[0] for row in cursor.fetchall()}
+            cursor.execute(
+                "SELECT MAX(file_timestamp) FROM ingestion_files WHERE status = 'completed'"
+            )
+            high_water = cursor.fetchone()[0]
+            cursor.execute("""
+                SELECT size_bytes, md5_checksum, file_url FROM ingestion_files
+                WHERE status = 'failed' ORDER BY file_timestamp
+            """)
+            failed = [ManifestEntry(size=r[0], md5=r[1], url=r[2]) for r in cursor.fetchall()]
+        return {'completed': completed, 'high_water': high_water, 'failed': failed}
+
+    def _record(self, entry: ManifestEntry, status: str, stats: Dict):
+        """Upsert a file's checkpoint row."""
+        with self._checkpoints.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    INSERT INTO ingestion_files (
+                        file_url, file_timestamp, size_bytes, md5_checksum,
+                        rows_downloaded, rows_inserted, rows_skipped, rows_errored,
+                        status, ingested_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (file_url) DO UPDATE SET
+                        size_bytes = EXCLUDED.size_bytes,
+                        md5_checksum = EXCLUDED.md5_checksum,
+                        rows_downloaded = EXCLUDED.rows_downloaded,
+                        rows_inserted = EXCLUDED.rows_inserted,
+                        rows_skipped = EXCLUDED.rows_skipped,
+                        rows_errored = EXCLUDED.rows_errored,
+                        status = EXCLUDED.status,
+                        ingested_at = EXCLUDED.ingested_at
+                """, (
+                    entry.url, entry.timestamp, entry.size, entry.md5,
+                    stats['downloaded'], stats['inserted'], stats['skipped'], stats['errors'],
+                    status
+                ))
+            conn.commit()
+
+    def pending_files(self, since: Optional[datetime] = None) -> List[ManifestEntry]:
+        """Determine which export files still need ingesting.
+
+        lastupdate.txt only lists the newest file, so masterfilelist.txt is
+        read when the checkpoint lags behind it (or when starting from `since`).
+        Previously failed files are always retried.
+
+        Args:
+            since: On a fresh checkpoint table, ingest files at or after this
+                time instead of starting from the newest file
+
+        Returns:
+            Entries to ingest, oldest first
+        """
+        state = self._checkpoint_state()
+        latest = self.fetch_manifest('lastupdate.txt')
+        high_water = state['high_water']
+
+        if high_water is None and since is not None:
+            candidates = [e for e in self.fetch_manifest('masterfilelist.txt') if e.timestamp >= since]
+        elif high_water is not None and latest and latest[-1].timestamp > high_water + UPDATE_INTERVAL:
+            logger.info(f"Checkpoint at {high_water} lags feed; reading masterfilelist.txt")
+            candidates = [e for e in self.fetch_manifest('masterfilelist.txt') if e.timestamp > high_water]
+        else:
+            candidates = latest
+
+        pending: Dict[str, ManifestEntry] = {e.url: e for e in state['failed']}
+        pending.update({e.url: e for e in candidates})
+        completed: Set[str] = state['completed']
+        return sorted(
+            (e for url, e in pending.items() if url not in completed),
+            key=lambda e: e.timestamp
+        )
+
+    def ingest_file(self, entry: ManifestEntry) -> Dict:
+        """Download, verify, parse and load one 15-minute export file.
+
+        Args:
+            entry: Manifest entry for the file
+
+        Returns:
+            Statistics: {'file_url', 'status', 'downloaded', 'inserted', 'skipped', 'errors'}
+        """
+        stats = {'downloaded': 0, 'inserted': 0, 'skipped': 0, 'errors': 0}
+        status = 'failed'
+
+        raw = self.ingestion.fetch_export(entry.url)
+        if raw is None:
+            pass
+        elif len(raw) != entry.size or hashlib.md5(raw).hexdigest() != entry.md5:
+            logger.error(f"Checksum mismatch for {entry.url}: got {len(raw)} bytes, "
+                         f"md5 {hashlib.md5(raw).hexdigest()}")
+        else:
+            df = self.ingestion.parse_export(raw, columns=GDELTEventIngestion.GDELT_V2_COLUMNS)
+            if df is not None:
+                df = self.ingestion.preprocess_events(df)
+                inserted, skipped, errors = self.ingestion.load_events(df)
+                if inserted:
+                    self.ingestion.update_rollups(df['event_date'].dt.date.unique())
+                stats = {'downloaded': len(df), 'inserted': inserted, 'skipped': skipped, 'errors': errors}
+                status = 'completed' if errors == 0 else 'failed'
+
+        self._record(entry, status, stats)
+        logger.info(f"{entry.url}: {status}, {stats['inserted']:,} inserted, {stats['skipped']:,} skipped")
+        return dict(stats, file_url=entry.url, status=status)
+
+    def follow_once(self, since: Optional[datetime] = None) -> List[Dict]:
+        """Ingest every pending export file once.
+
+        Args:
+            since: Starting point for a fresh checkpoint table (see pending_files)
+
+        Returns:
+            List of per-file statistics dicts
+        """
+        return [self.ingest_file(entry) for entry in self.pending_files(since=since)]
+
+    def follow(
+        self,
+        since: Optional[datetime] = None,
+        poll_interval: Optional[float] = None,
+        max_polls: Optional[int] = None
+    ):
+        """Poll the feed forever (or max_polls times), ingesting new files.
+
+        Args:
+            since: Starting point for a fresh checkpoint table (see pending_files)
+            poll_interval: Seconds between polls (defaults to GDELT_CONFIG['poll_interval'])
+            max_polls: Stop after this many polls (None = run forever)
+        """
+        poll_interval = poll_interval if poll_interval is not None else GDELT_CONFIG['poll_interval']
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            try:
+                results = self.follow_once(since=since)
+                logger.info(f"Poll complete: {len(results)} files ingested")
+            except Exception as e:
+                logger.error(f"Poll failed: {e}")
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(poll_interval)
+
+
+def main():
+    """Example usage: follow the live feed, catching up from the last hour."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    follower = GDELTFeedFollower(GDELTEventIngestion(load_mode='copy'))
+    follower.follow(since=datetime.utcnow() - timedelta(hours=1))
+
+
+if __name__ == '__main__':
+    main()
@@ -17,11 +17,11 @@ from typing import Dict, List, Optional, Tuple
 import folium
 import numpy as np
 import pandas as pd
-import psycopg2
 from folium.plugins import HeatMap, MarkerCluster
 from sklearn.cluster import DBSCAN
 
 from .config import DATABASE_CONFIG
+from .pool import get_pool
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,19 @@ logger = logging.getLogger(__name__)
 class GeoEventAnalyzer:
     """Analyzes geographic patterns in GDELT events."""
     
+    # Compact in-memory dtypes for fetch_geo_events() results
+    GEO_DTYPES = {
+        'lat': 'float32',
+        'lon': 'float32',
+        'country': 'category',
+        'location_name': 'category',
+        'event_code': 'category',
+        'goldstein_scale': 'float32',
+        'avg_tone': 'float32',
+        'socioeconomic_domain': 'category',
+        'socioeconomic_category': 'category',
+    }
+    
     def __init__(self, db_config: Optional[Dict] = None):
         """Initialize geospatial analyzer.
         
@@ -37,29 +50,15 @@ class GeoEventAnalyzer:
         """
         self.db_config = db_config or DATABASE_CONFIG
     
-    def fetch_geo_events(
+    def _geo_events_query(
         self,
         start_date: datetime,
         end_date: datetime,
         domain: Optional[str] = None,
         countries: Optional[List[str]] = None,
         bbox: Optional[Tuple[float, float, float, float]] = None
-    ) -> pd.DataFrame:
-        """Fetch events with geospatial data.
-        
-        Args:
-            start_date: Start of time window
-            end_date: End of time window
-            domain: Filter by socioeconomic domain (optional)
-            countries: Filter by country codes (optional)
-            bbox: Bounding box (min_lat, min_lon, max_lat, max_lon) (optional)
-            
-        Returns:
-            DataFrame with columns: event_id, event_date, lat, lon, event_code, 
-                                   goldstein_scale, avg_tone, socioeconomic_domain
-        """
-        conn = psycopg2.connect(**self.db_config)
-        
+    ) -> Tuple[str, Dict]:
+        """Build the fetch_geo_events() query and its parameters."""
         query = """
             SELECT
                 event_id,
@@ -103,9 +102,33 @@ class GeoEventAnalyzer:
                 'max_lat': max_lat,
                 'max_lon': max_lon
             })
+        return query, params
+    
+    def fetch_geo_events(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        domain: Optional[str] = None,
+        countries: Optional[List[str]] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None
+    ) -> pd.DataFrame:
+        """Fetch events with geospatial data.
+        
+        Args:
+            start_date: Start of time window
+            end_date: End of time window
+            domain: Filter by socioeconomic domain (optional)
+            countries: Filter by country codes (optional)
+            bbox: Bounding box (min_lat, min_lon, max_lat, max_lon) (optional)
+            
+        Returns:
+            DataFrame with columns: event_id, event_date, lat, lon, event_code, 
+                                   goldstein_scale, avg_tone, socioeconomic_domain
+        """
+        query, params = self._geo_events_query(start_date, end_date, domain, countries, bbox)
         
-        df = pd.read_sql_query(query, conn, params=params)
-        conn.close()
+        with get_pool(self.db_config).connection() as conn:
+            df = pd.read_sql_query(query, conn, params=params).astype(self.GEO_DTYPES)
         
         logger.info(f"Fetched {len(df):,} geolocated events")
         return df
@@ -291,7 +314,7 @@ class GeoEventAnalyzer:
         Returns:
             DataFrame with country-level statistics
         """
-        country_stats = df.groupby('country').agg({
+        country_stats = df.groupby('country', observed=True).agg({
             'event_id': 'count',
             'goldstein_scale': 'mean',
             'avg_tone': 'mean',
@@ -0,0 +1,144 @@
+"""
+Multi-Pattern Keyword Classifier
+
+Counts keyword hits per label (e.g. CAMEOMapper.DOMAIN_KEYWORDS per
+socioeconomic domain) in free text with a single Aho-Corasick automaton built
+once from the keyword map. Each document is scanned in one pass regardless of
+vocabulary size, instead of one substring search per keyword per document.
+
+Matching is case-insensitive substring matching, which suits keyword stems
+such as 'discriminat' or 'pollut': every occurrence of every keyword counts,
+overlapping ones included. The automaton comes from the optional
+pyahocorasick package when it is installed and is otherwise built in pure
+Python; both backends give identical counts.
+
+Author: KRL Team
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Optional dependency: C implementation of the automaton (pip install pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton counting keyword hits per label."""
+
+    BACKENDS = ('pyahocorasick', 'python')
+
+    def __init__(self, keyword_map: Dict[str, List[str]], backend: Optional[str] = None):
+        """Build the automaton.
+
+        Args:
+            keyword_map: Label -> keywords (a keyword may appear under several labels)
+            backend: 'pyahocorasick' or 'python'; defaults to pyahocorasick
+                when installed
+        """
+        self.backend = backend or ('pyahocorasick' if AHOCORASICK_AVAILABLE else 'python')
+        if self.backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {self.backend} (expected one of {self.BACKENDS})")
+        if self.backend == 'pyahocorasick' and not AHOCORASICK_AVAILABLE:
+            logger.warning("pyahocorasick not installed, using the pure-Python automaton")
+            self.backend = 'python'
+
+        self.labels = list(keyword_map)
+        patterns: Dict[str, List[int]] = {}
+        for index, keywords in enumerate(keyword_map.values()):
+            for keyword in keywords:
+                if keyword:
+                    patterns.setdefault(keyword.lower(), []).append(index)
+        self.patterns = {keyword: tuple(indices) for keyword, indices in patterns.items()}
+
+        if self.backend == 'pyahocorasick':
+            self._automaton = ahocorasick.Automaton()
+            for keyword, indices in self.patterns.items():
+                self._automaton.add_word(keyword, indices)
+            if self.patterns:
+                self._automaton.make_automaton()
+        else:
+            self._build_python()
+
+    def _build_python(self):
+        """Build a deterministic automaton: per-state transitions over the keyword alphabet."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[tuple] = [()]
+        for keyword, indices in self.patterns.items():
+            state = 0
+            for ch in keyword:
+                if ch not in goto[state]:
+                    goto.append({})
+                    outputs.append(())
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            outputs[state] += indices
+
+        # Breadth-first failure links; each state inherits its failure state's
+        # outputs and missing transitions, so matching never backtracks
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state] += outputs[fail[state]]
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0)
+                pending.append(child)
+
+        self._delta = delta
+        self._outputs = outputs
+
+    def _count(self, text: Optional[str]) -> List[int]:
+        """Keyword hits per label in one document, as a list."""
+        counts = [0] * len(self.labels)
+        if not isinstance(text, str) or not self.patterns:
+            return counts
+
+        text = text.lower()
+        if self.backend == 'pyahocorasick':
+            for _, indices in self._automaton.iter(text):
+                for index in indices:
+                    counts[index] += 1
+            return counts
+
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            for index in outputs[state]:
+                counts[index] += 1
+        return counts
+
+    def count(self, text: Optional[str]) -> np.ndarray:
+        """Keyword hits per label in one document.
+
+        Args:
+            text: Document text (None counts as empty)
+
+        Returns:
+            int64 array of hit counts, one per label
+        """
+        return np.array(self._count(text), dtype=np.int64)
+
+    def count_many(self, texts: Iterable[Optional[str]]) -> np.ndarray:
+        """Keyword hits per label for many documents.
+
+        Args:
+            texts: Document texts
+
+        Returns:
+            int64 array of shape (documents, labels)
+        """
+        counts = np.array([self._count(text) for text in texts], dtype=np.int64)
+        return counts.reshape(-1, len(self.labels))
@@ -0,0 +1,219 @@
+"""
+Monthly Partition Management for gdelt_events
+
+Works with the partitioned schema variant (schema_events_partitioned.sql),
+where gdelt_events is PARTITION BY RANGE (event_date) with one partition per
+calendar month named gdelt_events_YYYY_MM. Indexes are declared on the parent,
+so PostgreSQL creates them on every partition.
+
+Features:
+- Detect whether gdelt_events is partitioned (all methods are no-ops otherwise)
+- Create missing monthly partitions before a load
+- List partitions with their row estimates and sizes
+- Detach old months, optionally exporting them to gzipped CSV and dropping them
+
+Usage:
+    python -m event_db.partitions --archive-before 2023-01-01 --archive-dir data/archive
+
+Author: KRL Team
+"""
+
+import argparse
+import gzip
+import logging
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from psycopg2 import errors, sql
+
+from .config import DATABASE_CONFIG
+from .pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = 'gdelt_events'
+PARTITION_PATTERN = re.compile(rf'^{PARENT_TABLE}_(\d{{4}})_(\d{{2}})$')
+
+
+def month_start(day) -> date:
+    """First day of the month containing a date/datetime."""
+    if isinstance(day, datetime):
+        day = day.date()
+    return day.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding a month, e.g. gdelt_events_2024_01."""
+    return f"{PARENT_TABLE}_{month.year:04d}_{month.month:02d}"
+
+
+class PartitionManager:
+    """Creates, lists and archives monthly gdelt_events partitions."""
+
+    def __init__(self, db_config: Optional[Dict] = None):
+        """Initialize partition manager.
+
+        Args:
+            db_config: PostgreSQL connection config (defaults to DATABASE_CONFIG)
+        """
+        self.db_config = db_config or DATABASE_CONFIG
+        self._known_months = set()
+
+    @staticmethod
+    def is_partitioned(cursor) -> bool:
+        """Whether gdelt_events (as resolved by search_path) is a partitioned table."""
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", (PARENT_TABLE,))
+        row = cursor.fetchone()
+        return row is not None and row[0] == 'p'
+
+    def ensure_partitions(self, conn, cursor, event_dates: Iterable) -> List[str]:
+        """Create the monthly partitions needed for a set of event dates.
+
+        Runs in the caller's transaction and commits only when something was
+        created, so it can sit directly in front of a load.
+
+        Args:
+            conn: psycopg2 connection
+            cursor: psycopg2 cursor
+            event_dates: Dates (or datetimes) about to be loaded
+
+        Returns:
+            Names of partitions created
+        """
+        months = {month_start(d) for d in event_dates} - self._known_months
+        if not months:
+            return []
+
+        created = []
+        for month in sorted(months):
+            name = partition_name(month)
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+            if not cursor.fetchone()[0]:
+                try:
+                    cursor.execute("SAVEPOINT create_partition")
+                    cursor.execute(sql.SQL(
+                        "CREATE TABLE {} PARTITION OF {} FOR VALUES FROM (%s) TO (%s)"
+                    ).format(sql.Identifier(name), sql.Identifier(PARENT_TABLE)),
+                        (month, next_month(month)))
+                    cursor.execute("RELEASE SAVEPOINT create_partition")
+                    created.append(name)
+                except errors.DuplicateTable:
+                    # Another loader created it first
+                    cursor.execute("ROLLBACK TO SAVEPOINT create_partition")
+            self._known_months.add(month)
+
+        if created:
+            conn.commit()
+            logger.info(f"Created partitions: {', '.join(created)}")
+        return created
+
+    def list_partitions(self) -> List[Dict]:
+        """List monthly partitions, oldest first.
+
+        Returns:
+            Dicts with 'name', 'month', 'row_estimate' and 'size_bytes'
+        """
+        with get_pool(self.db_config).connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT child.relname, child.reltuples::bigint, pg_total_relation_size(child.oid)
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = to_regclass(%s)
+            """, (PARENT_TABLE,))
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, row_estimate, size_bytes in rows:
+            match = PARTITION_PATTERN.match(name)
+            if match:
+                partitions.append({
+                    'name': name,
+                    'month': date(int(match.group(1)), int(match.group(2)), 1),
+                    'row_estimate': max(row_estimate, 0),
+                    'size_bytes': size_bytes,
+                })
+        return sorted(partitions, key=lambda p: p['month'])
+
+    def _export(self, cursor, name: str, archive_dir: Path) -> Path:
+        """COPY a detached partition to <archive_dir>/<name>.csv.gz."""
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        path = archive_dir / f"{name}.csv.gz"
+        with gzip.open(path, 'wt', encoding='utf-8', newline='') as f:
+            cursor.copy_expert(
+                sql.SQL("COPY {} TO STDOUT WITH (FORMAT csv, HEADER)")
+                .format(sql.Identifier(name)).as_string(cursor),
+                f
+            )
+        return path
+
+    def archive_before(
+        self,
+        cutoff: date,
+        archive_dir: Optional[Path] = None,
+        drop: bool = False
+    ) -> List[Dict]:
+        """Detach every monthly partition that ends before a cutoff date.
+
+        Detached partitions stay in the database as ordinary tables (queries on
+        gdelt_events no longer see them) unless drop is set, in which case each
+        is exported first when archive_dir is given and then dropped.
+
+        Args:
+            cutoff: Months entirely before this date are archived
+            archive_dir: Directory for <partition>.csv.gz exports (optional)
+            drop: Drop each partition after detaching (and exporting)
+
+        Returns:
+            Dicts with 'name', 'month', 'archive_path' (or None) and 'dropped'
+        """
+        if drop and archive_dir is None:
+            logger.warning("Dropping partitions without an archive_dir export")
+
+        expired = [p for p in self.list_partitions() if next_month(p['month']) <= cutoff]
+        archived = []
+        with get_pool(self.db_config).connection() as conn, conn.cursor() as cursor:
+            for partition in expired:
+                name = sql.Identifier(partition['name'])
+                cursor.execute(sql.SQL("ALTER TABLE {} DETACH PARTITION {}")
+                               .format(sql.Identifier(PARENT_TABLE), name))
+                path = self._export(cursor, partition['name'], Path(archive_dir)) if archive_dir else None
+                if drop:
+                    cursor.execute(sql.SQL("DROP TABLE {}").format(name))
+                conn.commit()
+
+                self._known_months.discard(partition['month'])
+                archived.append({'name': partition['name'], 'month': partition['month'],
+                                 'archive_path': path, 'dropped': drop})
+                logger.info(f"Archived {partition['name']}"
+                            + (f" to {path}" if path else "") + (" and dropped it" if drop else ""))
+        return archived
+
+
+def main():
+    """Maintenance command: detach (and optionally export and drop) old months."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Archive old gdelt_events partitions")
+    parser.add_argument('--archive-before', required=True, type=date.fromisoformat,
+                        help='Archive months that end before this date (YYYY-MM-DD)')
+    parser.add_argument('--archive-dir', type=Path, help='Export each partition to <dir>/<name>.csv.gz')
+    parser.add_argument('--drop', action='store_true', help='Drop partitions after detaching')
+    args = parser.parse_args()
+
+    archived = PartitionManager().archive_before(args.archive_before, args.archive_dir, args.drop)
+    print(f"Archived {len(archived)} partitions")
+    for partition in archived:
+        print(f"  {partition['name']}: {partition['archive_path'] or 'detached'}")
+
+
+if __name__ == '__main__':
+    main()
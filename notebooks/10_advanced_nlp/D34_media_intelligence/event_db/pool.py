@@ -0,0 +1,218 @@
+"""
+Shared PostgreSQL Connection Pool
+
+One ThreadedConnectionPool per database configuration, shared by ingestion,
+the analyzers and the API so short queries skip the TCP/auth handshake and
+bursts queue for a connection instead of exhausting max_connections.
+
+Features:
+- Context-managed checkout that always returns the connection
+- Health check on borrow (broken connections are replaced transparently)
+- Bounded waiting when all connections are in use
+- Pool-wait metrics
+
+Sizes come from the pool_* keys of DATABASE_CONFIG; those keys are stripped
+before the remaining config is handed to psycopg2.
+
+Author: KRL Team
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+from .config import DATABASE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+POOL_KEYS = ('pool_min_size', 'pool_max_size', 'pool_timeout', 'pool_check_idle')
+
+
+class PoolTimeout(PoolError):
+    """Raised when no connection becomes free within the pool timeout."""
+
+
+def connection_params(db_config: Optional[Dict] = None) -> Dict:
+    """Return db_config without pool settings, ready for psycopg2.connect().
+
+    Args:
+        db_config: Database config (defaults to DATABASE_CONFIG)
+    """
+    config = db_config or DATABASE_CONFIG
+    return {k: v for k, v in config.items() if k not in POOL_KEYS}
+
+
+class ConnectionPool:
+    """Thread-safe PostgreSQL connection pool with health checks and wait metrics."""
+
+    def __init__(self, db_config: Optional[Dict] = None):
+        """Initialize pool.
+
+        Args:
+            db_config: Database config including optional pool_* keys
+                (defaults to DATABASE_CONFIG)
+        """
+        config = db_config or DATABASE_CONFIG
+        self.min_size = int(config.get('pool_min_size', DATABASE_CONFIG.get('pool_min_size', 1)))
+        self.max_size = int(config.get('pool_max_size', DATABASE_CONFIG.get('pool_max_size', 10)))
+        self.timeout = float(config.get('pool_timeout', DATABASE_CONFIG.get('pool_timeout', 30)))
+        self.check_idle = float(config.get('pool_check_idle', DATABASE_CONFIG.get('pool_check_idle', 30)))
+        if not 0 <= self.min_size <= self.max_size or self.max_size < 1:
+            raise ValueError(f"Invalid pool sizes: min={self.min_size}, max={self.max_size}")
+
+        self.pid = os.getpid()
+        self._pool = ThreadedConnectionPool(self.min_size, self.max_size, **connection_params(config))
+        # ThreadedConnectionPool raises when exhausted; the semaphore makes callers wait
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._returned_at: Dict[int, float] = {}
+        self.stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0,
+            'timeouts': 0,
+            'health_check_failures': 0,
+        }
+
+    def _acquire_slot(self):
+        """Wait for a free slot, recording how long the caller waited."""
+        if self._slots.acquire(blocking=False):
+            with self._lock:
+                self.stats['checkouts'] += 1
+            return
+
+        start = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.timeout)
+        waited = time.perf_counter() - start
+        with self._lock:
+            if not acquired:
+                self.stats['timeouts'] += 1
+            else:
+                self.stats['checkouts'] += 1
+                self.stats['waits'] += 1
+                self.stats['wait_seconds_total'] += waited
+                self.stats['wait_seconds_max'] = max(self.stats['wait_seconds_max'], waited)
+        if not acquired:
+            raise PoolTimeout(f"No connection available within {self.timeout:.1f}s "
+                              f"(pool max_size={self.max_size})")
+
+    def _is_healthy(self, conn) -> bool:
+        """Cheap state check always; a round trip only for long-idle connections."""
+        if conn.closed:
+            return False
+        if conn.info.transaction_status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        idle = time.monotonic() - self._returned_at.get(id(conn), 0.0)
+        if idle < self.check_idle:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _borrow(self):
+        """Take a connection from the pool, replacing broken ones."""
+        conn = self._pool.getconn()
+        while not self._is_healthy(conn):
+            with self._lock:
+                self.stats['health_check_failures'] += 1
+            logger.warning("Discarding broken pooled connection")
+            self._returned_at.pop(id(conn), None)
+            self._pool.putconn(conn, close=True)
+            conn = self._pool.getconn()
+        return conn
+
+    def _release(self, conn):
+        """Return a connection in a clean state (or close it if it is broken)."""
+        close = bool(conn.closed)
+        if not close:
+            try:
+                if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+                conn.autocommit = False
+            except psycopg2.Error:
+                close = True
+        if close:
+            self._returned_at.pop(id(conn), None)
+        else:
+            self._returned_at[id(conn)] = time.monotonic()
+        self._pool.putconn(conn, close=close)
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        """Check out a connection for the duration of a with-block.
+
+        Uncommitted work is rolled back when the connection is returned.
+
+        Raises:
+            PoolTimeout: If no connection frees up within pool_timeout seconds
+        """
+        self._acquire_slot()
+        try:
+            conn = self._borrow()
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+            self._slots.release()
+
+    def metrics(self) -> Dict:
+        """Pool-wait metrics plus current sizes."""
+        with self._lock:
+            metrics = dict(self.stats)
+        metrics.update({
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'in_use': len(self._pool._used),
+            'idle': len(self._pool._pool),
+        })
+        return metrics
+
+    def close(self):
+        """Close every connection in the pool."""
+        if not self._pool.closed:
+            self._pool.closeall()
+
+
+_pools: Dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_config: Optional[Dict] = None) -> ConnectionPool:
+    """Return the shared pool for a database config, creating it on first use.
+
+    Pools are per process: a forked worker never reuses its parent's sockets.
+
+    Args:
+        db_config: Database config (defaults to DATABASE_CONFIG)
+    """
+    config = db_config or DATABASE_CONFIG
+    key = tuple(sorted((k, str(v)) for k, v in config.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.pid != os.getpid() or pool._pool.closed:
+            pool = _pools[key] = ConnectionPool(config)
+        return pool
+
+
+def close_all():
+    """Close every shared pool owned by this process."""
+    with _pools_lock:
+        for pool in _pools.values():
+            if pool.pid == os.getpid():
+                pool.close()
+        _pools.clear()
@@ -0,0 +1,168 @@
+"""
+Content-Addressed Raw Download Cache
+
+On-disk cache for raw GDELT export zips so re-ingesting dates already fetched
+(after a preprocessing or schema change) costs only local disk reads.
+
+Layout under RAW_CACHE_DIR:
+- objects/<sha[:2]>/<sha256>  -- file bodies, stored once per distinct content
+- index/<sha256(url)>.json    -- per-URL metadata: sha256, size, ETag,
+                                 Last-Modified, fetch time
+
+Cached entries are revalidated with If-None-Match / If-Modified-Since, and
+verified against their SHA-256 and size on every read.
+
+Author: KRL Team
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+
+from .config import RAW_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class RawDownloadCache:
+    """Content-addressed on-disk cache of downloaded files, keyed by URL."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Cache root directory (defaults to RAW_CACHE_DIR)
+        """
+        self.cache_dir = Path(cache_dir or RAW_CACHE_DIR)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_dir = self.cache_dir / "index"
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0}
+
+    def _index_path(self, url: str) -> Path:
+        return self.index_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / sha256
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Write via a temp file + rename so concurrent readers never see partial files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Return the metadata entry for a URL, or None if not cached."""
+        path = self._index_path(url)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable cache index for {url}: {e}")
+            return None
+
+    def read(self, url: str) -> Optional[bytes]:
+        """Read a cached body, verifying its size and SHA-256.
+
+        Returns:
+            Cached bytes, or None if missing or corrupt
+        """
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        object_path = self._object_path(entry['sha256'])
+        try:
+            data = object_path.read_bytes()
+        except OSError:
+            return None
+        if len(data) != entry['size'] or hashlib.sha256(data).hexdigest() != entry['sha256']:
+            logger.warning(f"Cached object for {url} failed verification; discarding it")
+            object_path.unlink(missing_ok=True)
+            return None
+        return data
+
+    def store(self, url: str, data: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> Dict:
+        """Store a body and its URL metadata.
+
+        Returns:
+            The metadata entry written
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(sha256)
+        if not object_path.exists():
+            self._write_atomic(object_path, data)
+
+        entry = {
+            'url': url,
+            'sha256': sha256,
+            'size': len(data),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': datetime.now().isoformat(),
+        }
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode())
+        return entry
+
+    def fetch(self, url: str, session: requests.Session, timeout: float) -> bytes:
+        """Fetch a URL through the cache with conditional revalidation.
+
+        Args:
+            url: URL to fetch
+            session: HTTP session
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response body (from cache when the server answers 304 Not Modified)
+
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+        """
+        entry = self.lookup(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            data = self.read(url)
+            if data is not None:
+                self.stats['revalidated'] += 1
+                logger.info(f"Cache revalidated {url} ({len(data):,} bytes)")
+                return data
+            # Index says we have it but the object is gone or corrupt
+            response = session.get(url, timeout=timeout)
+
+        response.raise_for_status()
+        self.stats['misses'] += 1
+        self.store(
+            url,
+            response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        return response.content
+
+    def read_offline(self, url: str) -> Optional[bytes]:
+        """Read a cached body without any network access (counts as a hit)."""
+        data = self.read(url)
+        if data is not None:
+            self.stats['hits'] += 1
+        return data
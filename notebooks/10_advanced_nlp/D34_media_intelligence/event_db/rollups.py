@@ -0,0 +1,232 @@
+"""
+Event Rollups
+
+Maintains the event_statistics and actor_relationships summary tables from
+gdelt_events so dashboards and the API can read pre-aggregated rows instead
+of scanning raw events:
+- event_statistics: one row per (event date, socioeconomic domain) with event
+  count, mean Goldstein/tone, and the top countries and actors
+- actor_relationships: one row per (actor1, actor2, event date) with
+  interaction count, mean Goldstein/tone and the event code distribution
+
+Rollups are recomputed from gdelt_events for the affected event dates only,
+inside one transaction per refresh, so they always equal a fresh aggregate.
+
+Usage:
+    python -m event_db.rollups --start 2024-01-01 --end 2024-01-31
+
+Author: KRL Team
+"""
+
+import argparse
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from .config import DATABASE_CONFIG
+from .pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+
+class EventRollups:
+    """Incremental maintenance of event_statistics and actor_relationships."""
+
+    # Entries kept in the top_countries / top_actors JSON lists
+    TOP_N = 10
+
+    EVENT_STATISTICS_SQL = """
+        WITH base AS (
+            SELECT event_date, socioeconomic_domain, action_geo_country_code,
+                   actor1_code, actor2_code, goldstein_scale, avg_tone
+            FROM gdelt_events
+            WHERE event_date = ANY(%(dates)s)
+        ),
+        totals AS (
+            SELECT event_date, socioeconomic_domain, COUNT(*) AS event_count,
+                   AVG(goldstein_scale) AS avg_goldstein, AVG(avg_tone) AS avg_tone
+            FROM base
+            GROUP BY event_date, socioeconomic_domain
+        ),
+        country_counts AS (
+            SELECT event_date, socioeconomic_domain, action_geo_country_code AS country,
+                   COUNT(*) AS n,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY event_date, socioeconomic_domain
+                       ORDER BY COUNT(*) DESC, action_geo_country_code
+                   ) AS rank
+            FROM base
+            WHERE action_geo_country_code IS NOT NULL
+            GROUP BY event_date, socioeconomic_domain, action_geo_country_code
+        ),
+        actor_counts AS (
+            SELECT event_date, socioeconomic_domain, actor, COUNT(*) AS n,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY event_date, socioeconomic_domain
+                       ORDER BY COUNT(*) DESC, actor
+                   ) AS rank
+            FROM (
+                SELECT event_date, socioeconomic_domain, actor1_code AS actor FROM base
+                UNION ALL
+                SELECT event_date, socioeconomic_domain, actor2_code FROM base
+            ) actors
+            WHERE actor IS NOT NULL
+            GROUP BY event_date, socioeconomic_domain, actor
+        )
+        INSERT INTO event_statistics (
+            stat_date, socioeconomic_domain, event_count, avg_goldstein, avg_tone,
+            top_countries, top_actors, computed_at
+        )
+        SELECT
+            t.event_date, t.socioeconomic_domain, t.event_count, t.avg_goldstein, t.avg_tone,
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object('country', c.country, 'count', c.n) ORDER BY c.rank)
+                FROM country_counts c
+                WHERE c.event_date = t.event_date
+                  AND c.socioeconomic_domain IS NOT DISTINCT FROM t.socioeconomic_domain
+                  AND c.rank <= %(top_n)s
+            ), '[]'::jsonb),
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object('actor', a.actor, 'count', a.n) ORDER BY a.rank)
+                FROM actor_counts a
+                WHERE a.event_date = t.event_date
+                  AND a.socioeconomic_domain IS NOT DISTINCT FROM t.socioeconomic_domain
+                  AND a.rank <= %(top_n)s
+            ), '[]'::jsonb),
+            CURRENT_TIMESTAMP
+        FROM totals t
+        ON CONFLICT (stat_date, socioeconomic_domain) DO UPDATE SET
+            event_count = EXCLUDED.event_count,
+            avg_goldstein = EXCLUDED.avg_goldstein,
+            avg_tone = EXCLUDED.avg_tone,
+            top_countries = EXCLUDED.top_countries,
+            top_actors = EXCLUDED.top_actors,
+            computed_at = EXCLUDED.computed_at
+    """
+
+    ACTOR_RELATIONSHIPS_SQL = """
+        WITH per_code AS (
+            SELECT event_date, actor1_code, actor2_code, event_code,
+                   COUNT(*) AS n,
+                   SUM(goldstein_scale) AS goldstein_sum, COUNT(goldstein_scale) AS goldstein_n,
+                   SUM(avg_tone) AS tone_sum, COUNT(avg_tone) AS tone_n
+            FROM gdelt_events
+            WHERE event_date = ANY(%(dates)s)
+              AND actor1_code IS NOT NULL
+              AND actor2_code IS NOT NULL
+            GROUP BY event_date, actor1_code, actor2_code, event_code
+        )
+        INSERT INTO actor_relationships (
+            actor1, actor2, start_date, end_date, interaction_count,
+            avg_goldstein, avg_tone, event_types, computed_at
+        )
+        SELECT
+            actor1_code, actor2_code, event_date, event_date, SUM(n),
+            SUM(goldstein_sum) / NULLIF(SUM(goldstein_n), 0),
+            SUM(tone_sum) / NULLIF(SUM(tone_n), 0),
+            COALESCE(jsonb_object_agg(event_code, n) FILTER (WHERE event_code IS NOT NULL), '{}'::jsonb),
+            CURRENT_TIMESTAMP
+        FROM per_code
+        GROUP BY event_date, actor1_code, actor2_code
+        ON CONFLICT (actor1, actor2, start_date, end_date) DO UPDATE SET
+            interaction_count = EXCLUDED.interaction_count,
+            avg_goldstein = EXCLUDED.avg_goldstein,
+            avg_tone = EXCLUDED.avg_tone,
+            event_types = EXCLUDED.event_types,
+            computed_at = EXCLUDED.computed_at
+    """
+
+    def __init__(self, db_config: Optional[Dict] = None):
+        """Initialize rollup maintainer.
+
+        Args:
+            db_config: PostgreSQL connection config (defaults to DATABASE_CONFIG)
+        """
+        self.db_config = db_config or DATABASE_CONFIG
+
+    def refresh_dates(self, dates: Iterable[date]) -> Dict[str, int]:
+        """Recompute both rollups for the given event dates.
+
+        Rows for these dates that no longer have events are removed; rows for
+        other dates are not touched.
+
+        Args:
+            dates: Event dates whose rollups changed
+
+        Returns:
+            {'dates', 'event_statistics', 'actor_relationships'} row counts written
+        """
+        dates = sorted({d.date() if isinstance(d, datetime) else d for d in dates})
+        if not dates:
+            return {'dates': 0, 'event_statistics': 0, 'actor_relationships': 0}
+
+        params = {'dates': dates, 'top_n': self.TOP_N}
+        with get_pool(self.db_config).connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "DELETE FROM event_statistics WHERE stat_date = ANY(%(dates)s)", params
+                    )
+                    cursor.execute(self.EVENT_STATISTICS_SQL, params)
+                    statistics_rows = cursor.rowcount
+
+                    # Only daily rows are owned by the rollup; wider windows are left alone
+                    cursor.execute("""
+                        DELETE FROM actor_relationships
+                        WHERE start_date = end_date AND start_date = ANY(%(dates)s)
+                    """, params)
+                    cursor.execute(self.ACTOR_RELATIONSHIPS_SQL, params)
+                    relationship_rows = cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        logger.info(f"Refreshed rollups for {len(dates)} dates: {statistics_rows:,} statistics rows, "
+                    f"{relationship_rows:,} actor relationships")
+        return {
+            'dates': len(dates),
+            'event_statistics': statistics_rows,
+            'actor_relationships': relationship_rows,
+        }
+
+    def rebuild_rollups(self, start_date: date, end_date: date) -> Dict[str, int]:
+        """Recompute rollups for every date in a range (inclusive).
+
+        Args:
+            start_date: First date to rebuild
+            end_date: Last date to rebuild
+
+        Returns:
+            Row counts as for refresh_dates()
+        """
+        if isinstance(start_date, datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime):
+            end_date = end_date.date()
+        if end_date < start_date:
+            raise ValueError(f"end_date {end_date} is before start_date {start_date}")
+
+        days = (end_date - start_date).days + 1
+        return self.refresh_dates(start_date + timedelta(days=i) for i in range(days))
+
+
+def main():
+    """Maintenance command: rebuild rollups for a date range."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Rebuild event_statistics and actor_relationships")
+    parser.add_argument('--start', required=True, type=date.fromisoformat, help='First date (YYYY-MM-DD)')
+    parser.add_argument('--end', required=True, type=date.fromisoformat, help='Last date (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    result = EventRollups().rebuild_rollups(args.start, args.end)
+    print(f"Rebuilt {result['dates']} dates: {result['event_statistics']:,} statistics rows, "
+          f"{result['actor_relationships']:,} actor relationships")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Schema Definitions
+
+schema_events.sql is the one definition of every table. Components that keep
+their own bookkeeping table (the feed follower's ingestion_files checkpoints,
+the backfill_queue and the ingestion_runs ledger) create it on first use from
+that file's statements instead of carrying a copy of the DDL.
+
+Author: KRL Team
+"""
+
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .pool import get_pool
+
+SCHEMA_PATH = Path(__file__).with_name('schema_events.sql')
+
+# Statements that define or change a table, and the table they target
+_TABLE_STATEMENT = re.compile(
+    r'^(?:CREATE (?:UNLOGGED )?TABLE IF NOT EXISTS|CREATE INDEX IF NOT EXISTS \w+ ON|ALTER TABLE)\s+(\w+)',
+    re.MULTILINE
+)
+
+
+@lru_cache(maxsize=None)
+def table_ddl(table: str) -> str:
+    """Statements of schema_events.sql that create or alter a table or its indexes.
+
+    Args:
+        table: Table name
+
+    Returns:
+        The table's statements, in file order, as one SQL string
+
+    Raises:
+        ValueError: If schema_events.sql does not define the table
+    """
+    statements = []
+    for statement in re.split(r';\s*$', SCHEMA_PATH.read_text(), flags=re.MULTILINE):
+        match = _TABLE_STATEMENT.search(statement)
+        if match and match.group(1) == table:
+            statements.append(statement.strip() + ';')
+    if not statements:
+        raise ValueError(f"schema_events.sql does not define table {table!r}")
+    return '\n'.join(statements)
+
+
+class TableOnFirstUse:
+    """Pooled connections that create a schema_events.sql table on first checkout."""
+
+    def __init__(self, table: str, db_config: Optional[Dict] = None):
+        """Initialize.
+
+        Args:
+            table: Table to create (with its indexes) if it does not exist
+            db_config: PostgreSQL connection config (defaults to DATABASE_CONFIG)
+        """
+        self.table = table
+        self.db_config = db_config
+        self._ready = False
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        """Check out a pooled connection, creating the table the first time."""
+        with get_pool(self.db_config).connection() as conn:
+            if not self._ready:
+                with conn.cursor() as cursor:
+                    cursor.execute(table_ddl(self.table))
+                conn.commit()
+                self._ready = True
+            yield conn
@@ -3,6 +3,11 @@
 -- 
 -- This schema stores GDELT 2.0 Event Database records with 58 columns
 -- plus additional fields for socioeconomic categorization.
+--
+-- The partitioned and hot/cold split variants (schema_events_partitioned.sql,
+-- schema_events_split.sql) hold only their own gdelt_events definition and
+-- are loaded before this file, which then skips gdelt_events and adds
+-- everything else. Indexes, tables and comments here are shared by all three.
 
 CREATE TABLE IF NOT EXISTS gdelt_events (
     -- Primary Key
@@ -38,6 +43,10 @@ CREATE TABLE IF NOT EXISTS gdelt_events (
     actor2_type2_code VARCHAR(50),
     actor2_type3_code VARCHAR(50),
     
+    -- Interned actor codes (actors.actor_id, see event_db.actor_dictionary)
+    actor1_id INTEGER,
+    actor2_id INTEGER,
+    
     -- Event Classification
     is_root_event BOOLEAN,
     event_code VARCHAR(10) NOT NULL,
@@ -96,6 +105,12 @@ CREATE TABLE IF NOT EXISTS gdelt_events (
     CONSTRAINT unique_event UNIQUE (event_id)
 );
 
+-- Interned actor IDs for databases created before the actor dictionary (a
+-- no-op otherwise), so re-running this file upgrades an existing schema
+ALTER TABLE gdelt_events
+    ADD COLUMN IF NOT EXISTS actor1_id INTEGER,
+    ADD COLUMN IF NOT EXISTS actor2_id INTEGER;
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_event_date ON gdelt_events(event_date);
 CREATE INDEX IF NOT EXISTS idx_event_code ON gdelt_events(event_code);
@@ -111,11 +126,81 @@ CREATE INDEX IF NOT EXISTS idx_socioeconomic_category ON gdelt_events(socioecono
 -- Composite indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_date_domain ON gdelt_events(event_date, socioeconomic_domain);
 CREATE INDEX IF NOT EXISTS idx_date_actors ON gdelt_events(event_date, actor1_code, actor2_code);
+CREATE INDEX IF NOT EXISTS idx_date_actor_ids ON gdelt_events(event_date, actor1_id, actor2_id);
+-- Events whose actor IDs are still to be backfilled (empty once backfilled)
+CREATE INDEX IF NOT EXISTS idx_missing_actor_ids ON gdelt_events(event_id)
+    WHERE (actor1_id IS NULL AND actor1_code IS NOT NULL)
+       OR (actor2_id IS NULL AND actor2_code IS NOT NULL);
 CREATE INDEX IF NOT EXISTS idx_country_date ON gdelt_events(action_geo_country_code, event_date);
 
 -- Geospatial index (for proximity queries)
 CREATE INDEX IF NOT EXISTS idx_action_geo_lat_long ON gdelt_events(action_geo_lat, action_geo_long);
 
+-- Staging table for COPY-based bulk loads (see GDELTEventIngestion.copy_batch)
+-- Unlogged: contents are transient and truncated after every merge.
+CREATE UNLOGGED TABLE IF NOT EXISTS gdelt_events_staging (LIKE gdelt_events INCLUDING DEFAULTS);
+ALTER TABLE gdelt_events_staging
+    ADD COLUMN IF NOT EXISTS actor1_id INTEGER,
+    ADD COLUMN IF NOT EXISTS actor2_id INTEGER;
+
+-- Actor dictionary: one integer ID per distinct actor code (see event_db.actor_dictionary)
+CREATE TABLE IF NOT EXISTS actors (
+    actor_id SERIAL PRIMARY KEY,
+    actor_code VARCHAR(50) NOT NULL UNIQUE,
+    actor_name TEXT                     -- First Actor1Name/Actor2Name seen with the code
+);
+
+-- Checkpoint table for the 15-minute feed follower (see GDELTFeedFollower)
+CREATE TABLE IF NOT EXISTS ingestion_files (
+    file_url TEXT PRIMARY KEY,
+    file_timestamp TIMESTAMP NOT NULL,  -- YYYYMMDDHHMMSS from the filename
+    size_bytes BIGINT,                  -- Size listed in the manifest
+    md5_checksum CHAR(32),              -- MD5 listed in the manifest (verified on download)
+    rows_downloaded INTEGER,
+    rows_inserted INTEGER,
+    rows_skipped INTEGER,
+    rows_errored INTEGER,
+    status VARCHAR(20) NOT NULL,        -- 'completed' or 'failed'
+    ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_files_timestamp ON ingestion_files(file_timestamp);
+
+-- Work queue for resumable backfills (see event_db.backfill.BackfillQueue)
+CREATE TABLE IF NOT EXISTS backfill_queue (
+    work_date DATE PRIMARY KEY,
+    state VARCHAR(20) NOT NULL DEFAULT 'pending',  -- 'pending', 'running', 'completed' or 'failed'
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    duration_sec DOUBLE PRECISION,                  -- Duration of the last attempt
+    rows_inserted INTEGER,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    claimed_by TEXT,                                -- host:pid of the worker holding the date
+    claimed_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_backfill_queue_claimable ON backfill_queue(state, next_attempt_at);
+
+-- Run ledger: one row per ingest_date call with per-stage timings (see event_db.telemetry)
+CREATE TABLE IF NOT EXISTS ingestion_runs (
+    run_id CHAR(32) PRIMARY KEY,
+    run_date DATE,
+    started_at TIMESTAMP NOT NULL,
+    finished_at TIMESTAMP NOT NULL,
+    status VARCHAR(20) NOT NULL,        -- 'completed', 'no_data' or 'errors'
+    wall_sec DOUBLE PRECISION,
+    cpu_sec DOUBLE PRECISION,           -- Sum of per-stage thread CPU time
+    rows_downloaded INTEGER,
+    rows_inserted INTEGER,
+    rows_skipped INTEGER,
+    rows_errored INTEGER,
+    bytes_downloaded BIGINT,
+    stages JSONB                        -- {stage: {calls, wall_sec, cpu_sec, rows, bytes}}
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_started ON ingestion_runs(started_at);
+
 -- Summary statistics table (for dashboard performance)
 CREATE TABLE IF NOT EXISTS event_statistics (
     stat_id SERIAL PRIMARY KEY,
@@ -153,6 +238,7 @@ CREATE INDEX IF NOT EXISTS idx_actor_rel_dates ON actor_relationships(start_date
 
 -- Comments for documentation
 COMMENT ON TABLE gdelt_events IS 'GDELT 2.0 Event Database records with socioeconomic categorization';
+COMMENT ON TABLE actors IS 'Actor dictionary: integer actor_id per distinct actor code';
 COMMENT ON COLUMN gdelt_events.event_id IS 'Unique identifier for the event (GLOBALEVENTID)';
 COMMENT ON COLUMN gdelt_events.goldstein_scale IS 'Conflict/cooperation intensity: -10 (extreme conflict) to +10 (extreme cooperation)';
 COMMENT ON COLUMN gdelt_events.quad_class IS 'Event quadrant: 1=Verbal Cooperation, 2=Material Cooperation, 3=Verbal Conflict, 4=Material Conflict';
@@ -0,0 +1,113 @@
+-- GDELT Event Database Schema (monthly partitioned variant)
+-- PostgreSQL 15+
+-- 
+-- gdelt_events is declaratively partitioned by RANGE (event_date) into one
+-- partition per calendar month (gdelt_events_YYYY_MM). Indexes are declared
+-- on the parent, so every partition gets its own copy and date-bounded
+-- queries only touch the months they cover.
+-- 
+-- This file defines only the partitioned gdelt_events. Load it first, then
+-- schema_events.sql, which skips gdelt_events (it already exists) and adds
+-- the shared indexes, tables and comments:
+--     psql -f schema_events_partitioned.sql -f schema_events.sql
+--
+-- Partitions are created on demand by GDELTEventIngestion before each load
+-- and detached/archived with event_db.partitions.PartitionManager.
+
+CREATE TABLE IF NOT EXISTS gdelt_events (
+    -- Event identifier (unique together with the partition key, see below)
+    event_id BIGINT NOT NULL,
+    
+    -- Temporal Information
+    event_date DATE NOT NULL,
+    month_year INTEGER,
+    year INTEGER,
+    fraction_date DECIMAL(10, 5),
+    
+    -- Actor 1 (Primary Actor)
+    actor1_code VARCHAR(50),
+    actor1_name TEXT,
+    actor1_country_code CHAR(3),
+    actor1_known_group_code VARCHAR(50),
+    actor1_ethnic_code VARCHAR(50),
+    actor1_religion1_code VARCHAR(50),
+    actor1_religion2_code VARCHAR(50),
+    actor1_type1_code VARCHAR(50),
+    actor1_type2_code VARCHAR(50),
+    actor1_type3_code VARCHAR(50),
+    
+    -- Actor 2 (Secondary Actor)
+    actor2_code VARCHAR(50),
+    actor2_name TEXT,
+    actor2_country_code CHAR(3),
+    actor2_known_group_code VARCHAR(50),
+    actor2_ethnic_code VARCHAR(50),
+    actor2_religion1_code VARCHAR(50),
+    actor2_religion2_code VARCHAR(50),
+    actor2_type1_code VARCHAR(50),
+    actor2_type2_code VARCHAR(50),
+    actor2_type3_code VARCHAR(50),
+    
+    -- Interned actor codes (actors.actor_id, see event_db.actor_dictionary)
+    actor1_id INTEGER,
+    actor2_id INTEGER,
+    
+    -- Event Classification
+    is_root_event BOOLEAN,
+    event_code VARCHAR(10) NOT NULL,
+    event_base_code VARCHAR(10),
+    event_root_code VARCHAR(10),
+    quad_class INTEGER,  -- 1=Verbal Coop, 2=Material Coop, 3=Verbal Conflict, 4=Material Conflict
+    
+    -- Event Attributes
+    goldstein_scale DECIMAL(5, 2),  -- -10 (conflict) to +10 (cooperation)
+    num_mentions INTEGER,           -- Number of source articles
+    num_sources INTEGER,            -- Number of source documents
+    num_articles INTEGER,           -- Number of articles
+    avg_tone DECIMAL(6, 2),        -- Sentiment (-100 to +100)
+    
+    -- Actor 1 Geography
+    actor1_geo_type INTEGER,
+    actor1_geo_fullname TEXT,
+    actor1_geo_country_code CHAR(3),
+    actor1_geo_adm1_code VARCHAR(10),
+    actor1_geo_lat DECIMAL(9, 6),
+    actor1_geo_long DECIMAL(9, 6),
+    actor1_geo_feature_id VARCHAR(20),
+    
+    -- Actor 2 Geography
+    actor2_geo_type INTEGER,
+    actor2_geo_fullname TEXT,
+    actor2_geo_country_code CHAR(3),
+    actor2_geo_adm1_code VARCHAR(10),
+    actor2_geo_lat DECIMAL(9, 6),
+    actor2_geo_long DECIMAL(9, 6),
+    actor2_geo_feature_id VARCHAR(20),
+    
+    -- Action Geography (where event occurred)
+    action_geo_type INTEGER,
+    action_geo_fullname TEXT,
+    action_geo_country_code CHAR(3),
+    action_geo_adm1_code VARCHAR(10),
+    action_geo_lat DECIMAL(9, 6),
+    action_geo_long DECIMAL(9, 6),
+    action_geo_feature_id VARCHAR(20),
+    
+    -- Source Information
+    date_added TIMESTAMP,
+    source_url TEXT,
+    
+    -- Socioeconomic Categorization (added by us)
+    socioeconomic_domain VARCHAR(50),     -- 'labor', 'health', 'education', etc.
+    socioeconomic_category VARCHAR(50),   -- 'labor_action', 'policy_announcement', etc.
+    category_confidence DECIMAL(3, 2),    -- 0.00 to 1.00
+    
+    -- Metadata
+    ingestion_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ingestion_batch_id VARCHAR(50),
+    
+    -- Unique constraints on a partitioned table must include the partition
+    -- key; a GLOBALEVENTID always carries the same SQLDATE, so this still
+    -- rejects duplicate events.
+    PRIMARY KEY (event_id, event_date)
+) PARTITION BY RANGE (event_date);
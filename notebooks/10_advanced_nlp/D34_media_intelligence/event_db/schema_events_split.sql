@@ -0,0 +1,143 @@
+-- GDELT Event Database Schema (hot/cold split variant)
+-- PostgreSQL 15+
+-- 
+-- The wide, rarely read text columns (actor names, actor geo full names and
+-- source_url) live in the gdelt_events_detail side table keyed by event_id,
+-- so the analyzer queries read narrow gdelt_events rows. Covering indexes
+-- match the exact column lists of ActorNetworkAnalyzer.fetch_interactions and
+-- GeoEventAnalyzer.fetch_geo_events (and so the API search) so those can run
+-- as index-only scans. The gdelt_events_full view joins both tables back
+-- into the 58-column layout.
+-- 
+-- This file defines only what the split changes. Load it first, then
+-- schema_events.sql, which skips gdelt_events and gdelt_events_staging (they
+-- already exist) and adds the shared indexes, tables and comments:
+--     psql -f schema_events_split.sql -f schema_events.sql
+--
+-- GDELTEventIngestion detects gdelt_events_detail and loads both tables.
+
+CREATE TABLE IF NOT EXISTS gdelt_events (
+    -- Primary Key
+    event_id BIGINT PRIMARY KEY,
+    
+    -- Temporal Information
+    event_date DATE NOT NULL,
+    month_year INTEGER,
+    year INTEGER,
+    fraction_date DECIMAL(10, 5),
+    
+    -- Actor 1 (Primary Actor)
+    actor1_code VARCHAR(50),
+    actor1_country_code CHAR(3),
+    actor1_known_group_code VARCHAR(50),
+    actor1_ethnic_code VARCHAR(50),
+    actor1_religion1_code VARCHAR(50),
+    actor1_religion2_code VARCHAR(50),
+    actor1_type1_code VARCHAR(50),
+    actor1_type2_code VARCHAR(50),
+    actor1_type3_code VARCHAR(50),
+    
+    -- Actor 2 (Secondary Actor)
+    actor2_code VARCHAR(50),
+    actor2_country_code CHAR(3),
+    actor2_known_group_code VARCHAR(50),
+    actor2_ethnic_code VARCHAR(50),
+    actor2_religion1_code VARCHAR(50),
+    actor2_religion2_code VARCHAR(50),
+    actor2_type1_code VARCHAR(50),
+    actor2_type2_code VARCHAR(50),
+    actor2_type3_code VARCHAR(50),
+    
+    -- Interned actor codes (actors.actor_id, see event_db.actor_dictionary)
+    actor1_id INTEGER,
+    actor2_id INTEGER,
+    
+    -- Event Classification
+    is_root_event BOOLEAN,
+    event_code VARCHAR(10) NOT NULL,
+    event_base_code VARCHAR(10),
+    event_root_code VARCHAR(10),
+    quad_class INTEGER,  -- 1=Verbal Coop, 2=Material Coop, 3=Verbal Conflict, 4=Material Conflict
+    
+    -- Event Attributes
+    goldstein_scale DECIMAL(5, 2),  -- -10 (conflict) to +10 (cooperation)
+    num_mentions INTEGER,           -- Number of source articles
+    num_sources INTEGER,            -- Number of source documents
+    num_articles INTEGER,           -- Number of articles
+    avg_tone DECIMAL(6, 2),        -- Sentiment (-100 to +100)
+    
+    -- Actor 1 Geography
+    actor1_geo_type INTEGER,
+    actor1_geo_country_code CHAR(3),
+    actor1_geo_adm1_code VARCHAR(10),
+    actor1_geo_lat DECIMAL(9, 6),
+    actor1_geo_long DECIMAL(9, 6),
+    actor1_geo_feature_id VARCHAR(20),
+    
+    -- Actor 2 Geography
+    actor2_geo_type INTEGER,
+    actor2_geo_country_code CHAR(3),
+    actor2_geo_adm1_code VARCHAR(10),
+    actor2_geo_lat DECIMAL(9, 6),
+    actor2_geo_long DECIMAL(9, 6),
+    actor2_geo_feature_id VARCHAR(20),
+    
+    -- Action Geography (where event occurred)
+    action_geo_type INTEGER,
+    action_geo_fullname TEXT,
+    action_geo_country_code CHAR(3),
+    action_geo_adm1_code VARCHAR(10),
+    action_geo_lat DECIMAL(9, 6),
+    action_geo_long DECIMAL(9, 6),
+    action_geo_feature_id VARCHAR(20),
+    
+    -- Source Information (source_url is in gdelt_events_detail)
+    date_added TIMESTAMP,
+    
+    -- Socioeconomic Categorization (added by us)
+    socioeconomic_domain VARCHAR(50),     -- 'labor', 'health', 'education', etc.
+    socioeconomic_category VARCHAR(50),   -- 'labor_action', 'policy_announcement', etc.
+    category_confidence DECIMAL(3, 2),    -- 0.00 to 1.00
+    
+    -- Metadata
+    ingestion_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ingestion_batch_id VARCHAR(50),
+    
+    -- Indexes for common queries
+    CONSTRAINT unique_event UNIQUE (event_id)
+);
+
+-- Covering indexes: every column the analyzer queries reference, restricted
+-- to the rows they can return (see _interactions_query / _geo_events_query)
+CREATE INDEX IF NOT EXISTS idx_interactions_covering ON gdelt_events(event_date)
+    INCLUDE (actor1_code, actor2_code, actor1_id, actor2_id, goldstein_scale, avg_tone, event_code,
+             socioeconomic_domain, actor1_country_code, actor2_country_code)
+    WHERE actor1_code IS NOT NULL AND actor2_code IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_geo_events_covering ON gdelt_events(event_date)
+    INCLUDE (event_id, action_geo_lat, action_geo_long, action_geo_country_code,
+             action_geo_fullname, event_code, goldstein_scale, avg_tone,
+             socioeconomic_domain, socioeconomic_category)
+    WHERE action_geo_lat IS NOT NULL AND action_geo_long IS NOT NULL;
+
+-- Cold columns, one row per gdelt_events row
+CREATE TABLE IF NOT EXISTS gdelt_events_detail (
+    event_id BIGINT PRIMARY KEY,
+    actor1_name TEXT,
+    actor2_name TEXT,
+    actor1_geo_fullname TEXT,
+    actor2_geo_fullname TEXT,
+    source_url TEXT
+);
+
+-- Full 58-column layout for readers that need the cold columns
+CREATE OR REPLACE VIEW gdelt_events_full AS
+SELECT e.*, d.actor1_name, d.actor2_name, d.actor1_geo_fullname, d.actor2_geo_fullname, d.source_url
+FROM gdelt_events e
+LEFT JOIN gdelt_events_detail d USING (event_id);
+
+-- Staging table for COPY-based bulk loads (see GDELTEventIngestion.copy_batch)
+-- Unlogged: contents are transient and truncated after every merge. Holds
+-- hot and cold columns; the merge splits them between the two tables.
+CREATE UNLOGGED TABLE IF NOT EXISTS gdelt_events_staging (LIKE gdelt_events_full);
+
+COMMENT ON TABLE gdelt_events_detail IS 'Rarely read wide columns of gdelt_events, keyed by event_id';
@@ -0,0 +1,409 @@
+"""
+Sparse Actor Graphs
+
+Holds an actor interaction network as integer edge arrays over a factorized
+actor dictionary, so a graph with hundreds of thousands of actor pairs is
+built with a handful of vectorized calls instead of one NetworkX add_edge per
+interaction. Interactions carrying interned actor IDs (actor1_id/actor2_id,
+see event_db.actor_dictionary) are factorized on those integers rather than
+on the actor code strings. Weighted adjacency is available as scipy.sparse
+CSR matrices; a NetworkX graph is only materialized on demand (to_networkx()).
+k-hop neighborhoods are expanded as sparse boolean frontier-matrix products
+(k_hop_neighborhood()).
+
+Author: KRL Team
+"""
+
+import hashlib
+import logging
+from typing import Dict, Optional, Tuple, Union
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+# Per-edge attributes carried over from fetch_interactions() columns
+EDGE_ATTRIBUTES = ('event_count', 'avg_goldstein', 'avg_tone')
+
+
+class SparseActorGraph:
+    """Actor interaction graph as factorized integer edge arrays.
+
+    Node i is the actor actors[i]; edge e runs from src[e] to dst[e] and has
+    edge_data[attribute][e] for 'weight' and each of EDGE_ATTRIBUTES. Node
+    order is order of first appearance in the interactions, as when the
+    edges are added to a NetworkX graph one by one. When built from interned
+    interactions, actor_ids[i] is node i's database actor_id.
+    """
+
+    def __init__(
+        self,
+        actors: np.ndarray,
+        src: np.ndarray,
+        dst: np.ndarray,
+        edge_data: Dict[str, np.ndarray],
+        directed: bool = True,
+        actor_ids: Optional[np.ndarray] = None
+    ):
+        """Wrap edge arrays (see from_interactions()).
+
+        Args:
+            actors: Actor name of each node ID
+            src: Source node ID of each edge
+            dst: Target node ID of each edge
+            edge_data: Attribute -> one value per edge
+            directed: True for a directed graph
+            actor_ids: Database actor_id of each node ID (optional)
+        """
+        self.actors = actors
+        self.src = src
+        self.dst = dst
+        self.edge_data = edge_data
+        self.directed = directed
+        self.actor_ids = actor_ids
+
+    @classmethod
+    def from_interactions(
+        cls,
+        interactions: pd.DataFrame,
+        directed: bool = True,
+        weight_by: str = 'event_count'
+    ) -> 'SparseActorGraph':
+        """Build from an actor1/actor2 interactions frame.
+
+        Repeated actor pairs (in either order, for undirected graphs) keep the
+        attributes of their last row, matching successive add_edge calls.
+        With actor1_id/actor2_id columns, nodes are keyed by those IDs and
+        each node's name is taken from its first row.
+
+        Args:
+            interactions: DataFrame with actor1, actor2, weight_by and EDGE_ATTRIBUTES
+                columns (and optionally actor1_id, actor2_id)
+            directed: True for directed graph, False for undirected
+            weight_by: Column used as edge weight
+
+        Returns:
+            SparseActorGraph
+        """
+        n = len(interactions)
+        endpoints = np.empty(2 * n, dtype=object)
+        endpoints[0::2] = interactions['actor1'].to_numpy(dtype=object)
+        endpoints[1::2] = interactions['actor2'].to_numpy(dtype=object)
+        actor_ids = None
+        if 'actor1_id' in interactions and 'actor2_id' in interactions:
+            keys = np.empty(2 * n, dtype=np.int64)
+            keys[0::2] = interactions['actor1_id'].to_numpy(dtype=np.int64)
+            keys[1::2] = interactions['actor2_id'].to_numpy(dtype=np.int64)
+            ids, actor_ids = pd.factorize(keys)
+            _, first = np.unique(ids, return_index=True)
+            actors = endpoints[first]
+        else:
+            ids, actors = pd.factorize(endpoints)
+        if (ids < 0).any():
+            raise ValueError("Interactions contain missing actors")
+
+        ids = ids.astype(np.int32)
+        src, dst = ids[0::2], ids[1::2]
+        if directed:
+            pair = src.astype(np.int64) * len(actors) + dst
+        else:
+            pair = np.minimum(src, dst).astype(np.int64) * len(actors) + np.maximum(src, dst)
+
+        # Last occurrence of each pair, in row order
+        _, last_reversed = np.unique(pair[::-1], return_index=True)
+        keep = np.sort(n - 1 - last_reversed)
+
+        edge_data = {'weight': interactions[weight_by].to_numpy()[keep]}
+        for attribute in EDGE_ATTRIBUTES:
+            edge_data[attribute] = interactions[attribute].to_numpy()[keep]
+
+        return cls(np.asarray(actors, dtype=object), src[keep], dst[keep], edge_data, directed, actor_ids)
+
+    def number_of_nodes(self) -> int:
+        return len(self.actors)
+
+    def number_of_edges(self) -> int:
+        return len(self.src)
+
+    def adjacency(self, attribute: str = 'weight', dtype: Optional[np.dtype] = None) -> sparse.csr_matrix:
+        """Node-by-node matrix of one edge attribute.
+
+        Undirected graphs give a symmetric matrix (each edge stored both ways).
+
+        Args:
+            attribute: 'weight' or one of EDGE_ATTRIBUTES
+            dtype: Matrix dtype (defaults to the attribute's)
+
+        Returns:
+            scipy.sparse.csr_matrix of shape (number_of_nodes, number_of_nodes)
+        """
+        n = self.number_of_nodes()
+        rows, cols, data = self.src, self.dst, self.edge_data[attribute]
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        if not self.directed:
+            mirrored = rows != cols
+            rows, cols, data = (
+                np.concatenate([rows, cols[mirrored]]),
+                np.concatenate([cols, rows[mirrored]]),
+                np.concatenate([data, data[mirrored]]),
+            )
+        return sparse.csr_matrix((data, (rows, cols)), shape=(n, n))
+
+    def to_networkx(self) -> nx.Graph:
+        """Materialize as a NetworkX graph keyed by actor name.
+
+        Edges carry 'weight' and EDGE_ATTRIBUTES as Python scalars.
+
+        Returns:
+            NetworkX DiGraph or Graph
+        """
+        n, m = self.number_of_nodes(), self.number_of_edges()
+        # Edge index + 1 as matrix data, so no edge is an implicit zero
+        index = sparse.csr_matrix((np.arange(1, m + 1), (self.src, self.dst)), shape=(n, n))
+        G = nx.from_scipy_sparse_array(
+            index, create_using=nx.DiGraph if self.directed else nx.Graph, edge_attribute='edge'
+        )
+
+        columns = {attribute: values.tolist() for attribute, values in self.edge_data.items()}
+        for _, _, data in G.edges(data=True):
+            edge = data.pop('edge') - 1
+            for attribute, values in columns.items():
+                data[attribute] = values[edge]
+
+        return nx.relabel_nodes(G, dict(enumerate(self.actors.tolist())))
+
+    def subgraph(self, nodes: np.ndarray) -> 'SparseActorGraph':
+        """Induced subgraph on a set of node IDs.
+
+        Args:
+            nodes: Distinct node IDs; node i of the subgraph is nodes[i]
+
+        Returns:
+            SparseActorGraph with the edges between those nodes
+        """
+        n = self.number_of_nodes()
+        relabel = np.full(n, -1, dtype=np.int32)
+        relabel[nodes] = np.arange(len(nodes), dtype=np.int32)
+        keep = (relabel[self.src] >= 0) & (relabel[self.dst] >= 0)
+        return SparseActorGraph(
+            self.actors[nodes],
+            relabel[self.src[keep]],
+            relabel[self.dst[keep]],
+            {attribute: values[keep] for attribute, values in self.edge_data.items()},
+            self.directed,
+            None if self.actor_ids is None else self.actor_ids[nodes],
+        )
+
+
+def graph_fingerprint(G: Union[nx.Graph, SparseActorGraph]) -> str:
+    """Structural fingerprint of a graph.
+
+    Covers directedness, node/edge counts, node names in order and the CSR
+    structure of the adjacency, but not edge weights, so a graph and its
+    to_networkx() copy (or a graph rebuilt from the same interactions)
+    fingerprint the same.
+
+    Args:
+        G: NetworkX graph or SparseActorGraph
+
+    Returns:
+        Hex digest
+    """
+    if isinstance(G, SparseActorGraph):
+        nodes = G.actors.tolist()
+        adjacency = G.adjacency(dtype=np.int8)
+        directed, n_edges = G.directed, G.number_of_edges()
+    else:
+        nodes = list(G)
+        adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, dtype=np.int8, format='csr')
+        directed, n_edges = G.is_directed(), G.number_of_edges()
+    adjacency.sort_indices()
+
+    digest = hashlib.sha1(f"{directed}:{len(nodes)}:{n_edges}:".encode())
+    digest.update('\x1f'.join(map(str, nodes)).encode())
+    digest.update(adjacency.indptr.astype(np.int64).tobytes())
+    digest.update(adjacency.indices.astype(np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def k_hop_neighborhood(
+    adjacency: sparse.spmatrix,
+    seeds: np.ndarray,
+    k: int,
+    max_nodes: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """Nodes within k hops of a set of seed nodes.
+
+    Each hop is one product of the frontier, as a sparse boolean row vector,
+    with the boolean structure of the adjacency; the nodes it reaches that
+    were not reached before form the next frontier. Edges are followed from
+    row to column (successors, for a directed adjacency).
+
+    With max_nodes set, a hop that would overflow the budget keeps only the
+    new nodes with the largest total |weight| of edges from the frontier
+    (ties to the lower node ID) and expansion stops there. Seeds are always
+    kept, even beyond the budget.
+
+    Args:
+        adjacency: Square sparse adjacency (row = edge source)
+        seeds: Seed node IDs
+        k: Number of hops
+        max_nodes: Most nodes returned (optional)
+
+    Returns:
+        (node IDs ordered by hop then ID, hop distance of each node,
+        whether the budget stopped expansion)
+    """
+    adjacency = sparse.csr_matrix(adjacency)
+    n = adjacency.shape[0]
+    # Explicit zero weights are edges too
+    structure = sparse.csr_matrix(
+        (np.ones(len(adjacency.indices), dtype=bool), adjacency.indices, adjacency.indptr), shape=(n, n)
+    )
+
+    frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+    visited = np.zeros(n, dtype=bool)
+    visited[frontier] = True
+    layers = [frontier]
+    truncated = False
+
+    for _ in range(k):
+        vector = sparse.csr_matrix(
+            (np.ones(len(frontier), dtype=bool), (np.zeros(len(frontier), dtype=np.int64), frontier)), shape=(1, n)
+        )
+        reached = vector @ structure
+        new = reached.indices[reached.data]
+        new = np.sort(new[~visited[new]])
+        if len(new) == 0:
+            break
+
+        remaining = None if max_nodes is None else max(max_nodes - int(visited.sum()), 0)
+        if remaining is not None and len(new) > remaining:
+            weights = (vector.astype(np.float64) @ abs(adjacency)).toarray().ravel()[new]
+            new = np.sort(new[np.lexsort((new, -weights))[:remaining]])
+            truncated = True
+
+        visited[new] = True
+        layers.append(new)
+        frontier = new
+        if truncated:
+            break
+
+    nodes = np.concatenate(layers)
+    hops = np.repeat(np.arange(len(layers)), [len(layer) for layer in layers])
+    return nodes, hops, truncated
+
+
+def _rowsum_product(X: sparse.csr_matrix, Y: sparse.csr_matrix) -> np.ndarray:
+    """Row sums of the elementwise product X * Y."""
+    return np.asarray(X.multiply(Y).sum(axis=1)).ravel()
+
+
+class RunningAdjacency:
+    """Undirected graph over a fixed node-ID space, moved from edge set to edge set.
+
+    Each update() applies only the difference to the previous edge set (edge
+    additions and removals) to a running CSR adjacency and to per-node
+    degree, incidence and triangle counts, so the NetworkX metrics of
+    successive, overlapping graphs are produced without rebuilding them.
+    Edges are int64 keys u * n_nodes + v with u <= v (see edge_keys()).
+    """
+
+    def __init__(self, n_nodes: int):
+        """Start from the empty graph.
+
+        Args:
+            n_nodes: Size of the node-ID space
+        """
+        self.n_nodes = n_nodes
+        self.edges = np.empty(0, dtype=np.int64)
+        # Symmetric 0/1 adjacency without self-loops
+        self.adjacency = sparse.csr_matrix((n_nodes, n_nodes), dtype=np.int64)
+        # Neighbors other than the node itself
+        self.degree = np.zeros(n_nodes, dtype=np.int64)
+        # Edges touching each node, self-loops included: the node exists iff > 0
+        self.incidence = np.zeros(n_nodes, dtype=np.int64)
+        # diag(A^3): twice the number of triangles through each node
+        self.closed_walks = np.zeros(n_nodes, dtype=np.int64)
+
+    def edge_keys(self, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """Sorted, distinct edge keys of undirected (src, dst) node-ID pairs."""
+        src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+        return np.unique(np.minimum(src, dst) * self.n_nodes + np.maximum(src, dst))
+
+    def _delta_matrix(self, added: np.ndarray, removed: np.ndarray) -> sparse.csr_matrix:
+        """Symmetric +1/-1 matrix of added/removed edges, self-loops left out."""
+        keys = np.concatenate([added, removed])
+        signs = np.concatenate([np.ones(len(added), np.int64), -np.ones(len(removed), np.int64)])
+        u, v = keys // self.n_nodes, keys % self.n_nodes
+        loops = u == v
+        u, v, signs = u[~loops], v[~loops], signs[~loops]
+        return sparse.csr_matrix(
+            (np.concatenate([signs, signs]), (np.concatenate([u, v]), np.concatenate([v, u]))),
+            shape=(self.n_nodes, self.n_nodes)
+        )
+
+    def update(self, edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Move to a new edge set.
+
+        Args:
+            edges: Sorted, distinct edge keys (see edge_keys())
+
+        Returns:
+            (added, removed) edge keys
+        """
+        added = np.setdiff1d(edges, self.edges, assume_unique=True)
+        removed = np.setdiff1d(self.edges, edges, assume_unique=True)
+        self.edges = edges
+
+        for keys, sign in ((added, 1), (removed, -1)):
+            u, v = keys // self.n_nodes, keys % self.n_nodes
+            endpoints = np.concatenate([u, v[u != v]])
+            self.incidence += sign * np.bincount(endpoints, minlength=self.n_nodes)
+
+        delta = self._delta_matrix(added, removed)
+        if delta.nnz:
+            # B^3 - A^3 = B B D + B D A + D A A for B = A + D
+            A = self.adjacency
+            B = (A + delta).tocsr()
+            B.eliminate_zeros()
+            self.closed_walks += (
+                _rowsum_product(B, delta @ B)
+                + _rowsum_product(B @ delta, A)
+                + _rowsum_product(delta @ A, A)
+            )
+            self.degree += np.asarray(delta.sum(axis=1)).ravel()
+            self.adjacency = B
+
+        return added, removed
+
+    def number_of_nodes(self) -> int:
+        return int(np.count_nonzero(self.incidence))
+
+    def number_of_edges(self) -> int:
+        return len(self.edges)
+
+    def density(self) -> float:
+        """nx.density() of the current graph."""
+        n, m = self.number_of_nodes(), self.number_of_edges()
+        if m == 0 or n <= 1:
+            return 0
+        return m / (n * (n - 1)) * 2
+
+    def average_clustering(self) -> float:
+        """nx.average_clustering() of the current graph (up to summation order)."""
+        present = self.incidence > 0
+        if not present.any():
+            return 0.0
+        degree = self.degree[present].astype(np.float64)
+        closed_walks = self.closed_walks[present]
+        clustering = np.zeros(len(degree))
+        has_triangles = closed_walks > 0
+        clustering[has_triangles] = closed_walks[has_triangles] / (
+            degree[has_triangles] * (degree[has_triangles] - 1)
+        )
+        return float(clustering.sum() / len(clustering))
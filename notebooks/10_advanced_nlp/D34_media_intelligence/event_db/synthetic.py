@@ -0,0 +1,218 @@
+"""
+Synthetic GDELT Event Export Data
+
+Generates raw 58-column GDELT export frames and zipped export files so that
+tests and benchmarks can exercise the ingestion pipeline without network access.
+Values follow the shape of real exports: CAMEO codes as zero-padded strings,
+sparse actor/geo fields, and a skewed actor distribution.
+
+Author: KRL Team
+"""
+
+import zipfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .event_ingestion import GDELTEventIngestion
+
+# CAMEO codes seen in the mapping plus common unmapped ones
+CAMEO_CODES = [
+    '010', '011', '020', '036', '040', '042', '043', '046', '051', '057',
+    '061', '071', '072', '087', '090', '100', '101', '111', '112', '120',
+    '130', '138', '141', '1411', '143', '145', '1451', '172', '173', '180',
+    '181', '182', '190', '193', '195', '200', '202',
+]
+
+COUNTRIES = ['USA', 'GBR', 'FRA', 'DEU', 'CHN', 'RUS', 'IND', 'BRA', 'ZAF', 'NGA',
+             'MEX', 'JPN', 'KOR', 'ISR', 'PSE', 'UKR', 'TUR', 'IRN', 'EGY', 'KEN']
+
+ROLES = ['', 'GOV', 'LAB', 'EDU', 'MED', 'BUS', 'COP', 'MIL', 'OPP', 'CVL']
+
+
+def _quad_class(root: np.ndarray) -> np.ndarray:
+    """Map CAMEO root codes (1-20) to quad classes (1-4)."""
+    return np.select([root <= 5, root <= 8, root <= 15], [1, 2, 3], default=4)
+
+
+def synthetic_export_frame(
+    n_rows: int,
+    start_date: datetime = datetime(2024, 1, 1),
+    days: int = 1,
+    seed: int = 0,
+    first_event_id: int = 1_000_000_000,
+) -> pd.DataFrame:
+    """Generate a raw GDELT export frame.
+
+    Args:
+        n_rows: Number of events
+        start_date: First SQLDATE
+        days: Number of consecutive dates to spread events over
+        seed: Random seed
+        first_event_id: GLOBALEVENTID of the first row (IDs are consecutive)
+
+    Returns:
+        DataFrame with GDELTEventIngestion.GDELT_COLUMNS, as download_csv() returns it
+    """
+    rng = np.random.default_rng(seed)
+
+    # Actors: Zipf-like so a few actors dominate, as in real data
+    actor_pool = np.array([c + r for c in COUNTRIES for r in ROLES], dtype=object)
+    weights = 1.0 / np.arange(1, len(actor_pool) + 1)
+    weights /= weights.sum()
+
+    def actor_codes(missing_rate: float) -> np.ndarray:
+        codes = actor_pool[rng.choice(len(actor_pool), size=n_rows, p=weights)]
+        codes[rng.random(n_rows) < missing_rate] = None
+        return codes
+
+    actor1 = actor_codes(0.1)
+    actor2 = actor_codes(0.3)
+
+    dates = [start_date + timedelta(days=int(d)) for d in rng.integers(0, days, size=n_rows)]
+    sqldate = np.array([int(d.strftime('%Y%m%d')) for d in dates])
+    event_codes = np.array(CAMEO_CODES, dtype=object)[rng.integers(0, len(CAMEO_CODES), size=n_rows)]
+    root = np.array([int(c[:2]) for c in event_codes])
+
+    def geo(missing_rate: float) -> dict:
+        country = np.array(COUNTRIES, dtype=object)[rng.integers(0, len(COUNTRIES), size=n_rows)]
+        missing = rng.random(n_rows) < missing_rate
+        lat = rng.uniform(-60, 70, size=n_rows)
+        lon = rng.uniform(-180, 180, size=n_rows)
+        lat[missing] = np.nan
+        lon[missing] = np.nan
+        fullname = np.array([f"City {i % 997}, {c}" for i, c in enumerate(country)], dtype=object)
+        fullname[missing] = None
+        country = country.copy()
+        country[missing] = None
+        return {
+            'Type': np.where(missing, 0, rng.integers(1, 5, size=n_rows)),
+            'FullName': fullname,
+            'CountryCode': country,
+            'ADM1Code': np.where(missing, None, country),
+            'Lat': lat,
+            'Long': lon,
+            'FeatureID': np.where(missing, None, rng.integers(-99999, 99999, size=n_rows).astype(str)),
+        }
+
+    frame = {
+        'GLOBALEVENTID': np.arange(first_event_id, first_event_id + n_rows, dtype=np.int64),
+        'SQLDATE': sqldate,
+        'MonthYear': sqldate // 100,
+        'Year': sqldate // 10000,
+        'FractionDate': np.round(sqldate // 10000 + rng.random(n_rows), 4),
+    }
+    for prefix, codes in (('Actor1', actor1), ('Actor2', actor2)):
+        present = codes != None  # noqa: E711 - elementwise comparison
+        frame[f'{prefix}Code'] = codes
+        frame[f'{prefix}Name'] = np.where(present, codes, None)
+        frame[f'{prefix}CountryCode'] = np.array([c[:3] if c else None for c in codes], dtype=object)
+        for field in ('KnownGroupCode', 'EthnicCode', 'Religion1Code', 'Religion2Code'):
+            frame[f'{prefix}{field}'] = np.full(n_rows, None, dtype=object)
+        frame[f'{prefix}Type1Code'] = np.array([c[3:] or None if c else None for c in codes], dtype=object)
+        frame[f'{prefix}Type2Code'] = np.full(n_rows, None, dtype=object)
+        frame[f'{prefix}Type3Code'] = np.full(n_rows, None, dtype=object)
+
+    frame.update({
+        'IsRootEvent': rng.integers(0, 2, size=n_rows),
+        'EventCode': event_codes,
+        'EventBaseCode': np.array([c[:3] for c in event_codes], dtype=object),
+        'EventRootCode': np.array([c[:2] for c in event_codes], dtype=object),
+        'QuadClass': _quad_class(root),
+        'GoldsteinScale': np.round(rng.uniform(-10, 10, size=n_rows), 1),
+        'NumMentions': rng.integers(1, 50, size=n_rows),
+        'NumSources': rng.integers(1, 10, size=n_rows),
+        'NumArticles': rng.integers(1, 50, size=n_rows),
+        'AvgTone': np.round(rng.normal(-2, 4, size=n_rows), 2),
+    })
+    for prefix, missing_rate in (('Actor1Geo', 0.2), ('Actor2Geo', 0.4), ('ActionGeo', 0.1)):
+        for field, values in geo(missing_rate).items():
+            frame[f'{prefix}_{field}'] = values
+
+    frame['DATEADDED'] = np.array([int(d.strftime('%Y%m%d')) * 1_000_000 + 1500 for d in dates])
+    frame['SOURCEURL'] = np.array(
+        [f"https://news.example.com/{d}/{i}" for i, d in enumerate(sqldate)], dtype=object
+    )
+
+    df = pd.DataFrame(frame, columns=GDELTEventIngestion.GDELT_COLUMNS)
+    return df.astype({col: GDELTEventIngestion.PARSE_DTYPES[col] for col in df.columns})
+
+
+def to_v2_layout(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a raw export frame to the 61-column GDELT 2.0 15-minute layout.
+
+    Args:
+        df: Frame from synthetic_export_frame()
+
+    Returns:
+        Frame with GDELTEventIngestion.GDELT_V2_COLUMNS (ADM2 codes empty)
+    """
+    return df.reindex(columns=GDELTEventIngestion.GDELT_V2_COLUMNS)
+
+
+def write_export_zip(df: pd.DataFrame, path: Path, archive_name: Optional[str] = None) -> Path:
+    """Write a raw export frame as a GDELT-style tab-separated, headerless zip.
+
+    Args:
+        df: Frame from synthetic_export_frame()
+        path: Destination .zip path
+        archive_name: Name of the CSV inside the archive (defaults to path stem)
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    archive_name = archive_name or path.with_suffix('').name
+    payload = df.to_csv(sep='\t', header=False, index=False)
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(archive_name, payload)
+    return path
+
+
+def synthetic_interactions(
+    n_edges: int,
+    n_actors: Optional[int] = None,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Generate an actor interactions frame, as fetch_interactions() returns it.
+
+    Actor pairs are distinct and directed (no self-loops), with Zipf-like
+    actor popularity so a few hub actors take part in many pairs.
+
+    Args:
+        n_edges: Number of distinct actor pairs
+        n_actors: Size of the actor pool (defaults to n_edges // 10, at least 100)
+        seed: Random seed
+
+    Returns:
+        DataFrame with columns: actor1, actor2, event_count, avg_goldstein, avg_tone
+    """
+    rng = np.random.default_rng(seed)
+    n_actors = n_actors or max(100, n_edges // 10)
+    if n_edges > n_actors * (n_actors - 1):
+        raise ValueError(f"{n_actors} actors cannot form {n_edges} distinct pairs")
+
+    weights = 1.0 / np.arange(1, n_actors + 1) ** 0.8
+    weights /= weights.sum()
+
+    pairs = np.empty(0, dtype=np.int64)
+    while len(pairs) < n_edges:
+        size = 2 * (n_edges - len(pairs)) + 16
+        a1 = rng.choice(n_actors, size=size, p=weights)
+        a2 = rng.choice(n_actors, size=size, p=weights)
+        candidates = (a1 * n_actors + a2)[a1 != a2]
+        _, first = np.unique(np.concatenate([pairs, candidates]), return_index=True)
+        pairs = np.concatenate([pairs, candidates])[np.sort(first)]
+    pairs = pairs[:n_edges]
+
+    names = np.array([f"ACT{i:07d}" for i in range(n_actors)], dtype=object)
+    return pd.DataFrame({
+        'actor1': names[pairs // n_actors],
+        'actor2': names[pairs % n_actors],
+        'event_count': (rng.pareto(1.5, size=n_edges) * 5 + 5).astype('int32'),
+        'avg_goldstein': rng.uniform(-10, 10, size=n_edges).astype('float32'),
+        'avg_tone': rng.normal(-2, 4, size=n_edges).astype('float32'),
+    })
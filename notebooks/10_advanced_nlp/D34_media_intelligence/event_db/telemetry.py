@@ -0,0 +1,381 @@
+"""
+Ingestion Telemetry and Run Ledger
+
+Per-stage timers for the ingestion pipeline and a ledger of ingestion runs:
+- Stages ('download', 'parse', 'preprocess', 'load', 'rollups') record wall
+  time, CPU time of the running thread, rows and bytes
+- Each ingest_date call is one run; its per-stage totals and row counts are
+  appended to a JSON-lines file and the ingestion_runs table
+- prometheus_text() renders rows/s and bytes/s per stage in the Prometheus
+  text exposition format
+- summarize_runs() flags runs whose throughput falls well below the trailing
+  median of the runs before them
+
+Usage:
+    python -m event_db.telemetry --window 7 --threshold 0.5
+
+Author: KRL Team
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+from psycopg2.extras import Json
+
+from .config import DATABASE_CONFIG, INGESTION_CONFIG, LOGS_DIR
+from .schema import TableOnFirstUse
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('download', 'parse', 'preprocess', 'load', 'rollups')
+STAGE_FIELDS = ('calls', 'wall_sec', 'cpu_sec', 'rows', 'bytes')
+
+
+def _empty_stage() -> Dict[str, float]:
+    return dict.fromkeys(STAGE_FIELDS, 0)
+
+
+def _add_stages(target: Dict[str, Dict], stages: Dict[str, Dict]):
+    """Accumulate per-stage totals into target (in place)."""
+    for name, totals in stages.items():
+        stage = target.setdefault(name, _empty_stage())
+        for field in STAGE_FIELDS:
+            stage[field] += totals.get(field, 0)
+
+
+class IngestionRun:
+    """Per-stage totals for one ingest_date call."""
+
+    def __init__(self, date=None):
+        self.run_id = uuid.uuid4().hex
+        self.date = date
+        self.started_at = datetime.now()
+        self.stages: Dict[str, Dict] = {}
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def merge(self, stages: Dict[str, Dict]):
+        """Add stage totals measured elsewhere (e.g. in a worker process)."""
+        with self._lock:
+            _add_stages(self.stages, stages)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+
+class IngestionTelemetry:
+    """Stage timers, process-lifetime stage totals and the run ledger."""
+
+    def __init__(
+        self,
+        db_config: Optional[Dict] = None,
+        runs_log: Optional[Path] = None,
+        record_runs: Optional[bool] = None
+    ):
+        """Initialize telemetry.
+
+        Args:
+            db_config: PostgreSQL connection config holding ingestion_runs
+                (defaults to DATABASE_CONFIG)
+            runs_log: JSON-lines run ledger (defaults to INGESTION_CONFIG['runs_log'],
+                relative to LOGS_DIR)
+            record_runs: Persist finished runs to the ledger file and table;
+                defaults to INGESTION_CONFIG['telemetry']
+        """
+        self.db_config = db_config or DATABASE_CONFIG
+        self.runs_log = LOGS_DIR / (runs_log or INGESTION_CONFIG['runs_log'])
+        self.record_runs = INGESTION_CONFIG['telemetry'] if record_runs is None else record_runs
+        self.totals: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Ledger table, created from schema_events.sql if missing
+        self._runs_table = TableOnFirstUse('ingestion_runs', self.db_config)
+
+    @property
+    def current_run(self) -> Optional[IngestionRun]:
+        """Run the calling thread's stages are attributed to."""
+        return getattr(self._local, 'run', None)
+
+    @contextmanager
+    def activate(self, run: Optional[IngestionRun]):
+        """Attribute stages timed on this thread to a run."""
+        previous = self.current_run
+        self._local.run = run
+        try:
+            yield run
+        finally:
+            self._local.run = previous
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0, nbytes: int = 0):
+        """Time a pipeline stage.
+
+        Yields a dict whose 'rows' and 'bytes' entries the caller may set
+        once they are known (e.g. after parsing).
+
+        Args:
+            name: Stage name (see STAGES)
+            rows: Rows processed, if known up front
+            nbytes: Bytes processed, if known up front
+        """
+        counts = {'rows': rows, 'bytes': nbytes}
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield counts
+        finally:
+            measured = {name: {
+                'calls': 1,
+                'wall_sec': time.perf_counter() - wall_start,
+                'cpu_sec': time.thread_time() - cpu_start,
+                'rows': counts['rows'] or 0,
+                'bytes': counts['bytes'] or 0,
+            }}
+            with self._lock:
+                _add_stages(self.totals, measured)
+            if self.current_run is not None:
+                self.current_run.merge(measured)
+
+    def start_run(self, date=None) -> IngestionRun:
+        """Begin a run for a date (attribute stages to it with activate())."""
+        return IngestionRun(date)
+
+    def finish_run(self, run: IngestionRun, stats: Dict) -> Dict:
+        """Close a run and append it to the ledger file and table.
+
+        Ledger failures are logged rather than raised; the events are loaded.
+
+        Args:
+            run: Run from start_run()
+            stats: Statistics dict returned by ingest_date
+
+        Returns:
+            The run record
+        """
+        if stats['errors']:
+            status = 'errors'
+        elif stats['downloaded'] == 0:
+            status = 'no_data'
+        else:
+            status = 'completed'
+
+        stages = {name: dict(totals) for name, totals in run.stages.items()}
+        record = {
+            'run_id': run.run_id,
+            'date': str(stats.get('date', run.date)),
+            'started_at': run.started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'status': status,
+            'wall_sec': run.elapsed,
+            'cpu_sec': sum(s['cpu_sec'] for s in stages.values()),
+            'downloaded': stats['downloaded'],
+            'inserted': stats['inserted'],
+            'skipped': stats['skipped'],
+            'errors': stats['errors'],
+            'bytes_downloaded': stages.get('download', {}).get('bytes', 0),
+            'stages': stages,
+        }
+        if self.record_runs:
+            self._append_log(record)
+            self._insert_run(record)
+        return record
+
+    def _append_log(self, record: Dict):
+        try:
+            self.runs_log.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.runs_log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+        except OSError as e:
+            logger.warning(f"Could not append run to {self.runs_log}: {e}")
+
+    def _insert_run(self, record: Dict):
+        try:
+            with self._runs_table.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        INSERT INTO ingestion_runs (
+                            run_id, run_date, started_at, finished_at, status, wall_sec, cpu_sec,
+                            rows_downloaded, rows_inserted, rows_skipped, rows_errored,
+                            bytes_downloaded, stages
+                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """, (
+                        record['run_id'], record['date'], record['started_at'], record['finished_at'],
+                        record['status'], record['wall_sec'], record['cpu_sec'],
+                        record['downloaded'], record['inserted'], record['skipped'], record['errors'],
+                        record['bytes_downloaded'], Json(record['stages'])
+                    ))
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not record run {record['run_id']} in ingestion_runs: {e}")
+
+    def recent_runs(self, limit: int = 100) -> List[Dict]:
+        """Latest runs from the ingestion_runs table, oldest first."""
+        with self._runs_table.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT run_id, run_date, started_at, status, wall_sec, rows_downloaded, stages
+                FROM ingestion_runs ORDER BY started_at DESC LIMIT %s
+            """, (limit,))
+            rows = cursor.fetchall()
+        return [
+            {'run_id': r[0], 'date': str(r[1]), 'started_at': r[2].isoformat(), 'status': r[3],
+             'wall_sec': r[4], 'downloaded': r[5], 'stages': r[6]}
+            for r in reversed(rows)
+        ]
+
+    def prometheus_text(self) -> str:
+        """Process-lifetime stage totals in the Prometheus text format."""
+        with self._lock:
+            return prometheus_text(self.totals)
+
+
+def aggregate_stages(runs: Iterable[Dict]) -> Dict[str, Dict]:
+    """Sum the per-stage totals of run records."""
+    totals = {}
+    for run in runs:
+        _add_stages(totals, run['stages'])
+    return totals
+
+
+def prometheus_text(stages: Dict[str, Dict], prefix: str = 'gdelt_ingestion', windowed: bool = False) -> str:
+    """Render per-stage throughput in the Prometheus text exposition format.
+
+    Time, row and byte totals are counters, which Prometheus requires to only
+    go up. Totals over a sliding window of runs drop as old runs leave it, so
+    with windowed set they are rendered as gauges without the _total suffix.
+
+    Args:
+        stages: Stage name -> totals ({'calls', 'wall_sec', 'cpu_sec', 'rows', 'bytes'}),
+            e.g. IngestionTelemetry.totals or aggregate_stages(runs)
+        prefix: Metric name prefix
+        windowed: stages covers a window of recent runs rather than everything
+            since a fixed start
+
+    Returns:
+        Exposition text with rows/s and bytes/s gauges and time/row/byte
+        counters (gauges when windowed)
+    """
+    total_kind, total_suffix = ('gauge', '') if windowed else ('counter', '_total')
+    metrics = [
+        ('stage_rows_per_second', 'gauge', 'Rows processed per wall-clock second',
+         lambda s: s['rows'] / s['wall_sec'] if s['wall_sec'] else 0.0),
+        ('stage_bytes_per_second', 'gauge', 'Bytes processed per wall-clock second',
+         lambda s: s['bytes'] / s['wall_sec'] if s['wall_sec'] else 0.0),
+        ('stage_wall_seconds' + total_suffix, total_kind, 'Wall-clock seconds spent in the stage',
+         lambda s: s['wall_sec']),
+        ('stage_cpu_seconds' + total_suffix, total_kind, 'CPU seconds spent in the stage',
+         lambda s: s['cpu_sec']),
+        ('stage_rows' + total_suffix, total_kind, 'Rows processed by the stage', lambda s: s['rows']),
+        ('stage_bytes' + total_suffix, total_kind, 'Bytes processed by the stage', lambda s: s['bytes']),
+    ]
+    lines = []
+    for name, kind, help_text, value in metrics:
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for stage in sorted(stages):
+            lines.append(f'{prefix}_{name}{{stage="{stage}"}} {float(value(stages[stage])):.6g}')
+    return '\n'.join(lines) + '\n'
+
+
+def load_runs(path: Optional[Path] = None) -> List[Dict]:
+    """Read run records from a JSON-lines ledger.
+
+    Args:
+        path: Ledger file (defaults to INGESTION_CONFIG['runs_log'] under LOGS_DIR)
+
+    Returns:
+        Run records in file order (empty if the file does not exist)
+    """
+    path = LOGS_DIR / (path or INGESTION_CONFIG['runs_log'])
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize_runs(runs: Iterable[Dict], window: int = 7, threshold: float = 0.5) -> pd.DataFrame:
+    """Per-run throughput with slow runs flagged against the trailing median.
+
+    A run is flagged slow when its rows/s is below threshold times the median
+    rows/s of the `window` runs before it. The dominant stage (most wall
+    time) shows where a slow run spent its time.
+
+    Args:
+        runs: Run records (from load_runs(), recent_runs() or finish_run())
+        window: Number of preceding runs in the trailing median
+        threshold: Fraction of the trailing median below which a run is slow
+
+    Returns:
+        DataFrame ordered by started_at with date, run_id, status, rows,
+        wall_sec, rows_per_sec, trailing_median, slow, dominant_stage and
+        one <stage>_sec column per stage
+    """
+    records = []
+    for run in runs:
+        record = {
+            'date': run['date'],
+            'run_id': run['run_id'],
+            'started_at': run['started_at'],
+            'status': run['status'],
+            'rows': run['downloaded'],
+            'wall_sec': run['wall_sec'],
+        }
+        stage_times = {name: totals['wall_sec'] for name, totals in run['stages'].items()}
+        record['dominant_stage'] = max(stage_times, key=stage_times.get) if stage_times else None
+        record.update({f"{name}_sec": sec for name, sec in stage_times.items()})
+        records.append(record)
+
+    columns = ['date', 'run_id', 'started_at', 'status', 'rows', 'wall_sec', 'rows_per_sec',
+               'trailing_median', 'slow', 'dominant_stage']
+    if not records:
+        return pd.DataFrame(columns=columns)
+
+    df = pd.DataFrame(records).sort_values('started_at', kind='stable').reset_index(drop=True)
+    df['rows_per_sec'] = df['rows'] / df['wall_sec'].where(df['wall_sec'] > 0)
+    df['trailing_median'] = df['rows_per_sec'].shift(1).rolling(window, min_periods=1).median()
+    df['slow'] = (df['rows_per_sec'] < threshold * df['trailing_median']).fillna(False).astype(bool)
+
+    stage_columns = [f"{name}_sec" for name in STAGES if f"{name}_sec" in df.columns]
+    other_columns = sorted(set(df.columns) - set(columns) - set(stage_columns))
+    return df[columns + stage_columns + other_columns]
+
+
+def main():
+    """Report command: summarize the run ledger and flag slow runs."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="Summarize ingestion runs and flag slow ones")
+    parser.add_argument('--runs-log', type=Path, help='JSON-lines ledger (defaults to the configured one)')
+    parser.add_argument('--window', type=int, default=7, help='Runs in the trailing median')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='Flag runs below this fraction of the trailing median')
+    parser.add_argument('--prometheus', action='store_true', help='Print stage totals as Prometheus text')
+    args = parser.parse_args()
+
+    runs = load_runs(args.runs_log)
+    if args.prometheus:
+        print(prometheus_text(aggregate_stages(runs)), end='')
+        return
+
+    summary = summarize_runs(runs, window=args.window, threshold=args.threshold)
+    print(summary.to_string(index=False))
+    slow = summary[summary['slow']]
+    print(f"\n{len(slow)} of {len(summary)} runs below {args.threshold:.0%} of the trailing median")
+    for row in slow.itertuples(index=False):
+        print(f"  {row.date}: {row.rows_per_sec:,.0f} rows/s "
+              f"(median {row.trailing_median:,.0f}), mostly {row.dominant_stage}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,17 +12,67 @@ Perfect for MVP/prototype workflows:
 Author: KRL Team
 """
 
+import json
 import logging
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
 import networkx as nx
+from scipy import sparse
 from sklearn.cluster import DBSCAN
 
 logger = logging.getLogger(__name__)
 
+# Compiled mapping artifact written by event_db.cameo_mapping.CAMEOMapper
+# (read with numpy only; this module does not import event_db)
+CAMEO_ARTIFACT_PATH = Path(__file__).parent / "data" / "cameo_mapping.npz"
+CAMEO_ARTIFACT_VERSION = 1
+
+# Loaded artifacts keyed by (path, mtime): (source mapping, codes, table rows)
+_COMPILED_TABLES: Dict[Tuple[str, int], Tuple[Dict, np.ndarray, List[Dict]]] = {}
+
+
+def load_compiled_table(path: Path, mapping: Dict) -> Optional[Tuple[np.ndarray, List[Dict]]]:
+    """Sorted codes and categorize_event() results of a compiled CAMEO mapping artifact.
+    
+    Args:
+        path: Artifact from CAMEOMapper.export_mapping()
+        mapping: Mapping the artifact must have been compiled from
+        
+    Returns:
+        (sorted codes, result dict per code), or None if the artifact is
+        missing, of another version or compiled from a different mapping
+    """
+    try:
+        key = (str(path), Path(path).stat().st_mtime_ns)
+    except OSError:
+        return None
+    if key not in _COMPILED_TABLES:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(data['meta'].item())
+                if meta['version'] != CAMEO_ARTIFACT_VERSION:
+                    return None
+                codes, table = data['codes'], data['table']
+        except Exception as e:
+            logger.warning(f"Ignoring CAMEO mapping artifact {path}: {e}")
+            return None
+        rows = [
+            {'domain': meta['domains'][domain], 'category': meta['categories'][category], 'confidence': confidence}
+            for domain, category, confidence, _ in table.tolist()
+        ]
+        compiled = {
+            codes[i].item(): (rows[i]['domain'], rows[i]['category'], rows[i]['confidence'])
+            for i in np.flatnonzero(table['is_mapping'])
+        }
+        _COMPILED_TABLES[key] = (compiled, codes, rows)
+    
+    compiled, codes, rows = _COMPILED_TABLES[key]
+    return (codes, rows) if compiled == mapping else None
+
 
 class CAMEOMapperLite:
     """Lightweight CAMEO event code mapper (no file I/O)."""
@@ -66,6 +116,16 @@ class CAMEOMapperLite:
         '20': ('climate_and_environment', 'environmental_disaster', 0.80),
     }
     
+    def __init__(self, artifact_path: Optional[Path] = None):
+        """Initialize mapper.
+        
+        Args:
+            artifact_path: Compiled mapping artifact (defaults to
+                CAMEO_ARTIFACT_PATH); its lookup table serves categorize_series
+                when it was compiled from this CAMEO_MAPPING
+        """
+        self._compiled = load_compiled_table(artifact_path or CAMEO_ARTIFACT_PATH, self.CAMEO_MAPPING)
+    
     def categorize_event(self, event_code: str) -> Dict:
         """Categorize event by CAMEO code."""
         if not event_code:
@@ -92,6 +152,42 @@ class CAMEOMapperLite:
         
         return {'domain': 'uncategorized', 'category': 'unknown', 'confidence': 0.0}
     
+    def _category_results(self, categories) -> List[Dict]:
+        """categorize_event() for each category, from the compiled table where it has the code."""
+        results = [None] * len(categories)
+        strings = [i for i, code in enumerate(categories) if isinstance(code, str)]
+        if self._compiled is not None and strings:
+            codes, rows = self._compiled
+            wanted = np.array([categories[i] for i in strings], dtype=str)
+            found = np.minimum(np.searchsorted(codes, wanted), len(codes) - 1)
+            for i, position, hit in zip(strings, found.tolist(), (codes[found] == wanted).tolist()):
+                if hit:
+                    results[i] = rows[position]
+        return [result or self.categorize_event(code) for result, code in zip(results, categories)]
+    
+    def categorize_series(self, codes: pd.Series) -> pd.DataFrame:
+        """Categorize a column of CAMEO codes, once per distinct code.
+        
+        Args:
+            codes: CAMEO event codes (str, int or categorical)
+            
+        Returns:
+            DataFrame aligned with codes with 'domain' and 'category'
+            (categorical) and 'confidence' (float64) columns, identical in
+            value to categorize_event() per row
+        """
+        codes = codes.astype('category')
+        # Missing codes (categorical code -1) pick the trailing uncategorized row
+        lookup = self._category_results(list(codes.cat.categories)) + [self.categorize_event(None)]
+        positions = codes.cat.codes.to_numpy()
+        
+        result = {}
+        for col in ('domain', 'category'):
+            values = pd.Categorical([row[col] for row in lookup])
+            result[col] = pd.Categorical.from_codes(values.codes[positions], values.categories)
+        result['confidence'] = np.array([row['confidence'] for row in lookup], dtype='float64')[positions]
+        return pd.DataFrame(result, index=codes.index)
+    
     def categorize_dataframe(self, df: pd.DataFrame, event_code_col: str = 'EventCode') -> pd.DataFrame:
         """Apply CAMEO categorization to DataFrame.
         
@@ -109,10 +205,10 @@ class CAMEOMapperLite:
             df['category_confidence'] = 0.0
             return df
         
-        categorization = df[event_code_col].apply(self.categorize_event)
-        df['socioeconomic_domain'] = categorization.apply(lambda x: x['domain'])
-        df['socioeconomic_category'] = categorization.apply(lambda x: x['category'])
-        df['category_confidence'] = categorization.apply(lambda x: x['confidence'])
+        categorized = self.categorize_series(df[event_code_col])
+        df['socioeconomic_domain'] = categorized['domain']
+        df['socioeconomic_category'] = categorized['category']
+        df['category_confidence'] = categorized['confidence']
         
         return df
 
@@ -156,8 +252,9 @@ class ActorNetworkAnalyzerLite:
         if len(df) == 0:
             return pd.DataFrame(columns=['actor1', 'actor2', 'event_count', 'avg_goldstein', 'avg_tone'])
         
-        # Aggregate interactions
-        interactions = df.groupby([actor1_col, actor2_col]).agg({
+        # Aggregate interactions (observed=True: categorical actor columns must not
+        # expand to the cartesian product of all actor codes)
+        interactions = df.groupby([actor1_col, actor2_col], observed=True).agg({
             goldstein_col: 'mean',
             tone_col: 'mean',
             event_code_col: 'count'
@@ -188,17 +285,35 @@ class ActorNetworkAnalyzerLite:
         # Filter by minimum interactions
         interactions = interactions[interactions['event_count'] >= min_interactions]
         
-        G = nx.DiGraph() if directed else nx.Graph()
-        
-        for _, row in interactions.iterrows():
-            G.add_edge(
-                row['actor1'],
-                row['actor2'],
-                weight=row[weight_by],
-                event_count=row['event_count'],
-                avg_goldstein=row['avg_goldstein'],
-                avg_tone=row['avg_tone']
-            )
+        # Factorize actors into node IDs (in order of first appearance) and keep
+        # the last row of each repeated pair, as successive add_edge calls would
+        endpoints = np.empty(2 * len(interactions), dtype=object)
+        endpoints[0::2] = interactions['actor1'].to_numpy(dtype=object)
+        endpoints[1::2] = interactions['actor2'].to_numpy(dtype=object)
+        ids, actors = pd.factorize(endpoints)
+        src, dst = ids[0::2], ids[1::2]
+        if not directed:
+            src, dst = np.minimum(src, dst), np.maximum(src, dst)
+        _, last_reversed = np.unique((src * len(actors) + dst)[::-1], return_index=True)
+        keep = np.sort(len(interactions) - 1 - last_reversed)
+        
+        # Edge index + 1 as matrix data, so no edge is an implicit zero
+        index = sparse.csr_matrix(
+            (np.arange(1, len(keep) + 1), (src[keep], dst[keep])), shape=(len(actors), len(actors))
+        )
+        G = nx.from_scipy_sparse_array(
+            index, create_using=nx.DiGraph if directed else nx.Graph, edge_attribute='edge'
+        )
+        columns = {
+            attribute: interactions[column].to_numpy()[keep].tolist()
+            for attribute, column in (('weight', weight_by), ('event_count', 'event_count'),
+                                      ('avg_goldstein', 'avg_goldstein'), ('avg_tone', 'avg_tone'))
+        }
+        for _, _, data in G.edges(data=True):
+            edge = data.pop('edge') - 1
+            for attribute, values in columns.items():
+                data[attribute] = values[edge]
+        G = nx.relabel_nodes(G, dict(enumerate(actors.tolist())))
         
         logger.info(f"Built graph: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
         return G
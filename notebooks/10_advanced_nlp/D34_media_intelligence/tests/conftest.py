@@ -0,0 +1,150 @@
+"""
+Shared pytest fixtures for the Event DB test suite.
+
+Database-backed tests run against the server in DATABASE_CONFIG (POSTGRES_*
+environment variables) inside a throwaway schema, and are skipped when no
+server is reachable.
+"""
+
+import contextlib
+import functools
+import http.server
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Make the event_db package importable when running from this directory
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_db.config import DATABASE_CONFIG, INGESTION_CONFIG  # noqa: E402
+from event_db.pool import close_all, connection_params  # noqa: E402
+
+SCHEMA_PATH = Path(__file__).parent.parent / "event_db" / "schema_events.sql"
+# Variant files define only gdelt_events; schema_events.sql adds the shared objects
+PARTITIONED_SCHEMA_PATHS = (SCHEMA_PATH.with_name("schema_events_partitioned.sql"), SCHEMA_PATH)
+SPLIT_SCHEMA_PATHS = (SCHEMA_PATH.with_name("schema_events_split.sql"), SCHEMA_PATH)
+
+
+@pytest.fixture(autouse=True)
+def runs_log(tmp_path, monkeypatch):
+    """Keep the ingestion run ledger out of the repository's logs directory."""
+    path = tmp_path / "ingestion_runs.jsonl"
+    monkeypatch.setitem(INGESTION_CONFIG, 'runs_log', path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def cameo_artifact(tmp_path, monkeypatch):
+    """Keep the compiled CAMEO mapping artifact out of the repository's data directory."""
+    path = tmp_path / "cameo_mapping.npz"
+    monkeypatch.setattr('event_db.cameo_mapping.get_cameo_artifact_path', lambda: path)
+    return path
+
+
+@contextlib.contextmanager
+def throwaway_schema(*schema_paths: Path):
+    """Create a throwaway schema loaded with schema files, in order.
+
+    Yields:
+        psycopg2 connection kwargs whose search_path points at the schema
+    """
+    psycopg2 = pytest.importorskip("psycopg2")
+
+    try:
+        admin = psycopg2.connect(**connection_params(), connect_timeout=3)
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"PostgreSQL not available: {e}")
+
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    admin.autocommit = True
+    with admin.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}")
+        for schema_path in schema_paths:
+            cursor.execute(schema_path.read_text())
+
+    config = dict(DATABASE_CONFIG, options=f"-c search_path={schema}")
+    try:
+        yield config
+    finally:
+        close_all()
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
+
+
+@pytest.fixture
+def pg_config():
+    """Throwaway schema loaded with schema_events.sql (see throwaway_schema)."""
+    with throwaway_schema(SCHEMA_PATH) as config:
+        yield config
+
+
+@pytest.fixture
+def pg_partitioned_config():
+    """Throwaway schema loaded with schema_events_partitioned.sql (then schema_events.sql)."""
+    with throwaway_schema(*PARTITIONED_SCHEMA_PATHS) as config:
+        yield config
+
+
+@pytest.fixture
+def pg_split_config():
+    """Throwaway schema loaded with schema_events_split.sql (then schema_events.sql)."""
+    with throwaway_schema(*SPLIT_SCHEMA_PATHS) as config:
+        yield config
+
+
+def _connect(config):
+    import psycopg2
+
+    conn = psycopg2.connect(**connection_params(config))
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def pg_conn(pg_config):
+    """Connection into the throwaway schema from pg_config."""
+    yield from _connect(pg_config)
+
+
+@pytest.fixture
+def pg_conn_partitioned(pg_partitioned_config):
+    """Connection into the throwaway schema from pg_partitioned_config."""
+    yield from _connect(pg_partitioned_config)
+
+
+@pytest.fixture
+def pg_conn_split(pg_split_config):
+    """Connection into the throwaway schema from pg_split_config."""
+    yield from _connect(pg_split_config)
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_root(tmp_path):
+    """Serve a temporary directory over a local http.server.
+
+    Yields:
+        (directory, base_url) where base_url ends with '/'
+    """
+    root = tmp_path / "www"
+    root.mkdir()
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield root, f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,196 @@
+"""
+Tests for the actor dictionary and interned actor IDs (require PostgreSQL).
+
+Interned interaction queries are checked against the same queries grouped on
+the actor code text.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from event_db.actor_dictionary import ActorDictionary
+from event_db.actor_networks import ActorNetworkAnalyzer
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.synthetic import synthetic_export_frame
+
+START, END = datetime(2024, 1, 1), datetime(2024, 1, 31)
+SCHEMA_PATH = Path(__file__).parent.parent / "event_db" / "schema_events.sql"
+
+
+@pytest.fixture
+def events():
+    """2,000 preprocessed events over 2024-01-01 .. 2024-01-30."""
+    return GDELTEventIngestion(load_mode='batch').preprocess_events(
+        synthetic_export_frame(2_000, start_date=START, days=30)
+    )
+
+
+def read_sql(conn, query) -> pd.DataFrame:
+    with conn.cursor() as cursor:
+        cursor.execute(query)
+        columns = [c.name for c in cursor.description]
+        return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+
+def assert_ids_consistent(conn):
+    """Every event's actor IDs point at the dictionary entry of its actor codes."""
+    df = read_sql(conn, """
+        SELECT e.actor1_code, e.actor1_id, a1.actor_code AS code1,
+               e.actor2_code, e.actor2_id, a2.actor_code AS code2
+        FROM gdelt_events e
+        LEFT JOIN actors a1 ON a1.actor_id = e.actor1_id
+        LEFT JOIN actors a2 ON a2.actor_id = e.actor2_id
+    """)
+    assert len(df) > 0
+    for n in ('1', '2'):
+        assert (df[f'actor{n}_code'].isna() == df[f'actor{n}_id'].isna()).all()
+        present = df[f'actor{n}_code'].notna()
+        assert (df.loc[present, f'actor{n}_code'] == df.loc[present, f'code{n}']).all()
+
+
+def code_grouped(analyzer, conn, **kwargs) -> pd.DataFrame:
+    """fetch_interactions() rows from the query grouped on actor code text."""
+    query, params = analyzer._interactions_query(START, END, **kwargs)
+    df = pd.read_sql_query(query, conn, params=params).drop(columns='event_types')
+    return df.astype(ActorNetworkAnalyzer.INTERACTION_DTYPES).sort_values(['actor1', 'actor2'], ignore_index=True)
+
+
+class TestInterning:
+    """GDELTEventIngestion fills the actors dictionary and the event ID columns."""
+
+    @pytest.mark.parametrize('load_mode', ['batch', 'copy'])
+    def test_ids_assigned(self, pg_config, pg_conn, events, load_mode):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode=load_mode)
+        assert ingestion.load_events(events) == (len(events), 0, 0)
+        assert_ids_consistent(pg_conn)
+
+        actors = read_sql(pg_conn, "SELECT actor_code, actor_name FROM actors")
+        codes = set(events['Actor1Code'].dropna()) | set(events['Actor2Code'].dropna())
+        assert set(actors['actor_code']) == codes
+        # Synthetic actor names equal their codes
+        assert (actors['actor_code'] == actors['actor_name']).all()
+
+    def test_ids_stable_across_loads(self, pg_config, pg_conn, events):
+        GDELTEventIngestion(db_config=pg_config).load_events(events.iloc[:1_000])
+        before = read_sql(pg_conn, "SELECT actor_code, actor_id FROM actors")
+        GDELTEventIngestion(db_config=pg_config).load_events(events.iloc[1_000:])
+        after = read_sql(pg_conn, "SELECT actor_code, actor_id FROM actors")
+        assert before.merge(after, on='actor_code', suffixes=('', '_after')).eval('actor_id == actor_id_after').all()
+        assert_ids_consistent(pg_conn)
+
+    def test_split_schema(self, pg_split_config, pg_conn_split, events):
+        GDELTEventIngestion(db_config=pg_split_config, load_mode='copy').load_events(events)
+        assert_ids_consistent(pg_conn_split)
+
+
+class TestInternedQueries:
+    """Interaction queries grouped on actor IDs match the code-grouped queries."""
+
+    @pytest.fixture
+    def analyzer(self, pg_config, events):
+        GDELTEventIngestion(db_config=pg_config, load_mode='copy').load_events(events)
+        return ActorNetworkAnalyzer(pg_config)
+
+    @pytest.mark.parametrize('kwargs', [{}, {'countries': ['USA']}, {'min_goldstein': 0.0}])
+    def test_matches_code_grouped(self, analyzer, pg_conn, kwargs):
+        got = analyzer.fetch_interactions(START, END, **kwargs)
+        assert list(got.columns[-2:]) == ['actor1_id', 'actor2_id']
+        got = got.drop(columns=['event_types', 'actor1_id', 'actor2_id'])
+        pd.testing.assert_frame_equal(got.sort_values(['actor1', 'actor2'], ignore_index=True),
+                                      code_grouped(analyzer, pg_conn, **kwargs))
+
+    def test_top_n(self, analyzer):
+        everything = analyzer.fetch_interactions(START, END)
+        top = analyzer.fetch_interactions(START, END, top_n=5)
+        assert len(top) == 5
+        assert top['event_count'].tolist() == everything['event_count'].head(5).tolist()
+
+    def test_graph_keyed_by_actor_ids(self, analyzer, pg_conn):
+        graph = analyzer.build_sparse_graph(analyzer.fetch_interactions(START, END))
+        ids = read_sql(pg_conn, "SELECT actor_code, actor_id FROM actors").set_index('actor_code')['actor_id']
+        assert graph.actor_ids.tolist() == ids[graph.actors].tolist()
+
+
+class TestBackfill:
+    """Databases created before the actor dictionary are upgraded in place."""
+
+    @pytest.fixture
+    def legacy(self, pg_config, pg_conn, events):
+        """pg_config's schema without the dictionary, loaded with events."""
+        pg_conn.autocommit = True
+        with pg_conn.cursor() as cursor:
+            cursor.execute("DROP TABLE actors")
+            cursor.execute("DROP TABLE gdelt_events_staging")
+            cursor.execute("ALTER TABLE gdelt_events DROP COLUMN actor1_id, DROP COLUMN actor2_id")
+        GDELTEventIngestion(db_config=pg_config, load_mode='copy').load_events(events)
+        return pg_config
+
+    def test_backfill(self, legacy, pg_conn, events):
+        expected = code_grouped(ActorNetworkAnalyzer(legacy), pg_conn)
+
+        with_actors = events['Actor1Code'].notna() | events['Actor2Code'].notna()
+        assert ActorDictionary(legacy).backfill() == with_actors.sum()
+        assert_ids_consistent(pg_conn)
+        got = ActorNetworkAnalyzer(legacy).fetch_interactions(START, END)
+        got = got.drop(columns=['event_types', 'actor1_id', 'actor2_id'])
+        pd.testing.assert_frame_equal(got.sort_values(['actor1', 'actor2'], ignore_index=True), expected)
+
+        # Later loads intern their actors into the upgraded schema
+        more = GDELTEventIngestion(load_mode='batch').preprocess_events(
+            synthetic_export_frame(500, start_date=START, days=30, seed=1, first_event_id=2_000_000_000)
+        )
+        GDELTEventIngestion(db_config=legacy, load_mode='copy').load_events(more)
+        assert_ids_consistent(pg_conn)
+        assert ActorDictionary(legacy).backfill() == 0
+
+    def test_queries_group_on_codes_until_backfilled(self, legacy, pg_conn):
+        expected = code_grouped(ActorNetworkAnalyzer(legacy), pg_conn)
+        analyzer = ActorNetworkAnalyzer(legacy)
+
+        def fetched():
+            got = analyzer.fetch_interactions(START, END).drop(columns='event_types')
+            return got.sort_values(['actor1', 'actor2'], ignore_index=True)
+
+        # An actors table alone switches neither loads nor queries to IDs
+        with pg_conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE actors (actor_id SERIAL PRIMARY KEY, actor_code VARCHAR(50) NOT NULL UNIQUE,
+                                     actor_name TEXT)
+            """)
+            assert not ActorDictionary.has_actor_ids(cursor)
+        pd.testing.assert_frame_equal(fetched(), expected)
+
+        # ID columns but stored events not backfilled: nothing drops out
+        with pg_conn.cursor() as cursor:
+            cursor.execute(ActorDictionary.UPGRADE_SQL)
+            assert ActorDictionary.has_actor_ids(cursor) and not ActorDictionary.ids_complete(cursor)
+        pd.testing.assert_frame_equal(fetched(), expected)
+
+        ActorDictionary(legacy).backfill()
+        got = fetched()
+        assert list(got.columns[-2:]) == ['actor1_id', 'actor2_id']
+        pd.testing.assert_frame_equal(got.drop(columns=['actor1_id', 'actor2_id']), expected)
+
+    def test_rerunning_schema_file_upgrades(self, legacy, pg_conn, events):
+        with pg_conn.cursor() as cursor:
+            cursor.execute(SCHEMA_PATH.read_text())
+        columns = read_sql(pg_conn, """
+            SELECT table_name, column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND column_name IN ('actor1_id', 'actor2_id')
+        """)
+        assert sorted(columns.itertuples(index=False, name=None)) == [
+            ('gdelt_events', 'actor1_id'), ('gdelt_events', 'actor2_id'),
+            ('gdelt_events_staging', 'actor1_id'), ('gdelt_events_staging', 'actor2_id'),
+        ]
+
+        # New loads go through the pre-existing staging table with IDs
+        more = GDELTEventIngestion(load_mode='batch').preprocess_events(
+            synthetic_export_frame(500, start_date=START, days=30, seed=1, first_event_id=2_000_000_000)
+        )
+        assert GDELTEventIngestion(db_config=legacy, load_mode='copy').load_events(more) == (len(more), 0, 0)
+        with_actors = events['Actor1Code'].notna() | events['Actor2Code'].notna()
+        assert ActorDictionary(legacy).backfill() == with_actors.sum()
+        assert_ids_consistent(pg_conn)
@@ -0,0 +1,448 @@
+"""
+Tests for actor network construction and analysis.
+"""
+
+from datetime import datetime, timedelta
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from event_db.actor_networks import ActorNetworkAnalyzer
+from event_db.betweenness import estimate_betweenness
+from event_db.community_refinement import modularity, refine_partition
+from event_db.config import NETWORK_CONFIG
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.sparse_graph import RunningAdjacency, SparseActorGraph, graph_fingerprint
+from event_db.synthetic import synthetic_export_frame, synthetic_interactions
+from event_db_lite import ActorNetworkAnalyzerLite
+
+
+def add_edge_graph(interactions: pd.DataFrame, directed: bool, weight_by: str = 'event_count') -> nx.Graph:
+    """The one-add_edge-per-row construction the sparse builder replaces."""
+    G = nx.DiGraph() if directed else nx.Graph()
+    for _, row in interactions.iterrows():
+        G.add_edge(row['actor1'], row['actor2'], weight=row[weight_by], event_count=row['event_count'],
+                   avg_goldstein=row['avg_goldstein'], avg_tone=row['avg_tone'])
+    return G
+
+
+@pytest.fixture
+def interactions():
+    """Synthetic pairs plus a repeated pair, a reversed pair, a self-loop and a zero weight."""
+    df = synthetic_interactions(400, n_actors=60, seed=3)
+    extra = pd.DataFrame({
+        'actor1': [df['actor1'][0], df['actor2'][1], 'ACT9999999', 'ACT0000001'],
+        'actor2': [df['actor2'][0], df['actor1'][1], 'ACT9999999', 'ACT0000002'],
+        'event_count': [7, 9, 5, 6],
+        'avg_goldstein': [1.5, -2.0, 0.0, 0.0],
+        'avg_tone': [0.25, -1.0, 3.0, 0.0],
+    }).astype(df.dtypes.to_dict())
+    return pd.concat([df, extra], ignore_index=True)
+
+
+def assert_same_graph(G: nx.Graph, expected: nx.Graph):
+    assert type(G) is type(expected)
+    assert list(G.nodes) == list(expected.nodes)
+    assert nx.utils.graphs_equal(G, expected)
+
+
+class TestBuildGraph:
+    """build_graph matches one add_edge call per interaction."""
+
+    @pytest.mark.parametrize('directed', [True, False])
+    @pytest.mark.parametrize('weight_by', ['event_count', 'avg_goldstein'])
+    def test_matches_add_edge_loop(self, interactions, directed, weight_by):
+        G = ActorNetworkAnalyzer().build_graph(interactions, directed=directed, weight_by=weight_by)
+        assert_same_graph(G, add_edge_graph(interactions, directed, weight_by))
+
+    @pytest.mark.parametrize('directed', [True, False])
+    def test_lite_matches_add_edge_loop(self, interactions, directed):
+        G = ActorNetworkAnalyzerLite().build_graph(interactions, directed=directed, min_interactions=6)
+        expected = add_edge_graph(interactions[interactions['event_count'] >= 6], directed)
+        assert_same_graph(G, expected)
+
+    def test_empty(self, interactions):
+        G = ActorNetworkAnalyzer().build_graph(interactions.iloc[:0])
+        assert G.number_of_nodes() == G.number_of_edges() == 0
+        assert ActorNetworkAnalyzerLite().build_graph(interactions.iloc[:0]).number_of_nodes() == 0
+
+
+class TestSparseActorGraph:
+    """SparseActorGraph edge arrays and CSR adjacency."""
+
+    def test_adjacency(self, interactions):
+        graph = SparseActorGraph.from_interactions(interactions, directed=True)
+        expected = add_edge_graph(interactions, directed=True)
+        assert graph.number_of_nodes() == expected.number_of_nodes()
+        assert graph.number_of_edges() == expected.number_of_edges()
+
+        adjacency = graph.adjacency()
+        nodes = list(expected.nodes)
+        dense = nx.to_numpy_array(expected, nodelist=nodes, weight='weight')
+        np.testing.assert_array_equal(adjacency.toarray(), dense)
+        assert list(graph.actors) == nodes
+
+    def test_undirected_adjacency_is_symmetric(self, interactions):
+        graph = SparseActorGraph.from_interactions(interactions, directed=False)
+        adjacency = graph.adjacency('avg_tone')
+        assert (adjacency != adjacency.T).nnz == 0
+        dense = nx.to_numpy_array(add_edge_graph(interactions, directed=False),
+                                  nodelist=list(graph.actors), weight='avg_tone')
+        np.testing.assert_array_equal(adjacency.toarray(), dense)
+
+    @pytest.mark.parametrize('directed', [True, False])
+    def test_interned_ids_match_codes(self, interactions, directed):
+        n = len(interactions)
+        endpoints = pd.concat([interactions['actor1'], interactions['actor2']], ignore_index=True)
+        codes, _ = pd.factorize(endpoints, sort=True)
+        interned = interactions.assign(actor1_id=codes[:n] + 100, actor2_id=codes[n:] + 100)
+        graph = SparseActorGraph.from_interactions(interned, directed=directed)
+        expected = SparseActorGraph.from_interactions(interactions, directed=directed)
+        assert graph.actors.tolist() == expected.actors.tolist()
+        assert (graph.adjacency() != expected.adjacency()).nnz == 0
+        id_of = dict(zip(endpoints, codes + 100))
+        assert graph.actor_ids.tolist() == [id_of[actor] for actor in graph.actors]
+        assert expected.actor_ids is None
+
+    def test_missing_actor_rejected(self, interactions):
+        interactions = interactions.astype({'actor2': object})
+        interactions.loc[0, 'actor2'] = None
+        with pytest.raises(ValueError):
+            SparseActorGraph.from_interactions(interactions)
+
+
+class TestCentrality:
+    """Metric-selective, memoized centrality."""
+
+    @pytest.fixture
+    def graph(self, interactions):
+        return ActorNetworkAnalyzer().build_graph(interactions, directed=False)
+
+    def test_all_metrics_match_networkx(self, graph):
+        centrality = ActorNetworkAnalyzer().calculate_centrality(graph)
+        degree = nx.degree_centrality(graph)
+        betweenness = nx.betweenness_centrality(graph)
+        eigenvector = nx.eigenvector_centrality(graph, max_iter=1000)
+        assert list(centrality) == list(graph)
+        for node, scores in centrality.items():
+            assert scores['degree'] == degree[node]
+            assert scores['betweenness'] == betweenness[node]
+            assert scores['eigenvector'] == eigenvector[node]
+
+    def test_only_requested_metrics_computed(self, graph, monkeypatch):
+        monkeypatch.setattr(nx, 'betweenness_centrality', lambda *a, **k: pytest.fail("betweenness computed"))
+        centrality = ActorNetworkAnalyzer().calculate_centrality(graph, metrics=['degree', 'eigenvector'])
+        assert set(next(iter(centrality.values()))) == {'degree', 'eigenvector'}
+        with pytest.raises(ValueError):
+            ActorNetworkAnalyzer().calculate_centrality(graph, metrics=['pagerank'])
+
+    def test_memoized_per_graph_fingerprint(self, interactions, monkeypatch):
+        calls = []
+        betweenness = nx.betweenness_centrality
+        monkeypatch.setattr(nx, 'betweenness_centrality', lambda G, **k: calls.append(1) or betweenness(G, **k))
+
+        analyzer = ActorNetworkAnalyzer()
+        first = analyzer.get_top_actors(analyzer.build_graph(interactions), metric='betweenness', n=5)
+        rebuilt = analyzer.build_graph(interactions)
+        assert analyzer.get_top_actors(rebuilt, metric='betweenness', n=5) == first
+        assert len(calls) == 1
+
+        rebuilt.add_edge('ACT0000001', 'NEWACTOR')
+        analyzer.get_top_actors(rebuilt, metric='betweenness', n=5)
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize('metric', ['degree', 'betweenness', 'eigenvector'])
+    @pytest.mark.parametrize('n', [1, 10, 1000])
+    def test_top_actors_match_stable_sort(self, graph, metric, n):
+        analyzer = ActorNetworkAnalyzer()
+        centrality = analyzer.calculate_centrality(graph)
+        expected = sorted(((node, scores[metric]) for node, scores in centrality.items()),
+                          key=lambda x: x[1], reverse=True)[:n]
+        assert analyzer.get_top_actors(graph, metric=metric, n=n) == expected
+
+    def test_fingerprint(self, interactions):
+        sparse_graph = SparseActorGraph.from_interactions(interactions, directed=False)
+        G = sparse_graph.to_networkx()
+        assert graph_fingerprint(G) == graph_fingerprint(sparse_graph)
+        assert graph_fingerprint(G) != graph_fingerprint(G.to_directed())
+        G.remove_edge(*next(iter(G.edges())))
+        assert graph_fingerprint(G) != graph_fingerprint(sparse_graph)
+
+
+class TestRunningAdjacency:
+    """Delta-maintained metrics match NetworkX on each successive graph."""
+
+    def test_sliding_edge_sets_match_networkx(self):
+        rng = np.random.default_rng(5)
+        n_nodes = 40
+        running = RunningAdjacency(n_nodes)
+        edges = np.empty((0, 2), dtype=np.int64)
+        for step in range(25):
+            # Drop a random third of the edges, add new ones (self-loops included)
+            edges = edges[rng.random(len(edges)) > 0.33]
+            edges = np.vstack([edges, rng.integers(0, n_nodes, size=(rng.integers(0, 60), 2))])
+            if step == 12:
+                edges = edges[:0]
+
+            running.update(running.edge_keys(edges[:, 0], edges[:, 1]))
+            G = nx.Graph()
+            G.add_edges_from(edges.tolist())
+            assert running.number_of_nodes() == G.number_of_nodes()
+            assert running.number_of_edges() == G.number_of_edges()
+            assert running.density() == pytest.approx(nx.density(G))
+            expected = nx.average_clustering(G) if G.number_of_nodes() else 0.0
+            assert running.average_clustering() == pytest.approx(expected)
+
+    def test_update_returns_delta(self):
+        running = RunningAdjacency(5)
+        running.update(running.edge_keys([0, 1], [1, 2]))
+        added, removed = running.update(running.edge_keys([2, 3], [1, 4]))
+        assert added.tolist() == running.edge_keys([3], [4]).tolist()
+        assert removed.tolist() == running.edge_keys([0], [1]).tolist()
+
+
+class TestTemporalEvolution:
+    """The single-query, incremental evolution matches per-window analysis (requires PostgreSQL)."""
+
+    START = datetime(2024, 1, 1)
+
+    @pytest.fixture
+    def analyzer(self, pg_config):
+        events = GDELTEventIngestion(load_mode='batch').preprocess_events(
+            synthetic_export_frame(20_000, start_date=self.START, days=30)
+        )
+        GDELTEventIngestion(db_config=pg_config, load_mode='copy').load_events(events)
+        analyzer = ActorNetworkAnalyzer(pg_config)
+        # Deterministic stand-in for Louvain
+        analyzer.detect_communities = lambda G: {
+            node: i for i, component in enumerate(nx.connected_components(G)) for node in component
+        }
+        return analyzer
+
+    def per_window(self, analyzer, start, end, window_days, domain=None):
+        """One fetch_interactions() and one graph per window."""
+        results = []
+        for window_start, window_end in analyzer._windows(start, end, window_days):
+            interactions = analyzer.fetch_interactions(window_start, window_end, domain=domain)
+            if len(interactions) == 0:
+                continue
+            G = analyzer.build_graph(interactions, directed=False)
+            results.append({
+                'window_start': window_start,
+                'window_end': window_end,
+                'num_nodes': G.number_of_nodes(),
+                'num_edges': G.number_of_edges(),
+                'density': nx.density(G),
+                'avg_clustering': nx.average_clustering(G),
+                'num_communities': len(set(analyzer.detect_communities(G).values())),
+            })
+        return results
+
+    @pytest.mark.parametrize('start, days, window_days', [
+        (START, 30, 7),                                   # windows start at midnight: shared boundary dates
+        (START + timedelta(hours=9), 29, 3),              # windows start mid-day
+        (START, 40, 10),                                  # trailing windows without events
+    ])
+    def test_matches_per_window_analysis(self, analyzer, start, days, window_days):
+        end = start + timedelta(days=days)
+        evolution = analyzer.analyze_temporal_evolution(start, end, window_days=window_days)
+        expected = self.per_window(analyzer, start, end, window_days)
+
+        assert len(evolution) == len(expected) > 0
+        for row, reference in zip(evolution, expected):
+            assert row == dict(reference, density=pytest.approx(reference['density']),
+                               avg_clustering=pytest.approx(reference['avg_clustering']))
+
+    def test_windowed_fetch_matches_per_window_fetch(self, analyzer):
+        end = self.START + timedelta(days=30)
+        windowed = analyzer.fetch_windowed_interactions(self.START, end, window_days=7)
+        for index, (window_start, window_end) in enumerate(analyzer._windows(self.START, end, 7)):
+            key = ['actor1', 'actor2']
+            got = windowed[windowed['window_index'] == index].drop(columns='window_index')
+            want = analyzer.fetch_interactions(window_start, window_end).drop(columns='event_types')
+            pd.testing.assert_frame_equal(got.sort_values(key, ignore_index=True),
+                                          want.sort_values(key, ignore_index=True))
+
+
+def planted_graph(groups: int = 4, size: int = 10, seed: int = 0) -> nx.Graph:
+    """Dense groups of `size` actors with a few edges between groups."""
+    G = nx.planted_partition_graph(groups, size, 0.8, 0.02, seed=seed)
+    nx.set_edge_attributes(G, 1, 'weight')
+    return nx.relabel_nodes(G, {node: f"A{node:03d}" for node in G})
+
+
+class TestWarmStartCommunities:
+    """Warm-started community refinement."""
+
+    def test_modularity_matches_networkx(self, interactions):
+        G = ActorNetworkAnalyzer().build_graph(interactions, directed=False)
+        nodes = list(G)
+        adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, weight='weight', format='csr')
+        labels = np.arange(len(nodes)) % 5
+        communities = [{node for node, label in zip(nodes, labels) if label == c} for c in range(5)]
+        assert modularity(adjacency, labels) == pytest.approx(nx.community.modularity(G, communities))
+
+    def test_cold_refinement_finds_planted_groups(self):
+        G = planted_graph()
+        adjacency = nx.to_scipy_sparse_array(G, nodelist=list(G), format='csr')
+        refinement = refine_partition(adjacency, np.arange(G.number_of_nodes()))
+        assert refinement.modularity > refinement.seed_modularity
+        assert refinement.modularity == pytest.approx(modularity(adjacency, refinement.labels))
+        assert len(set(refinement.labels.tolist())) <= 6
+
+    def test_lineage_warm_start_refines_locally(self):
+        analyzer = ActorNetworkAnalyzer()
+        G = planted_graph()
+        first = analyzer.detect_communities(G, lineage='weekly')
+
+        G.add_edge('A000', 'NEW', weight=3)
+        G.remove_edge(*next(iter(G.edges('A020'))))
+        update = analyzer.warm_start_communities(G, lineage='weekly')
+
+        assert update.evaluations < G.number_of_nodes()
+        assert 'NEW' in update.partition and set(update.partition) == set(G)
+        assert update.partition['NEW'] == update.partition['A000']
+        nodes = list(G)
+        adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, format='csr')
+        labels = np.array([update.partition[node] for node in nodes])
+        assert update.modularity == pytest.approx(modularity(adjacency, labels))
+
+        # Same graph again: nothing changed, nothing to evaluate
+        again = analyzer.warm_start_communities(G, lineage='weekly')
+        assert again.evaluations == 0 and again.modularity_delta == 0
+        assert again.partition == update.partition
+
+        # Untouched groups keep their communities
+        same_group = [node for node in first if first[node] == first['A035']]
+        assert len({update.partition[node] for node in same_group}) == 1
+
+    def test_explicit_previous_partition(self, monkeypatch):
+        analyzer = ActorNetworkAnalyzer()
+        G = planted_graph(seed=1)
+        previous = {node: int(node[1:]) // 10 for node in G}
+        monkeypatch.setattr(nx.community, 'greedy_modularity_communities', lambda *a, **k: pytest.fail("cold start"))
+        partition = analyzer.detect_communities(G, previous=previous)
+        assert set(partition) == set(G)
+        with pytest.raises(ValueError):
+            analyzer.warm_start_communities(G, lineage='unknown')
+
+
+class TestParallelBetweenness:
+    """Pivot-batched betweenness estimator."""
+
+    @pytest.mark.parametrize('directed', [True, False])
+    @pytest.mark.parametrize('normalized', [True, False])
+    def test_all_pivots_is_exact(self, interactions, directed, normalized):
+        G = ActorNetworkAnalyzer().build_graph(interactions, directed=directed)
+        nodes = list(G)
+        adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format='csr')
+        estimate = estimate_betweenness(adjacency, directed=directed, normalized=normalized,
+                                        workers=1, batch_size=7)
+        expected = nx.betweenness_centrality(G, normalized=normalized)
+        np.testing.assert_allclose(estimate.scores, [expected[node] for node in nodes], rtol=1e-9, atol=1e-12)
+        assert estimate.pivots == len(nodes) and estimate.max_error == 0.0
+
+    def test_reproducible_across_worker_counts(self, interactions):
+        G = ActorNetworkAnalyzer().build_graph(interactions, directed=False)
+        adjacency = nx.to_scipy_sparse_array(G, weight=None, format='csr')
+        serial = estimate_betweenness(adjacency, pivots=30, batch_size=4, workers=1, seed=11)
+        parallel = estimate_betweenness(adjacency, pivots=30, batch_size=4, workers=2, seed=11)
+        np.testing.assert_array_equal(serial.scores, parallel.scores)
+        assert serial.pivots == parallel.pivots == 30
+        assert serial.max_error > 0
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_tolerance_stops_early(self, interactions, workers):
+        G = ActorNetworkAnalyzer().build_graph(interactions, directed=False)
+        adjacency = nx.to_scipy_sparse_array(G, weight=None, format='csr')
+        estimate = estimate_betweenness(adjacency, batch_size=5, workers=workers,
+                                        tolerance=1.0, min_pivots=10)
+        assert estimate.pivots == 10 and estimate.batches == 2
+        assert estimate.max_error <= 1.0
+
+    def test_large_graph_centrality_uses_seeded_estimator(self, monkeypatch):
+        monkeypatch.setitem(NETWORK_CONFIG, 'betweenness_pivots', 50)
+        monkeypatch.setitem(NETWORK_CONFIG, 'betweenness_workers', 1)
+        monkeypatch.setattr(nx, 'betweenness_centrality', lambda *a, **k: pytest.fail("networkx betweenness"))
+        G = ActorNetworkAnalyzer().build_graph(synthetic_interactions(1_000, n_actors=200, seed=2))
+        first = ActorNetworkAnalyzer().calculate_centrality(G, metrics=['betweenness'])
+        second = ActorNetworkAnalyzer().calculate_centrality(G, metrics=['betweenness'])
+        assert first == second
+        assert max(scores['betweenness'] for scores in first.values()) > 0
+
+
+def traversal_subgraph(G: nx.Graph, nodes: set, k_hop: int) -> nx.Graph:
+    """The node-by-node neighbor traversal the sparse expansion replaces."""
+    neighborhood = set(nodes)
+    for _ in range(k_hop):
+        new_neighbors = set()
+        for node in neighborhood:
+            if node in G:
+                new_neighbors.update(G.neighbors(node))
+        neighborhood.update(new_neighbors)
+    return G.subgraph(neighborhood)
+
+
+class TestSubgraph:
+    """Sparse k-hop subgraph extraction."""
+
+    @pytest.fixture
+    def hub(self, interactions):
+        """Actor with the most interactions."""
+        return pd.concat([interactions['actor1'], interactions['actor2']]).value_counts().index[0]
+
+    @pytest.mark.parametrize('directed', [True, False])
+    @pytest.mark.parametrize('k_hop', [0, 1, 2])
+    def test_matches_traversal(self, interactions, hub, directed, k_hop):
+        analyzer = ActorNetworkAnalyzer()
+        G = analyzer.build_graph(interactions, directed=directed)
+        seeds = {hub, 'ACT0000001', 'NOT_AN_ACTOR'}
+        expected = traversal_subgraph(G, seeds, k_hop)
+
+        assert_same_graph(analyzer.get_subgraph(G, seeds, k_hop=k_hop), expected)
+        sparse_graph = analyzer.build_sparse_graph(interactions, directed=directed)
+        got = analyzer.get_subgraph(sparse_graph, seeds, k_hop=k_hop)
+        assert set(got.nodes) == set(expected.nodes)
+        assert nx.utils.graphs_equal(got, expected)
+
+    @pytest.mark.parametrize('directed', [True, False])
+    def test_sparse_output(self, interactions, hub, directed):
+        analyzer = ActorNetworkAnalyzer()
+        G = analyzer.build_graph(interactions, directed=directed)
+        nodes, adjacency = analyzer.get_subgraph(G, {hub}, k_hop=2, output='sparse')
+        assert nodes[0] == hub
+        assert set(nodes) == set(traversal_subgraph(G, {hub}, 2).nodes)
+        expected = nx.to_scipy_sparse_array(G.subgraph(nodes), nodelist=nodes, weight='weight')
+        np.testing.assert_array_equal(adjacency.toarray(), expected.toarray())
+        with pytest.raises(ValueError):
+            analyzer.get_subgraph(G, {hub}, output='dict')
+
+    def test_node_budget_keeps_top_weighted(self, interactions, hub):
+        analyzer = ActorNetworkAnalyzer()
+        G = analyzer.build_graph(interactions, directed=False)
+        neighbors = sorted(G[hub], key=lambda node: (-abs(G[hub][node]['weight']), list(G).index(node)))
+        assert len(neighbors) > 5
+
+        nodes, _ = analyzer.get_subgraph(G, {hub}, k_hop=3, max_nodes=6, output='sparse')
+        assert nodes[0] == hub and len(nodes) == 6
+        # Ties broken towards the lower node ID, i.e. earlier in G's node order
+        assert set(nodes[1:]) == set(neighbors[:5])
+
+        # Budget binding at the second hop: every first-hop neighbor, then the best second-hop ones
+        second_hop = set(traversal_subgraph(G, {hub}, 2).nodes) - set(G[hub]) - {hub}
+        assert len(second_hop) >= 2
+        budget = len(G[hub]) + 1 + len(second_hop) // 2
+        subgraph = analyzer.get_subgraph(G, {hub}, k_hop=2, max_nodes=budget)
+        assert subgraph.number_of_nodes() == budget
+        assert set(G[hub]) < set(subgraph.nodes)
+
+    def test_seeds_kept_beyond_budget(self, interactions, hub):
+        G = ActorNetworkAnalyzer().build_graph(interactions, directed=False)
+        seeds = set(list(G)[:4])
+        subgraph = ActorNetworkAnalyzer().get_subgraph(G, seeds, k_hop=2, max_nodes=2)
+        assert set(subgraph.nodes) == seeds
+
+    def test_empty_graph(self):
+        assert ActorNetworkAnalyzer().get_subgraph(nx.Graph(), {'USA'}).number_of_nodes() == 0
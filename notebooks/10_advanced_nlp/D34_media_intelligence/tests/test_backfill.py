@@ -0,0 +1,165 @@
+"""
+Tests for the resumable backfill work queue.
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime
+
+import pytest
+
+from event_db.backfill import BackfillQueue, backoff_delay
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.synthetic import synthetic_export_frame, write_export_zip
+
+
+def ok_stats(day, inserted=10) -> dict:
+    return {'date': day, 'downloaded': inserted, 'inserted': inserted, 'skipped': 0,
+            'errors': 0, 'duration_sec': 0.0}
+
+
+@pytest.fixture
+def ingestion(pg_config):
+    return GDELTEventIngestion(db_config=pg_config, load_mode='copy')
+
+
+def queue_rows(pg_conn) -> dict:
+    with pg_conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT work_date, state, attempts, last_error, duration_sec,
+                   EXTRACT(EPOCH FROM next_attempt_at - updated_at)::float8
+            FROM backfill_queue
+        """)
+        return {r[0]: r[1:] for r in cursor.fetchall()}
+
+
+class TestBackoffDelay:
+    """Tests for exponential backoff with jitter."""
+
+    def test_doubles_within_jitter_bounds(self):
+        rng = random.Random(0)
+        for attempts, full in [(1, 10), (2, 20), (3, 40)]:
+            delays = [backoff_delay(attempts, 10, 1000, rng) for _ in range(200)]
+            assert full / 2 <= min(delays) and max(delays) <= full
+            assert len(set(delays)) > 1
+
+    def test_capped(self):
+        assert backoff_delay(30, 10, 100, random.Random(0)) <= 100
+
+
+class TestBackfillQueue:
+    """Tests for planning, claiming and retrying dates (require PostgreSQL)."""
+
+    def test_plan_is_idempotent(self, ingestion):
+        queue = BackfillQueue(ingestion)
+        assert queue.plan(datetime(2024, 1, 1), datetime(2024, 1, 10)) == 10
+        assert queue.plan(date(2024, 1, 5), date(2024, 1, 12)) == 2
+        assert queue.status() == {'pending': 12, 'running': 0, 'completed': 0, 'failed': 0}
+
+    def test_plan_rejects_reversed_range(self, ingestion):
+        with pytest.raises(ValueError):
+            BackfillQueue(ingestion).plan(date(2024, 1, 2), date(2024, 1, 1))
+
+    def test_drain_records_outcome(self, ingestion, pg_conn, monkeypatch):
+        monkeypatch.setattr(ingestion, 'ingest_date', ok_stats)
+        queue = BackfillQueue(ingestion)
+        queue.plan(date(2024, 1, 1), date(2024, 1, 3))
+
+        results = queue.run_worker()
+
+        assert [r['date'] for r in results] == [datetime(2024, 1, d) for d in (1, 2, 3)]
+        rows = queue_rows(pg_conn)
+        assert {r[:3] for r in rows.values()} == {('completed', 1, None)}
+        assert all(r[3] is not None for r in rows.values())
+
+    def test_concurrent_workers_never_share_a_date(self, ingestion, monkeypatch):
+        processed = []
+
+        def slow_ingest(day):
+            time.sleep(0.01)
+            processed.append(day)
+            return ok_stats(day)
+
+        monkeypatch.setattr(ingestion, 'ingest_date', slow_ingest)
+        BackfillQueue(ingestion).plan(date(2024, 1, 1), date(2024, 1, 30))
+
+        workers = [BackfillQueue(ingestion, worker_id=f"worker-{i}") for i in range(4)]
+        threads = [threading.Thread(target=w.run_worker) for w in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(processed) == 30
+        assert set(Counter(processed).values()) == {1}
+        assert workers[0].status()['completed'] == 30
+
+    def test_failed_attempt_retried_after_backoff(self, ingestion, pg_conn, monkeypatch):
+        calls = Counter()
+
+        def flaky_ingest(day):
+            calls[day] += 1
+            if calls[day] == 1:
+                raise ConnectionError("reset by peer")
+            return ok_stats(day)
+
+        monkeypatch.setattr(ingestion, 'ingest_date', flaky_ingest)
+        queue = BackfillQueue(ingestion, backoff_base=0.4)
+        queue.plan(date(2024, 1, 1), date(2024, 1, 1))
+
+        assert queue.run_worker(wait=False) == []
+        state, attempts, error, _, delay = queue_rows(pg_conn)[date(2024, 1, 1)]
+        assert (state, attempts, error) == ('pending', 1, 'ConnectionError: reset by peer')
+        assert 0.2 <= delay <= 0.4 + 1e-3
+
+        assert len(queue.run_worker()) == 1
+        assert queue_rows(pg_conn)[date(2024, 1, 1)][:3] == ('completed', 2, None)
+
+    def test_permanent_failure_after_max_attempts(self, ingestion, pg_conn, monkeypatch):
+        monkeypatch.setattr(ingestion, 'ingest_date', lambda day: dict(ok_stats(day), downloaded=0))
+        queue = BackfillQueue(ingestion, max_attempts=3, backoff_base=0)
+        queue.plan(date(2024, 1, 1), date(2024, 1, 2))
+
+        assert len(queue.run_worker()) == 6
+        assert queue.status()['failed'] == 2
+        assert queue.failures()[0] == {'date': date(2024, 1, 1), 'attempts': 3,
+                                       'last_error': 'No events downloaded'}
+
+        assert queue.retry_failed() == 2
+        assert queue_rows(pg_conn)[date(2024, 1, 1)][:2] == ('pending', 0)
+
+    def test_expired_lease_is_reclaimed(self, ingestion):
+        crashed = BackfillQueue(ingestion, worker_id='crashed')
+        crashed.plan(date(2024, 1, 1), date(2024, 1, 1))
+        assert crashed.claim() == (date(2024, 1, 1), 1)
+
+        assert BackfillQueue(ingestion, worker_id='patient').claim() is None
+        rescuer = BackfillQueue(ingestion, worker_id='rescuer', lease=0)
+        assert rescuer.claim() == (date(2024, 1, 1), 2)
+
+        # The original worker's late result no longer counts
+        assert not crashed.complete(date(2024, 1, 1), ok_stats(date(2024, 1, 1)), 1.0)
+        assert rescuer.complete(date(2024, 1, 1), ok_stats(date(2024, 1, 1)), 1.0)
+
+
+class TestResumableDateRange:
+    """ingest_date_range(resumable=True) end to end (requires PostgreSQL)."""
+
+    def test_rerun_skips_completed_dates(self, ingestion, pg_conn, tmp_path, monkeypatch):
+        files = {}
+        for i, day in enumerate(datetime(2024, 3, d) for d in (1, 2, 3)):
+            df = synthetic_export_frame(200, start_date=day, days=1, seed=i,
+                                        first_event_id=1_000_000 * (i + 1))
+            path = write_export_zip(df, tmp_path / f"{day:%Y%m%d}.export.CSV.zip")
+            files[ingestion.get_event_file_url(day)] = path.read_bytes()
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: files.get(url))
+
+        results = ingestion.ingest_date_range(datetime(2024, 3, 1), datetime(2024, 3, 3), resumable=True)
+        assert [r['inserted'] for r in results] == [200, 200, 200]
+
+        assert ingestion.ingest_date_range(datetime(2024, 3, 1), datetime(2024, 3, 3), resumable=True) == []
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM gdelt_events")
+            assert cursor.fetchone()[0] == 600
@@ -0,0 +1,121 @@
+"""
+Tests for the incremental 15-minute feed follower.
+
+A local http.server serves fixture export zips and manifests, so these tests
+run offline (PostgreSQL is still required for loading).
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.feed_follower import GDELTFeedFollower
+from event_db.synthetic import synthetic_export_frame, to_v2_layout, write_export_zip
+
+FIRST_FILE = datetime(2024, 3, 1, 12, 0)
+
+
+class FixtureFeed:
+    """A directory of 15-minute export zips plus lastupdate/masterfilelist manifests."""
+
+    def __init__(self, root, base_url):
+        self.root = root
+        self.base_url = base_url
+        self.entries = []
+
+    def publish(self, rows: int = 50) -> str:
+        """Add the next 15-minute file and rewrite both manifests."""
+        index = len(self.entries)
+        stamp = FIRST_FILE + timedelta(minutes=15 * index)
+        name = f"{stamp:%Y%m%d%H%M%S}.export.CSV.zip"
+        df = synthetic_export_frame(rows, start_date=stamp, seed=index,
+                                    first_event_id=10_000 * (index + 1))
+        data = write_export_zip(to_v2_layout(df), self.root / name).read_bytes()
+        url = self.base_url + name
+        self.entries.append(f"{len(data)} {hashlib.md5(data).hexdigest()} {url}")
+        self.write_manifests()
+        return url
+
+    def write_manifests(self):
+        mentions = self.entries[-1].replace('.export.', '.mentions.')
+        (self.root / 'lastupdate.txt').write_text(f"{self.entries[-1]}\n{mentions}\n")
+        (self.root / 'masterfilelist.txt').write_text('\n'.join(self.entries + ['garbage line']) + '\n')
+
+
+@pytest.fixture
+def feed(http_root):
+    return FixtureFeed(*http_root)
+
+
+@pytest.fixture
+def follower(pg_config, feed):
+    return GDELTFeedFollower(GDELTEventIngestion(db_config=pg_config, load_mode='copy', cache_mode='off'),
+                             base_url=feed.base_url)
+
+
+def checkpoint_rows(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT file_url, status, size_bytes, rows_downloaded, rows_inserted
+            FROM ingestion_files ORDER BY file_timestamp
+        """)
+        return cursor.fetchall()
+
+
+class TestFeedFollower:
+    """Tests for manifest-driven incremental ingestion."""
+
+    def test_manifest_keeps_only_export_entries(self, follower, feed):
+        feed.publish()
+        entries = follower.fetch_manifest('lastupdate.txt')
+        assert len(entries) == 1
+        assert entries[0].timestamp == FIRST_FILE
+
+    def test_catch_up_from_since(self, follower, feed, pg_conn):
+        urls = [feed.publish(rows=30 + i) for i in range(3)]
+
+        results = follower.follow_once(since=FIRST_FILE)
+
+        assert [r['file_url'] for r in results] == urls
+        assert [r['inserted'] for r in results] == [30, 31, 32]
+        rows = checkpoint_rows(pg_conn)
+        assert [r[1] for r in rows] == ['completed'] * 3
+        assert all(r[2] == (feed.root / r[0].rsplit('/', 1)[-1]).stat().st_size for r in rows)
+
+    def test_only_new_files_after_restart(self, follower, feed, pg_config):
+        feed.publish()
+        follower.follow_once(since=FIRST_FILE)
+        assert follower.follow_once() == []
+
+        new_url = feed.publish()
+        restarted = GDELTFeedFollower(
+            GDELTEventIngestion(db_config=pg_config, load_mode='copy', cache_mode='off'),
+            base_url=feed.base_url
+        )
+        results = restarted.follow_once()
+        assert [r['file_url'] for r in results] == [new_url]
+
+    def test_gap_filled_from_masterfilelist(self, follower, feed):
+        feed.publish()
+        follower.follow_once(since=FIRST_FILE)
+
+        missed = [feed.publish() for _ in range(3)]
+        results = follower.follow_once()
+
+        assert [r['file_url'] for r in results] == missed
+
+    def test_checksum_mismatch_is_retried(self, follower, feed, pg_conn):
+        url = feed.publish()
+        good_entry = feed.entries[-1]
+        feed.entries[-1] = good_entry.replace(good_entry.split()[1], '0' * 32)
+        feed.write_manifests()
+
+        assert follower.follow_once(since=FIRST_FILE)[0]['status'] == 'failed'
+        assert checkpoint_rows(pg_conn)[0][1] == 'failed'
+
+        feed.entries[-1] = good_entry
+        feed.write_manifests()
+        results = follower.follow_once()
+        assert [(r['file_url'], r['status']) for r in results] == [(url, 'completed')]
@@ -0,0 +1,108 @@
+"""
+Tests for the hot/cold split gdelt_events schema variant.
+
+Covering-index use is checked with EXPLAIN on the exact queries the analyzers run.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from event_db.actor_networks import ActorNetworkAnalyzer
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.geo_analysis import GeoEventAnalyzer
+from event_db.synthetic import synthetic_export_frame
+
+START, END = datetime(2024, 1, 1), datetime(2024, 1, 31)
+
+
+@pytest.fixture
+def events():
+    """1,000 preprocessed events over 2024-01-01 .. 2024-01-30."""
+    return GDELTEventIngestion(load_mode='batch').preprocess_events(
+        synthetic_export_frame(1_000, start_date=START, days=30)
+    )
+
+
+def count(conn, table) -> int:
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return cursor.fetchone()[0]
+
+
+def plan_nodes(conn, query, params) -> list:
+    """(node type, index name) pairs of a query plan."""
+    with conn.cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + query, params)
+        stack = [cursor.fetchone()[0][0]['Plan']]
+
+    nodes = []
+    while stack:
+        node = stack.pop()
+        nodes.append((node['Node Type'], node.get('Index Name')))
+        stack.extend(node.get('Plans', []))
+    return nodes
+
+
+class TestSplitIngestion:
+    """Loads fill gdelt_events and gdelt_events_detail (require PostgreSQL)."""
+
+    @pytest.mark.parametrize('load_mode', ['batch', 'copy'])
+    def test_both_tables_loaded(self, pg_split_config, pg_conn_split, events, load_mode):
+        ingestion = GDELTEventIngestion(db_config=pg_split_config, load_mode=load_mode)
+
+        assert ingestion.load_events(events) == (len(events), 0, 0)
+        assert count(pg_conn_split, 'gdelt_events') == count(pg_conn_split, 'gdelt_events_detail') == len(events)
+        ingestion.load_events(events)
+        assert count(pg_conn_split, 'gdelt_events') == count(pg_conn_split, 'gdelt_events_detail') == len(events)
+
+    def test_full_view_matches_plain_schema(self, pg_config, pg_conn, pg_split_config, pg_conn_split, events):
+        GDELTEventIngestion(db_config=pg_config, load_mode='copy').load_events(events)
+        GDELTEventIngestion(db_config=pg_split_config, load_mode='copy').load_events(events)
+
+        columns = ', '.join(['event_id'] + GDELTEventIngestion.DETAIL_COLUMNS + ['action_geo_fullname'])
+        plain = pd.read_sql_query(f"SELECT {columns} FROM gdelt_events ORDER BY event_id", pg_conn)
+        split = pd.read_sql_query(f"SELECT {columns} FROM gdelt_events_full ORDER BY event_id", pg_conn_split)
+        pd.testing.assert_frame_equal(plain, split)
+
+    def test_plain_schema_has_no_detail_table(self, pg_config, pg_conn):
+        with pg_conn.cursor() as cursor:
+            assert not GDELTEventIngestion.has_detail_table(cursor)
+
+
+class TestCoveringIndexes:
+    """Analyzer queries read only the covering indexes on the split schema."""
+
+    @pytest.fixture
+    def loaded(self, pg_config, pg_split_config, pg_conn_split, events):
+        for config in (pg_config, pg_split_config):
+            GDELTEventIngestion(db_config=config, load_mode='copy').load_events(events)
+        pg_conn_split.autocommit = True
+        with pg_conn_split.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE gdelt_events")
+            # Too few rows for the planner to prefer an index on its own
+            cursor.execute("SET enable_seqscan = off")
+            cursor.execute("SET enable_bitmapscan = off")
+
+    @pytest.mark.parametrize('analyzer, build, index', [
+        (ActorNetworkAnalyzer, lambda a: a._interactions_query(START, END, countries=['USA']),
+         'idx_interactions_covering'),
+        (GeoEventAnalyzer, lambda a: a._geo_events_query(START, END),
+         'idx_geo_events_covering'),
+    ])
+    def test_index_only_scan(self, loaded, pg_split_config, pg_conn_split, analyzer, build, index):
+        query, params = build(analyzer(pg_split_config))
+        assert ('Index Only Scan', index) in plan_nodes(pg_conn_split, query, params)
+
+    def test_analyzer_results_match_plain_schema(self, loaded, pg_config, pg_split_config):
+        def geo(config):
+            df = GeoEventAnalyzer(config).fetch_geo_events(START, END)
+            return df.sort_values('event_id', ignore_index=True)
+
+        def interactions(config):
+            df = ActorNetworkAnalyzer(config).fetch_interactions(START, END)
+            return df.drop(columns='event_types').sort_values(['actor1', 'actor2'], ignore_index=True)
+
+        pd.testing.assert_frame_equal(geo(pg_config), geo(pg_split_config))
+        pd.testing.assert_frame_equal(interactions(pg_config), interactions(pg_split_config))
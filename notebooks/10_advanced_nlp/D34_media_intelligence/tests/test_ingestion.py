@@ -0,0 +1,562 @@
+"""
+Tests for the GDELT event ingestion pipeline.
+"""
+
+import io
+import json
+import threading
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from event_db.cameo_mapping import (
+    ARTIFACT_VERSION, CAMEOMapper, compile_mapping, load_artifact, save_artifact
+)
+from event_db.config import INGESTION_CONFIG
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.synthetic import synthetic_export_frame, to_v2_layout, write_export_zip
+from event_db_lite import ActorNetworkAnalyzerLite, CAMEOMapperLite
+
+
+@pytest.fixture
+def ingestion(pg_config):
+    return GDELTEventIngestion(db_config=pg_config, load_mode='copy')
+
+
+@pytest.fixture
+def events():
+    ingestion = GDELTEventIngestion(load_mode='batch')
+    return ingestion.preprocess_events(synthetic_export_frame(500, seed=1))
+
+
+@pytest.fixture
+def export_files(tmp_path):
+    """Synthetic daily export zips for 2024-01-01..05, keyed by URL."""
+    ingestion = GDELTEventIngestion()
+    files = {}
+    for day in range(5):
+        date = datetime(2024, 1, 1) + timedelta(days=day)
+        df = synthetic_export_frame(100 + 10 * day, start_date=date, seed=day,
+                                    first_event_id=1_000_000 * (day + 1))
+        path = write_export_zip(df, tmp_path / f"{date:%Y%m%d}.export.CSV.zip")
+        files[ingestion.get_event_file_url(date)] = path.read_bytes()
+    return files
+
+
+def count_events(conn) -> int:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM gdelt_events")
+        return cursor.fetchone()[0]
+
+
+class TestLoadFrame:
+    """Tests for projecting preprocessed frames onto gdelt_events columns."""
+
+    def test_columns_follow_column_map(self, events):
+        frame = GDELTEventIngestion()._load_frame(events)
+        assert list(frame.columns) == [db_col for _, db_col in GDELTEventIngestion.COLUMN_MAP]
+
+    def test_integer_columns_survive_float_parsing(self, events):
+        events = events.copy()
+        events['ActionGeo_Type'] = events['ActionGeo_Type'].astype(float)
+        frame = GDELTEventIngestion()._load_frame(events)
+        assert str(frame['action_geo_type'].dtype) == 'Int64'
+
+    def test_date_added_parsed_to_timestamp(self, events):
+        assert pd.api.types.is_datetime64_any_dtype(events['DATEADDED'])
+        assert events['DATEADDED'].notna().all()
+
+    def test_rejects_unknown_load_mode(self):
+        with pytest.raises(ValueError):
+            GDELTEventIngestion(load_mode='bulk')
+
+
+class TestCopyLoader:
+    """Tests for COPY-based bulk loading (require PostgreSQL)."""
+
+    def test_copy_inserts_all_rows(self, ingestion, pg_conn, events):
+        with pg_conn.cursor() as cursor:
+            inserted, skipped, errors = ingestion.copy_batch(pg_conn, cursor, events)
+
+        assert (inserted, skipped, errors) == (len(events), 0, 0)
+        assert count_events(pg_conn) == len(events)
+
+    def test_copy_reports_skipped_duplicates(self, ingestion, pg_conn, events):
+        with pg_conn.cursor() as cursor:
+            ingestion.copy_batch(pg_conn, cursor, events.iloc[:200])
+            inserted, skipped, errors = ingestion.copy_batch(pg_conn, cursor, events)
+
+        assert (inserted, skipped, errors) == (len(events) - 200, 200, 0)
+        assert count_events(pg_conn) == len(events)
+
+    def test_copy_matches_batch_insert(self, pg_config, pg_conn, events):
+        copy_loader = GDELTEventIngestion(db_config=pg_config, load_mode='copy')
+        batch_loader = GDELTEventIngestion(db_config=pg_config, load_mode='batch')
+
+        with pg_conn.cursor() as cursor:
+            copy_loader.copy_batch(pg_conn, cursor, events.iloc[:250])
+            batch_loader.insert_batch(pg_conn, cursor, events.iloc[250:])
+            cursor.execute("""
+                SELECT is_root_event, quad_class, action_geo_type, date_added::date = event_date,
+                       source_url IS NOT NULL, category_confidence
+                FROM gdelt_events ORDER BY event_id
+            """)
+            rows = cursor.fetchall()
+
+        copied, inserted = rows[:250], rows[250:]
+        assert len(rows) == len(events)
+        assert {type(r[0]) for r in rows} == {bool}
+        assert all(r[3] for r in rows)
+        assert {r[1] for r in copied} == {r[1] for r in inserted}
+
+    def test_compact_values_round_trip(self, ingestion, pg_conn, events):
+        with pg_conn.cursor() as cursor:
+            ingestion.copy_batch(pg_conn, cursor, events)
+            cursor.execute("""
+                SELECT event_id, event_code, quad_class, action_geo_lat, avg_tone
+                FROM gdelt_events ORDER BY event_id
+            """)
+            rows = cursor.fetchall()
+
+        expected = events.sort_values('GLOBALEVENTID')
+        assert [r[1] for r in rows] == expected['EventCode'].astype(object).tolist()
+        assert [r[2] for r in rows] == expected['QuadClass'].tolist()
+        lat = np.array([np.nan if r[3] is None else float(r[3]) for r in rows])
+        np.testing.assert_allclose(lat, expected['ActionGeo_Lat'], atol=1e-5)
+        np.testing.assert_allclose([float(r[4]) for r in rows], expected['AvgTone'], atol=1e-2)
+
+    def test_staging_table_left_empty(self, ingestion, pg_conn, events):
+        with pg_conn.cursor() as cursor:
+            ingestion.copy_batch(pg_conn, cursor, events)
+            cursor.execute("SELECT COUNT(*) FROM gdelt_events_staging")
+            assert cursor.fetchone()[0] == 0
+
+
+class TestKnownEventFilter:
+    """Tests for dropping already-stored event IDs before loading (require PostgreSQL)."""
+
+    def test_full_overlap_sends_nothing(self, pg_config, pg_conn, events, monkeypatch):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='batch', prefilter_known=True)
+        assert ingestion.load_events(events) == (len(events), 0, 0)
+
+        sent = []
+        monkeypatch.setattr(ingestion, 'insert_batch', lambda conn, cursor, batch, split=None: sent.append(batch))
+        assert ingestion.load_events(events) == (0, len(events), 0)
+        assert sent == []
+
+    def test_partial_overlap_loads_only_new_rows(self, pg_config, pg_conn, events):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy', prefilter_known=True)
+        ingestion.load_events(events.iloc[::2])
+
+        half = len(events.iloc[::2])
+        assert ingestion.load_events(events) == (len(events) - half, half, 0)
+        assert count_events(pg_conn) == len(events)
+
+    def test_window_over_cap_loads_unfiltered(self, pg_config, pg_conn, events):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy', prefilter_known=True)
+        ingestion.load_events(events)
+        ingestion.known_filter.max_ids = 10
+
+        with pg_conn.cursor() as cursor:
+            batch, dropped = ingestion.known_filter.drop_known(cursor, events)
+        assert batch is events and dropped == 0
+        assert ingestion.load_events(events) == (0, len(events), 0)
+
+
+class TestParseExport:
+    """Tests for parsing raw export zips."""
+
+    def test_event_codes_keep_leading_zeros(self, export_files):
+        df = GDELTEventIngestion().parse_export(next(iter(export_files.values())))
+        assert df['EventCode'].str.len().min() >= 3
+        assert df['EventRootCode'].str.len().eq(2).all()
+
+    def test_corrupt_zip_returns_none(self):
+        assert GDELTEventIngestion().parse_export(b'not a zip') is None
+
+
+class TestCompactSchema:
+    """Tests for the compact typed in-memory schema."""
+
+    @pytest.fixture
+    def raw(self, tmp_path):
+        return write_export_zip(synthetic_export_frame(5_000, seed=3), tmp_path / "x.zip").read_bytes()
+
+    def test_parse_applies_compact_dtypes(self, raw):
+        df = GDELTEventIngestion().parse_export(raw)
+        dtypes = df.dtypes.astype(str)
+        assert dtypes['QuadClass'] == dtypes['ActionGeo_Type'] == 'Int8'
+        assert dtypes['NumMentions'] == 'Int32'
+        assert dtypes['ActionGeo_Lat'] == dtypes['AvgTone'] == 'float32'
+        assert dtypes['EventCode'] == dtypes['Actor1Code'] == 'category'
+        assert dtypes.drop(['FractionDate', 'SOURCEURL']).ne('float64').all()
+        assert dtypes.ne('object').sum() == len(dtypes) - 1
+
+    def test_compact_frame_is_smaller_than_inferred(self, raw):
+        compact = GDELTEventIngestion().parse_export(raw)
+        # Object strings, as before the compact schema (not pandas' Arrow-backed str)
+        with pd.option_context('future.infer_string', False):
+            inferred = pd.read_csv(io.BytesIO(raw), sep='\t', header=None, compression='zip',
+                                   names=GDELTEventIngestion.GDELT_COLUMNS, dtype={'EventCode': str})
+        assert compact.memory_usage(deep=True).sum() < 0.5 * inferred.memory_usage(deep=True).sum()
+
+    def test_categorization_matches_per_row_mapping(self, raw):
+        ingestion = GDELTEventIngestion()
+        df = ingestion.preprocess_events(ingestion.parse_export(raw))
+        expected = pd.DataFrame(
+            [ingestion.cameo_mapper.categorize_event(code) for code in df['EventCode'].astype(object)]
+        )
+        assert df['socioeconomic_domain'].astype(object).tolist() == expected['domain'].tolist()
+        assert df['socioeconomic_category'].astype(object).tolist() == expected['category'].tolist()
+        assert df['category_confidence'].tolist() == expected['confidence'].tolist()
+
+    def test_missing_event_code_is_uncategorized(self, raw):
+        ingestion = GDELTEventIngestion()
+        df = ingestion.parse_export(raw)
+        df.loc[:2, 'EventCode'] = None
+        df = ingestion.preprocess_events(df)
+        assert (df.loc[:2, 'socioeconomic_domain'] == 'uncategorized').all()
+
+    def test_lite_analytics_run_on_compact_frame(self, raw):
+        compact = GDELTEventIngestion().parse_export(raw)
+        wide = compact.astype({col: object for col in compact.select_dtypes('category').columns})
+        analyzer = ActorNetworkAnalyzerLite()
+
+        narrow = analyzer.build_interactions_df(compact)
+        expected = analyzer.build_interactions_df(wide)
+        assert len(narrow) == len(expected)
+        assert narrow['event_count'].sum() == expected['event_count'].sum()
+
+        categorized = CAMEOMapperLite().categorize_dataframe(compact)
+        assert categorized['socioeconomic_domain'].notna().all()
+
+
+class TestCategorizeSeries:
+    """categorize_series must match categorize_event row by row."""
+
+    CODES = ['1451', '145', '14', '149', '071', '0', '999', '', 'abc', None, np.nan] + [
+        root + suffix for root in CAMEOMapper.CAMEO_ROOTS for suffix in ('', '1', '12', '3')
+    ]
+
+    @staticmethod
+    def assert_matches_per_row(mapper, codes):
+        expected = [mapper.categorize_event(None if pd.isna(code) else code) for code in codes]
+        result = mapper.categorize_series(codes)
+        for col in ('domain', 'category', 'confidence'):
+            assert result[col].astype(object).tolist() == [row[col] for row in expected]
+
+    @pytest.mark.parametrize('mapper', [CAMEOMapper(), CAMEOMapperLite()], ids=['full', 'lite'])
+    @pytest.mark.parametrize('dtype', [object, 'category'])
+    def test_matches_per_row(self, mapper, dtype):
+        self.assert_matches_per_row(mapper, pd.Series(self.CODES * 3, dtype=dtype))
+
+    def test_lookup_table_rebuilt_after_custom_mapping(self):
+        mapper = CAMEOMapper()
+        codes = pd.Series(['031', '03', '02'])
+        assert mapper.categorize_series(codes)['confidence'].tolist() == pytest.approx([0.0, 0.0, 0.75])
+
+        mapper.add_custom_mapping('03', 'health_and_social_policy', 'humanitarian_aid', 0.5)
+        assert mapper.categorize_series(codes)['confidence'].tolist() == pytest.approx([0.4, 0.5, 0.75])
+        self.assert_matches_per_row(mapper, codes)
+
+    def test_lite_categorize_dataframe(self):
+        df = CAMEOMapperLite().categorize_dataframe(pd.DataFrame({'EventCode': [145, '071', None]}))
+        assert df['socioeconomic_domain'].tolist() == [
+            'labor_and_employment', 'health_and_social_policy', 'uncategorized'
+        ]
+        assert df['category_confidence'].tolist() == [1.0, 0.95, 0.0]
+
+
+class TestDistributions:
+    """Vectorized distributions must match the per-event loops they replace."""
+
+    # The per-event loop cannot take NaN
+    CODES = [code for code in TestCategorizeSeries.CODES if not isinstance(code, float)]
+    QUADS = [1, 2, 3, 4, 0, 5, 2.0, 1.5, None, '1', True]
+
+    @pytest.fixture
+    def raw(self, tmp_path):
+        return write_export_zip(synthetic_export_frame(5_000, seed=5), tmp_path / "x.zip").read_bytes()
+
+    @staticmethod
+    def loop_domain_distribution(mapper, codes) -> dict:
+        distribution = {}
+        for code in codes:
+            domain = mapper.categorize_event(code)['domain']
+            distribution[domain] = distribution.get(domain, 0) + 1
+        return distribution
+
+    @staticmethod
+    def loop_quad_distribution(mapper, quads) -> dict:
+        distribution = {}
+        for quad in quads:
+            label = mapper.categorize_by_quad_class(quad)
+            distribution[label] = distribution.get(label, 0) + 1
+        return distribution
+
+    @pytest.mark.parametrize('container', [list, np.array, pd.Series, lambda c: pd.Series(c, dtype='category')])
+    def test_domain_distribution(self, container):
+        mapper = CAMEOMapper()
+        codes = self.CODES * 2 + ['14'] * 5
+        result = mapper.get_domain_distribution(container(codes))
+        assert list(result.items()) == list(self.loop_domain_distribution(mapper, codes).items())
+
+    def test_domain_distribution_of_real_export(self, raw):
+        mapper = CAMEOMapper()
+        codes = GDELTEventIngestion().parse_export(raw)['EventCode']
+        expected = self.loop_domain_distribution(mapper, codes.astype(object).where(codes.notna(), None))
+        assert list(mapper.get_domain_distribution(codes).items()) == list(expected.items())
+
+    @pytest.mark.parametrize('quads', [
+        QUADS,
+        [1, 4, 4, 3, 2, 2, 9],
+        pd.Series([3, 1, None, 4], dtype='Int8'),
+        pd.Series([2, 1, 2], dtype='category'),
+    ])
+    def test_quad_classes(self, quads):
+        mapper = CAMEOMapper()
+        values = list(quads)
+        assert mapper.categorize_quad_classes(quads).astype(object).tolist() == [
+            mapper.categorize_by_quad_class(None if pd.isna(q) else q) for q in values
+        ]
+        expected = self.loop_quad_distribution(mapper, [None if pd.isna(q) else q for q in values])
+        assert list(mapper.get_quad_class_distribution(quads).items()) == list(expected.items())
+
+    def test_summarize_chunks_matches_whole_frame(self, raw):
+        mapper = CAMEOMapper()
+        ingestion = GDELTEventIngestion()
+        whole = ingestion.parse_export(raw)
+        summary = mapper.summarize_chunks(ingestion.iter_export_chunks(raw, chunk_size=333))
+
+        assert summary['domains'] == mapper.get_domain_distribution(whole['EventCode'])
+        assert summary['quad_classes'] == mapper.get_quad_class_distribution(whole['QuadClass'])
+        assert sum(summary['domains'].values()) == len(whole)
+
+
+class TestCompiledMappingArtifact:
+    """Tests for the compiled .npz CAMEO mapping artifact."""
+
+    def test_default_artifact_written_then_loaded(self, cameo_artifact, monkeypatch):
+        built = CAMEOMapper().lookup_table()
+        assert cameo_artifact.exists()
+
+        monkeypatch.setattr(CAMEOMapper, '_build_lookup', lambda self: pytest.fail("artifact not used"))
+        loaded = CAMEOMapper().lookup_table()
+        assert loaded == built
+        assert [type(v) for v in loaded['0711']] == [str, str, float]
+
+    def test_round_trip_is_exact(self, tmp_path):
+        mapper = CAMEOMapper(artifact_path=tmp_path / "m.npz")
+        lookup = mapper.lookup_table()
+        compiled = load_artifact(tmp_path / "m.npz")
+        assert compiled.lookup() == lookup == mapper._build_lookup()
+        assert compiled.mapping() == mapper.mapping
+
+    def test_add_custom_mapping_rebuilds_own_artifact(self, tmp_path, cameo_artifact):
+        path = tmp_path / "custom.npz"
+        mapper = CAMEOMapper(artifact_path=path)
+        mapper.lookup_table()
+        before = load_artifact(path).fingerprint
+
+        mapper.add_custom_mapping('03', 'health_and_social_policy', 'humanitarian_aid', 0.5)
+        compiled = load_artifact(path)
+        assert compiled.fingerprint != before
+        assert compiled.mapping()['03'] == ('health_and_social_policy', 'humanitarian_aid', 0.5)
+        assert compiled.row(compiled.find(['031'])[0])[2] == 0.5 * 0.8
+
+        # A customized mapper without its own artifact leaves the shared one alone
+        CAMEOMapper().lookup_table()
+        shared = load_artifact(cameo_artifact).fingerprint
+        default = CAMEOMapper()
+        default.add_custom_mapping('03', 'x', 'y', 0.5)
+        default.lookup_table()
+        assert load_artifact(cameo_artifact).fingerprint == shared
+        assert '03' not in load_artifact(cameo_artifact).mapping()
+
+    def test_other_version_is_rebuilt(self, cameo_artifact):
+        mapper = CAMEOMapper()
+        save_artifact(compile_mapping(mapper.mapping, mapper._build_lookup()), cameo_artifact)
+        with np.load(cameo_artifact) as data:
+            arrays = dict(data)
+        meta = json.loads(arrays['meta'].item())
+        arrays['meta'] = np.array(json.dumps(dict(meta, version=ARTIFACT_VERSION + 1)))
+        with open(cameo_artifact, 'wb') as f:
+            np.savez(f, **arrays)
+        assert load_artifact(cameo_artifact) is None
+
+        mapper.lookup_table()
+        assert load_artifact(cameo_artifact) is not None
+
+    def test_json_export_unchanged(self, tmp_path):
+        CAMEOMapper().export_mapping(tmp_path / "mapping.json")
+        custom = CAMEOMapper(custom_mapping_path=tmp_path / "mapping.json")
+        assert {code: tuple(value) for code, value in custom.mapping.items()} == CAMEOMapper.CAMEO_MAPPING
+
+    def test_lite_mapper_uses_matching_artifact(self, tmp_path, cameo_artifact):
+        assert CAMEOMapperLite.CAMEO_MAPPING == CAMEOMapper.CAMEO_MAPPING
+        assert CAMEOMapperLite(artifact_path=cameo_artifact)._compiled is None
+
+        CAMEOMapper().lookup_table()
+        lite = CAMEOMapperLite(artifact_path=cameo_artifact)
+        assert len(lite._compiled[0]) > 2_000
+        codes = pd.Series(['1451', '0711', '999', None, '2'])
+        TestCategorizeSeries.assert_matches_per_row(lite, codes)
+
+        other = CAMEOMapper(artifact_path=tmp_path / "other.npz")
+        other.add_custom_mapping('03', 'x', 'y', 0.5)
+        assert CAMEOMapperLite(artifact_path=tmp_path / "other.npz")._compiled is None
+
+
+class TestArrowParser:
+    """Tests for the pyarrow.csv parser backend."""
+
+    @pytest.fixture
+    def raw(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        return write_export_zip(synthetic_export_frame(5_000, seed=4), tmp_path / "x.zip").read_bytes()
+
+    def test_matches_pandas_parser(self, raw):
+        expected = GDELTEventIngestion(parser='pandas').parse_export(raw)
+        df = GDELTEventIngestion(parser='arrow').parse_export(raw)
+        assert df.dtypes.astype(str).equals(expected.dtypes.astype(str))
+        pd.testing.assert_frame_equal(df, expected, check_categorical=False)
+
+    def test_v2_layout_drops_adm2_columns(self, raw, tmp_path):
+        df = GDELTEventIngestion(parser='pandas').parse_export(raw)
+        v2 = write_export_zip(to_v2_layout(df), tmp_path / "v2.zip").read_bytes()
+        parsed = GDELTEventIngestion(parser='arrow').parse_export(
+            v2, columns=GDELTEventIngestion.GDELT_V2_COLUMNS
+        )
+        assert list(parsed.columns) == GDELTEventIngestion.GDELT_COLUMNS
+        assert parsed['EventCode'].astype(object).equals(df['EventCode'].astype(object))
+
+    def test_corrupt_zip_returns_none(self, raw):
+        assert GDELTEventIngestion(parser='arrow').parse_export(b'not a zip') is None
+
+    def test_falls_back_without_pyarrow(self, monkeypatch):
+        monkeypatch.setattr('event_db.event_ingestion.ARROW_AVAILABLE', False)
+        assert GDELTEventIngestion(parser='arrow').parser == 'pandas'
+
+    def test_rejects_unknown_parser(self):
+        with pytest.raises(ValueError):
+            GDELTEventIngestion(parser='polars')
+
+
+class TestPipelinedIngestion:
+    """Tests for multi-day pipelined ingestion (require PostgreSQL)."""
+
+    def test_pipelined_matches_per_date_counts(self, ingestion, pg_conn, export_files, monkeypatch):
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: export_files.get(url))
+
+        results = ingestion.ingest_date_range(datetime(2024, 1, 1), datetime(2024, 1, 6), workers=3)
+
+        assert [r['date'] for r in results] == [f"2024-01-0{d}" for d in range(1, 7)]
+        assert [r['inserted'] for r in results] == [100, 110, 120, 130, 140, 0]
+        assert all(r['errors'] == 0 for r in results)
+        assert count_events(pg_conn) == 600
+
+    def test_pipelined_reingest_is_idempotent(self, ingestion, pg_conn, export_files, monkeypatch):
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: export_files.get(url))
+
+        sequential = ingestion.ingest_date_range(datetime(2024, 1, 1), datetime(2024, 1, 5), workers=1)
+        pipelined = ingestion.ingest_date_range(datetime(2024, 1, 1), datetime(2024, 1, 5), workers=4)
+
+        assert [r['inserted'] for r in sequential] == [r['skipped'] for r in pipelined]
+        assert sum(r['inserted'] for r in pipelined) == 0
+        assert count_events(pg_conn) == 600
+
+    def test_loader_failure_stops_pipeline_threads(self, export_files, monkeypatch):
+        monkeypatch.setitem(INGESTION_CONFIG, 'queue_depth', 1)
+        ingestion = GDELTEventIngestion()
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: export_files.get(url))
+
+        def failing_load(date, batches, start_time):
+            raise RuntimeError("database went away")
+
+        monkeypatch.setattr(ingestion, '_date_stats', failing_load)
+        before = set(threading.enumerate())
+        with pytest.raises(RuntimeError):
+            ingestion.ingest_date_range(datetime(2024, 1, 1), datetime(2024, 1, 5), workers=2)
+        assert set(threading.enumerate()) <= before
+
+
+def streaming_peak_bytes(ingestion, raw) -> int:
+    """tracemalloc peak while streaming raw through parse + preprocess (raw itself excluded)."""
+    tracemalloc.start()
+    try:
+        for chunk in ingestion.iter_export_chunks(raw, chunk_size=1_000):
+            ingestion.preprocess_events(chunk)
+            del chunk
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestStreamingParse:
+    """Tests for bounded-memory chunked parsing."""
+
+    def test_chunks_match_whole_file_parse(self, tmp_path):
+        ingestion = GDELTEventIngestion()
+        raw = write_export_zip(synthetic_export_frame(2_500), tmp_path / "x.export.CSV.zip").read_bytes()
+
+        chunks = list(ingestion.iter_export_chunks(raw, chunk_size=1_000))
+        whole = ingestion.parse_export(raw)
+
+        assert [len(c) for c in chunks] == [1_000, 1_000, 500]
+        assert all((c.dtypes.astype(str) == whole.dtypes.astype(str)).all() for c in chunks)
+        # Per-chunk categoricals have their own categories; concat falls back to strings
+        streamed = pd.concat(chunks, ignore_index=True).astype(whole.dtypes.to_dict())
+        pd.testing.assert_frame_equal(streamed, whole, check_categorical=False)
+
+    @pytest.mark.slow
+    def test_peak_memory_does_not_grow_with_file_size(self, tmp_path):
+        ingestion = GDELTEventIngestion()
+        small = write_export_zip(synthetic_export_frame(4_000), tmp_path / "s.zip").read_bytes()
+        large = write_export_zip(synthetic_export_frame(24_000), tmp_path / "l.zip").read_bytes()
+
+        small_peak = streaming_peak_bytes(ingestion, small)
+        large_peak = streaming_peak_bytes(ingestion, large)
+
+        tracemalloc.start()
+        ingestion.preprocess_events(ingestion.parse_export(large))
+        whole_file_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert large_peak < 1.5 * small_peak
+        assert whole_file_peak > 3 * large_peak
+
+    def test_streaming_ingest_date(self, pg_config, pg_conn, export_files, monkeypatch):
+        monkeypatch.setitem(INGESTION_CONFIG, 'chunk_size', 40)
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy', streaming=True)
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: export_files.get(url))
+
+        result = ingestion.ingest_date(datetime(2024, 1, 3))
+
+        assert (result['downloaded'], result['inserted'], result['errors']) == (120, 120, 0)
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(DISTINCT ingestion_batch_id) FROM gdelt_events")
+            assert cursor.fetchone()[0] == 1
+
+    def test_streaming_corrupt_file_reports_nothing_loaded(self, pg_config, monkeypatch):
+        ingestion = GDELTEventIngestion(db_config=pg_config, streaming=True)
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: b'not a zip')
+
+        result = ingestion.ingest_date(datetime(2024, 1, 3))
+        assert (result['downloaded'], result['inserted']) == (0, 0)
+
+    def test_streaming_parse_failure_after_loaded_chunks_raises(self, pg_config, export_files, monkeypatch):
+        monkeypatch.setitem(INGESTION_CONFIG, 'chunk_size', 40)
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy', streaming=True)
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: export_files.get(url))
+        iter_export_chunks = ingestion.iter_export_chunks
+
+        def truncated(raw):
+            yield next(iter_export_chunks(raw))
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+        monkeypatch.setattr(ingestion, 'iter_export_chunks', truncated)
+        with pytest.raises(EOFError):
+            ingestion.ingest_date(datetime(2024, 1, 3))
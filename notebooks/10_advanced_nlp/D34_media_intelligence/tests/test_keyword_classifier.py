@@ -0,0 +1,81 @@
+"""
+Tests for the Aho-Corasick keyword classifier.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from event_db.cameo_mapping import CAMEOMapper
+from event_db.keyword_classifier import AHOCORASICK_AVAILABLE, KeywordAutomaton
+
+BACKENDS = [
+    'python',
+    pytest.param('pyahocorasick', marks=pytest.mark.skipif(
+        not AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")),
+]
+
+HEADLINES = [
+    "Teachers union calls strike over wages as students protest school closures",
+    "FLOOD AND DROUGHT: climate disaster hits farmers",
+    "Court rules government sanctions unlawful",
+    "Hospital workers demand health funding",
+    "Discrimination lawsuit filed over disparity in pay",
+    "",
+    None,
+]
+
+
+def overlapping_count(text: str, keyword: str) -> int:
+    """Occurrences of keyword in text, overlapping ones included (unlike str.count)."""
+    return sum(text.startswith(keyword, i) for i in range(len(text)))
+
+
+def naive_counts(texts, keyword_map) -> np.ndarray:
+    """One overlapping substring count per keyword per document."""
+    return np.array([
+        [sum(overlapping_count(text.lower(), keyword) for keyword in keywords) if text else 0
+         for keywords in keyword_map.values()]
+        for text in texts
+    ])
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+class TestKeywordAutomaton:
+    """Both backends match the naive per-keyword loop."""
+
+    def test_domain_keywords_match_naive_loop(self, backend):
+        automaton = KeywordAutomaton(CAMEOMapper.DOMAIN_KEYWORDS, backend=backend)
+        np.testing.assert_array_equal(automaton.count_many(HEADLINES),
+                                      naive_counts(HEADLINES, CAMEOMapper.DOMAIN_KEYWORDS))
+
+    def test_overlapping_keywords_all_count(self, backend):
+        automaton = KeywordAutomaton({'a': ['he', 'she'], 'b': ['hers', 'his']}, backend=backend)
+        assert automaton.count("Ushers").tolist() == [2, 1]
+        assert automaton.count("this").tolist() == [0, 1]
+
+    def test_self_overlapping_keyword_matches_naive_loop(self, backend):
+        keyword_map = {'a': ['aa', 'aba'], 'b': ['b']}
+        texts = ["aaaa", "ababa", "Baaab", ""]
+        np.testing.assert_array_equal(KeywordAutomaton(keyword_map, backend=backend).count_many(texts),
+                                      naive_counts(texts, keyword_map))
+        assert naive_counts(["aaaa"], keyword_map).tolist() == [[3, 0]]
+
+    def test_empty_inputs(self, backend):
+        assert KeywordAutomaton({'a': []}, backend=backend).count("anything").tolist() == [0]
+        assert KeywordAutomaton({'a': ['x'], 'b': ['y']}, backend=backend).count_many([]).shape == (0, 2)
+
+
+class TestClassifyTexts:
+    """CAMEOMapper.classify_texts returns per-domain hit counts."""
+
+    def test_counts_by_domain(self):
+        texts = pd.Series(HEADLINES, index=range(10, 10 + len(HEADLINES)))
+        result = CAMEOMapper().classify_texts(texts)
+
+        assert list(result.columns) == list(CAMEOMapper.DOMAIN_KEYWORDS)
+        assert list(result.index) == list(texts.index)
+        assert result.loc[10, 'labor_and_employment'] == 3   # union, strike, wage
+        assert result.loc[10, 'education_and_youth'] == 2    # student, school
+        assert result.loc[11, 'climate_and_environment'] == 4
+        assert (result.loc[[15, 16]] == 0).all().all()
@@ -0,0 +1,149 @@
+"""
+Tests for the monthly partitioned gdelt_events schema variant.
+
+Pruning is checked with EXPLAIN on the exact queries the analyzers run.
+"""
+
+import gzip
+from datetime import date, datetime
+
+import pytest
+
+from event_db.actor_networks import ActorNetworkAnalyzer
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.geo_analysis import GeoEventAnalyzer
+from event_db.partitions import PartitionManager
+from event_db.synthetic import synthetic_export_frame
+
+MONTHS = ['gdelt_events_2024_01', 'gdelt_events_2024_02', 'gdelt_events_2024_03']
+
+
+@pytest.fixture
+def loaded(pg_partitioned_config):
+    """1,500 events spread over 2024-01-20 .. 2024-03-19."""
+    ingestion = GDELTEventIngestion(db_config=pg_partitioned_config, load_mode='copy')
+    events = ingestion.preprocess_events(
+        synthetic_export_frame(1_500, start_date=datetime(2024, 1, 20), days=60)
+    )
+    result = ingestion.load_events(events)
+    return ingestion, events, result
+
+
+def scanned_relations(conn, query, params) -> set:
+    """Relations the planner will scan for a query."""
+    with conn.cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + query, params)
+        plan = cursor.fetchone()[0][0]['Plan']
+
+    relations = set()
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if 'Relation Name' in node:
+            relations.add(node['Relation Name'])
+        stack.extend(node.get('Plans', []))
+    return relations
+
+
+def table_exists(conn, name) -> bool:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+        return cursor.fetchone()[0]
+
+
+def count(conn, table='gdelt_events') -> int:
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return cursor.fetchone()[0]
+
+
+class TestPartitionedIngestion:
+    """Ingestion creates monthly partitions on demand (require PostgreSQL)."""
+
+    def test_partitions_created_for_loaded_months(self, loaded, pg_partitioned_config, pg_conn_partitioned):
+        _, events, (inserted, skipped, errors) = loaded
+
+        assert (inserted, skipped, errors) == (len(events), 0, 0)
+        partitions = PartitionManager(pg_partitioned_config).list_partitions()
+        assert [p['name'] for p in partitions] == MONTHS
+        assert sum(count(pg_conn_partitioned, p) for p in MONTHS) == len(events)
+
+    def test_reload_skips_duplicates(self, loaded):
+        ingestion, events, _ = loaded
+        assert ingestion.load_events(events) == (0, len(events), 0)
+
+    def test_every_partition_has_the_parent_indexes(self, loaded, pg_conn_partitioned):
+        with pg_conn_partitioned.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM pg_indexes WHERE tablename = 'gdelt_events'")
+            parent_indexes = cursor.fetchone()[0]
+            for name in MONTHS:
+                cursor.execute("SELECT COUNT(*) FROM pg_indexes WHERE tablename = %s", (name,))
+                assert cursor.fetchone()[0] == parent_indexes
+
+    def test_unpartitioned_schema_is_left_alone(self, pg_config, pg_conn):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy')
+        ingestion.load_events(ingestion.preprocess_events(synthetic_export_frame(50)))
+        assert not table_exists(pg_conn, 'gdelt_events_2024_01')
+
+
+class TestPartitionPruning:
+    """EXPLAIN confirms date-bounded analyzer queries scan only matching months."""
+
+    @pytest.mark.parametrize('start, end, expected', [
+        (datetime(2024, 2, 5), datetime(2024, 2, 20), MONTHS[1:2]),
+        (datetime(2024, 1, 25), datetime(2024, 2, 3), MONTHS[:2]),
+        (datetime(2024, 3, 1), datetime(2024, 3, 31), MONTHS[2:]),
+    ])
+    def test_analyzer_queries_are_pruned(self, loaded, pg_partitioned_config, pg_conn_partitioned,
+                                         start, end, expected):
+        queries = [
+            ActorNetworkAnalyzer(pg_partitioned_config)._interactions_query(start, end, domain='x'),
+            GeoEventAnalyzer(pg_partitioned_config)._geo_events_query(start, end, countries=['USA']),
+        ]
+        for query, params in queries:
+            assert scanned_relations(pg_conn_partitioned, query, params) == set(expected)
+
+    def test_pruned_fetch_matches_raw_counts(self, loaded, pg_partitioned_config):
+        _, events, _ = loaded
+        df = GeoEventAnalyzer(pg_partitioned_config).fetch_geo_events(
+            datetime(2024, 2, 1), datetime(2024, 2, 29)
+        )
+        in_february = events['event_date'].between('2024-02-01', '2024-02-29')
+        assert len(df) == (in_february & events['ActionGeo_Lat'].notna()).sum()
+
+
+class TestPartitionArchive:
+    """Detaching and archiving old months (require PostgreSQL)."""
+
+    def test_detach_keeps_table_outside_parent(self, loaded, pg_partitioned_config, pg_conn_partitioned):
+        _, events, _ = loaded
+        archived = PartitionManager(pg_partitioned_config).archive_before(date(2024, 3, 1))
+
+        assert [a['name'] for a in archived] == MONTHS[:2]
+        assert count(pg_conn_partitioned) == (events['event_date'] >= '2024-03-01').sum()
+        assert table_exists(pg_conn_partitioned, MONTHS[0])
+
+    def test_partial_month_is_not_archived(self, loaded, pg_partitioned_config):
+        archived = PartitionManager(pg_partitioned_config).archive_before(date(2024, 2, 15))
+        assert [a['name'] for a in archived] == MONTHS[:1]
+
+    def test_export_and_drop(self, loaded, pg_partitioned_config, pg_conn_partitioned, tmp_path):
+        _, events, _ = loaded
+        archived = PartitionManager(pg_partitioned_config).archive_before(
+            date(2024, 2, 1), archive_dir=tmp_path, drop=True
+        )
+
+        path = archived[0]['archive_path']
+        with gzip.open(path, 'rt') as f:
+            lines = f.read().splitlines()
+        assert lines[0].startswith('event_id,event_date,')
+        assert len(lines) - 1 == (events['event_date'] < '2024-02-01').sum()
+        assert not table_exists(pg_conn_partitioned, MONTHS[0])
+
+    def test_archived_month_is_recreated_on_next_load(self, loaded, pg_partitioned_config):
+        ingestion, events, _ = loaded
+        PartitionManager(pg_partitioned_config).archive_before(date(2024, 2, 1), drop=True)
+
+        fresh = GDELTEventIngestion(db_config=pg_partitioned_config, load_mode='copy')
+        january = events[events['event_date'] < '2024-02-01']
+        assert fresh.load_events(january) == (len(january), 0, 0)
@@ -0,0 +1,101 @@
+"""
+Tests for the shared PostgreSQL connection pool.
+"""
+
+import threading
+import time
+
+import pytest
+
+from event_db.config import DATABASE_CONFIG
+from event_db.pool import ConnectionPool, PoolTimeout, connection_params, get_pool
+
+
+def backend_pid(conn) -> int:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT pg_backend_pid()")
+        return cursor.fetchone()[0]
+
+
+def hold(pool, seconds, ready):
+    with pool.connection():
+        ready.set()
+        time.sleep(seconds)
+
+
+class TestConnectionParams:
+    """Tests for separating pool settings from libpq parameters."""
+
+    def test_pool_keys_are_stripped(self):
+        params = connection_params(dict(DATABASE_CONFIG, options='-c x=1'))
+        assert not any(k.startswith('pool_') for k in params)
+        assert params['options'] == '-c x=1'
+
+    def test_invalid_sizes_rejected(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(dict(DATABASE_CONFIG, pool_min_size=3, pool_max_size=2))
+
+
+class TestConnectionPool:
+    """Tests for checkout, health checks and wait metrics (require PostgreSQL)."""
+
+    def test_connections_are_reused(self, pg_config):
+        pool = get_pool(pg_config)
+        with pool.connection() as conn:
+            first = backend_pid(conn)
+        with pool.connection() as conn:
+            assert backend_pid(conn) == first
+        assert get_pool(dict(pg_config)) is pool
+        assert pool.metrics()['checkouts'] == 2
+
+    def test_uncommitted_work_rolled_back_on_return(self, pg_config):
+        pool = get_pool(pg_config)
+        with pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("CREATE TABLE scratch (x int)")
+        with pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('scratch')")
+            assert cursor.fetchone()[0] is None
+
+    def test_broken_connection_replaced_on_borrow(self, pg_config, pg_conn):
+        pool = ConnectionPool(dict(pg_config, pool_check_idle=0))
+        with pool.connection() as conn:
+            dead = backend_pid(conn)
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SELECT pg_terminate_backend(%s)", (dead,))
+
+        with pool.connection() as conn:
+            assert backend_pid(conn) != dead
+        assert pool.metrics()['health_check_failures'] == 1
+        pool.close()
+
+    def test_wait_metrics_recorded_when_exhausted(self, pg_config):
+        pool = ConnectionPool(dict(pg_config, pool_max_size=1))
+        ready = threading.Event()
+        holder = threading.Thread(target=hold, args=(pool, 0.3, ready))
+        holder.start()
+        ready.wait()
+
+        with pool.connection():
+            pass
+        holder.join()
+
+        metrics = pool.metrics()
+        assert metrics['checkouts'] == 2
+        assert metrics['waits'] == 1
+        assert metrics['wait_seconds_max'] >= 0.1
+        assert metrics['in_use'] == 0
+        pool.close()
+
+    def test_timeout_when_no_connection_frees_up(self, pg_config):
+        pool = ConnectionPool(dict(pg_config, pool_max_size=1, pool_timeout=0.1))
+        ready = threading.Event()
+        holder = threading.Thread(target=hold, args=(pool, 0.5, ready))
+        holder.start()
+        ready.wait()
+
+        with pytest.raises(PoolTimeout):
+            with pool.connection():
+                pass
+        holder.join()
+        assert pool.metrics()['timeouts'] == 1
+        pool.close()
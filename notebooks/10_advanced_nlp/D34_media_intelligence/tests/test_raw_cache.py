@@ -0,0 +1,91 @@
+"""
+Tests for the content-addressed raw download cache.
+"""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.raw_cache import RawDownloadCache
+from event_db.synthetic import synthetic_export_frame, write_export_zip
+
+
+@pytest.fixture
+def export_url(http_root):
+    root, base_url = http_root
+    write_export_zip(synthetic_export_frame(200), root / "20240101.export.CSV.zip")
+    return base_url + "20240101.export.CSV.zip"
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "raw_cache"
+
+
+class TestRawDownloadCache:
+    """Tests for caching, revalidation and offline reads."""
+
+    def test_first_fetch_stores_content_addressed_object(self, export_url, cache_dir, http_root):
+        ingestion = GDELTEventIngestion(cache_dir=cache_dir)
+        raw = ingestion.fetch_export(export_url)
+
+        entry = ingestion.raw_cache.lookup(export_url)
+        assert entry['sha256'] == hashlib.sha256(raw).hexdigest()
+        assert entry['size'] == len(raw) == (http_root[0] / "20240101.export.CSV.zip").stat().st_size
+        assert entry['last_modified']
+        assert (cache_dir / "objects" / entry['sha256'][:2] / entry['sha256']).exists()
+        assert ingestion.raw_cache.stats['misses'] == 1
+
+    def test_unchanged_file_is_revalidated_not_downloaded(self, export_url, cache_dir):
+        first = GDELTEventIngestion(cache_dir=cache_dir).fetch_export(export_url)
+
+        ingestion = GDELTEventIngestion(cache_dir=cache_dir)
+        assert ingestion.fetch_export(export_url) == first
+        assert ingestion.raw_cache.stats == {'hits': 0, 'revalidated': 1, 'misses': 0}
+
+    def test_modified_file_is_downloaded_again(self, export_url, cache_dir, http_root):
+        GDELTEventIngestion(cache_dir=cache_dir).fetch_export(export_url)
+        path = http_root[0] / "20240101.export.CSV.zip"
+        write_export_zip(synthetic_export_frame(50, seed=9), path)
+        later = time.time() + 3600
+        os.utime(path, (later, later))
+
+        ingestion = GDELTEventIngestion(cache_dir=cache_dir)
+        raw = ingestion.fetch_export(export_url)
+        assert raw == path.read_bytes()
+        assert ingestion.raw_cache.stats['misses'] == 1
+
+    def test_offline_mode_reads_cache_only(self, export_url, cache_dir):
+        online = GDELTEventIngestion(cache_dir=cache_dir).fetch_export(export_url)
+
+        offline = GDELTEventIngestion(cache_mode='offline', cache_dir=cache_dir)
+        offline.session.get = None  # any network access would raise
+        assert offline.fetch_export(export_url) == online
+        assert offline.fetch_export(export_url.replace('20240101', '20240102')) is None
+        assert offline.raw_cache.stats['hits'] == 1
+
+    def test_corrupt_object_is_refetched(self, export_url, cache_dir):
+        ingestion = GDELTEventIngestion(cache_dir=cache_dir)
+        raw = ingestion.fetch_export(export_url)
+        sha = ingestion.raw_cache.lookup(export_url)['sha256']
+        (cache_dir / "objects" / sha[:2] / sha).write_bytes(b"truncated")
+
+        assert RawDownloadCache(cache_dir).read(export_url) is None
+        assert GDELTEventIngestion(cache_dir=cache_dir).fetch_export(export_url) == raw
+        assert RawDownloadCache(cache_dir).read(export_url) == raw
+
+    def test_identical_content_stored_once(self, cache_dir):
+        cache = RawDownloadCache(cache_dir)
+        cache.store("http://a/1.zip", b"same bytes")
+        cache.store("http://a/2.zip", b"same bytes")
+        assert len(list((cache_dir / "objects").rglob("*"))) == 2  # one shard dir + one object
+        assert cache.read("http://a/2.zip") == b"same bytes"
+
+    def test_cache_off_writes_nothing(self, export_url, cache_dir):
+        ingestion = GDELTEventIngestion(cache_mode='off', cache_dir=cache_dir)
+        assert ingestion.fetch_export(export_url)
+        assert ingestion.raw_cache is None
+        assert not cache_dir.exists()
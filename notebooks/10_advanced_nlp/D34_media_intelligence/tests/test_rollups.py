@@ -0,0 +1,167 @@
+"""
+Tests for the event_statistics / actor_relationships rollups.
+
+Expected values are aggregated in pandas from the raw gdelt_events rows, so
+the SQL rollups are checked against an independent implementation.
+"""
+
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.rollups import EventRollups
+from event_db.synthetic import synthetic_export_frame, write_export_zip
+
+# Averages are stored as DECIMAL(_, 2)
+DECIMAL_2DP = 0.005 + 1e-9
+
+
+@pytest.fixture
+def daily_files(tmp_path):
+    """Two daily export zips whose events span three event dates each."""
+    ingestion = GDELTEventIngestion()
+    files = {}
+    for i, day in enumerate((datetime(2024, 2, 3), datetime(2024, 2, 5))):
+        df = synthetic_export_frame(400, start_date=datetime(2024, 2, 1 + 2 * i), days=3,
+                                    seed=i, first_event_id=1_000_000 * (i + 1))
+        path = write_export_zip(df, tmp_path / f"{day:%Y%m%d}.export.CSV.zip")
+        files[ingestion.get_event_file_url(day)] = path.read_bytes()
+    return files
+
+
+@pytest.fixture
+def ingestion(pg_config, daily_files, monkeypatch):
+    ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy')
+    monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: daily_files.get(url))
+    return ingestion
+
+
+def read_sql(conn, query) -> pd.DataFrame:
+    with conn.cursor() as cursor:
+        cursor.execute(query)
+        columns = [c.name for c in cursor.description]
+        return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+
+def raw_events(conn) -> pd.DataFrame:
+    df = read_sql(conn, """
+        SELECT event_date, socioeconomic_domain, action_geo_country_code, actor1_code,
+               actor2_code, event_code, goldstein_scale::float8, avg_tone::float8
+        FROM gdelt_events
+    """)
+    return df.rename(columns={'goldstein_scale': 'goldstein', 'avg_tone': 'tone'})
+
+
+def top_counts(values: pd.Series, key: str, n: int = EventRollups.TOP_N) -> list:
+    counts = values.dropna().value_counts().rename_axis(key).reset_index(name='count')
+    counts = counts.sort_values(['count', key], ascending=[False, True]).head(n)
+    return counts.to_dict(orient='records')
+
+
+def expected_statistics(raw: pd.DataFrame) -> dict:
+    expected = {}
+    for (day, domain), group in raw.groupby(['event_date', 'socioeconomic_domain']):
+        actors = pd.concat([group['actor1_code'], group['actor2_code']])
+        expected[(day, domain)] = (
+            len(group),
+            group['goldstein'].mean(),
+            group['tone'].mean(),
+            top_counts(group['action_geo_country_code'], 'country'),
+            top_counts(actors, 'actor'),
+        )
+    return expected
+
+
+def stored_statistics(conn) -> dict:
+    rows = read_sql(conn, """
+        SELECT stat_date, socioeconomic_domain, event_count, avg_goldstein::float8,
+               avg_tone::float8, top_countries, top_actors
+        FROM event_statistics
+    """)
+    return {(r[0], r[1]): tuple(r[2:]) for r in rows.itertuples(index=False)}
+
+
+class TestEventRollups:
+    """Rollups must equal aggregates computed from gdelt_events (require PostgreSQL)."""
+
+    def test_event_statistics_match_raw_aggregates(self, ingestion, pg_conn):
+        for day in (3, 5):
+            ingestion.ingest_date(datetime(2024, 2, day))
+
+        expected = expected_statistics(raw_events(pg_conn))
+        stored = stored_statistics(pg_conn)
+        assert stored.keys() == expected.keys()
+        for key, (count, goldstein, tone, countries, actors) in expected.items():
+            assert stored[key][0] == count
+            assert stored[key][1] == pytest.approx(goldstein, abs=DECIMAL_2DP)
+            assert stored[key][2] == pytest.approx(tone, abs=DECIMAL_2DP)
+            assert stored[key][3] == countries
+            assert stored[key][4] == actors
+
+    def test_actor_relationships_match_raw_aggregates(self, ingestion, pg_conn):
+        ingestion.ingest_date(datetime(2024, 2, 3))
+
+        raw = raw_events(pg_conn).dropna(subset=['actor1_code', 'actor2_code'])
+        expected = {
+            (a1, a2, day): (len(g), g['goldstein'].mean(),
+                            g['event_code'].value_counts().to_dict())
+            for (a1, a2, day), g in raw.groupby(['actor1_code', 'actor2_code', 'event_date'])
+        }
+        stored = read_sql(pg_conn, """
+            SELECT actor1, actor2, start_date, end_date, interaction_count,
+                   avg_goldstein::float8, event_types
+            FROM actor_relationships
+        """)
+
+        assert (stored['start_date'] == stored['end_date']).all()
+        assert len(stored) == len(expected)
+        for r in stored.itertuples(index=False):
+            count, goldstein, event_types = expected[(r.actor1, r.actor2, r.start_date)]
+            assert r.interaction_count == count
+            assert r.avg_goldstein == pytest.approx(goldstein, abs=DECIMAL_2DP)
+            assert r.event_types == event_types
+
+    def test_only_affected_dates_are_touched(self, ingestion, pg_conn):
+        ingestion.ingest_date(datetime(2024, 2, 3))
+        before = read_sql(pg_conn, "SELECT stat_id, stat_date, computed_at FROM event_statistics")
+
+        ingestion.ingest_date(datetime(2024, 2, 5))  # events dated 2024-02-03..05
+        after = read_sql(pg_conn, "SELECT stat_id, stat_date, computed_at FROM event_statistics")
+
+        untouched = before[before['stat_date'] < date(2024, 2, 3)]
+        assert not untouched.empty
+        assert untouched.merge(after, on=['stat_id', 'stat_date', 'computed_at']).shape[0] == len(untouched)
+        assert set(after['stat_date']) == {date(2024, 2, d) for d in range(1, 6)}
+
+    def test_reingest_without_new_rows_skips_refresh(self, ingestion, pg_conn, monkeypatch):
+        ingestion.ingest_date(datetime(2024, 2, 3))
+        calls = []
+        monkeypatch.setattr(ingestion.rollups, 'refresh_dates', calls.append)
+
+        assert ingestion.ingest_date(datetime(2024, 2, 3))['inserted'] == 0
+        assert calls == []
+
+    def test_rebuild_rollups_drops_stale_dates(self, ingestion, pg_config, pg_conn):
+        ingestion.ingest_date(datetime(2024, 2, 3))
+        with pg_conn.cursor() as cursor:
+            cursor.execute("DELETE FROM gdelt_events WHERE event_date = '2024-02-02'")
+            cursor.execute("UPDATE event_statistics SET event_count = -1")
+        pg_conn.commit()
+
+        result = EventRollups(pg_config).rebuild_rollups(date(2024, 2, 1), date(2024, 2, 3))
+
+        assert result['dates'] == 3
+        expected = expected_statistics(raw_events(pg_conn))
+        stored = stored_statistics(pg_conn)
+        assert date(2024, 2, 2) not in {day for day, _ in stored}
+        assert stored.keys() == expected.keys()
+        assert all(stored[k][0] == v[0] for k, v in expected.items())
+
+    def test_rollups_disabled(self, pg_config, pg_conn, daily_files, monkeypatch):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy', rollups=False)
+        monkeypatch.setattr(ingestion, 'fetch_export', lambda url, retries=3: daily_files.get(url))
+
+        ingestion.ingest_date(datetime(2024, 2, 3))
+        assert read_sql(pg_conn, "SELECT COUNT(*) AS n FROM event_statistics")['n'][0] == 0
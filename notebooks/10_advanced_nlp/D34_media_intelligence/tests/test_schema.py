@@ -0,0 +1,39 @@
+"""
+Tests for creating bookkeeping tables from schema_events.sql.
+"""
+
+import pytest
+
+from event_db.schema import TableOnFirstUse, table_ddl
+
+
+class TestTableDDL:
+    """table_ddl() picks a table's statements out of schema_events.sql."""
+
+    def test_table_and_indexes(self):
+        ddl = table_ddl('backfill_queue')
+        assert ddl.count('CREATE TABLE IF NOT EXISTS backfill_queue (') == 1
+        assert 'idx_backfill_queue_claimable ON backfill_queue(state, next_attempt_at)' in ddl
+        assert 'ingestion_runs' not in ddl and 'gdelt_events' not in ddl
+
+    def test_unknown_table(self):
+        with pytest.raises(ValueError):
+            table_ddl('no_such_table')
+
+
+class TestTableOnFirstUse:
+    """Missing tables are created on the first checkout (require PostgreSQL)."""
+
+    @pytest.mark.parametrize('table', ['ingestion_files', 'backfill_queue', 'ingestion_runs'])
+    def test_creates_missing_table(self, pg_config, pg_conn, table):
+        pg_conn.autocommit = True
+        with pg_conn.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {table}")
+
+        with TableOnFirstUse(table, pg_config).connection() as conn, conn.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            assert cursor.fetchone()[0] == 0
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM pg_indexes WHERE tablename = %s AND schemaname = current_schema()",
+                           (table,))
+            assert cursor.fetchone()[0] == 2  # primary key and the schema file's index
@@ -0,0 +1,151 @@
+"""
+Tests for per-stage ingestion telemetry and the run ledger.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from event_db.config import GDELT_CONFIG
+from event_db.event_ingestion import GDELTEventIngestion
+from event_db.synthetic import synthetic_export_frame, write_export_zip
+from event_db.telemetry import (
+    IngestionTelemetry, aggregate_stages, load_runs, prometheus_text, summarize_runs
+)
+
+
+@pytest.fixture
+def served_exports(http_root, monkeypatch):
+    """Daily export zips for 2024-01-01..03 served over HTTP as GDELT base_url."""
+    root, base_url = http_root
+    monkeypatch.setitem(GDELT_CONFIG, 'base_url', base_url)
+    for day in range(3):
+        date = datetime(2024, 1, 1) + timedelta(days=day)
+        df = synthetic_export_frame(300, start_date=date, seed=day, first_event_id=1_000_000 * (day + 1))
+        write_export_zip(df, root / f"{date:%Y%m%d}.export.CSV.zip")
+    return root
+
+
+def run_record(date, rows, wall_sec, stages=None, status='completed') -> dict:
+    return {
+        'run_id': f"run-{date}", 'date': date, 'started_at': f"{date}T02:00:00",
+        'status': status, 'downloaded': rows, 'wall_sec': wall_sec,
+        'stages': stages or {'load': {'calls': 1, 'wall_sec': wall_sec, 'cpu_sec': 0.1,
+                                      'rows': rows, 'bytes': 0}},
+    }
+
+
+class TestStageTimers:
+    """Tests for stage timing and run attribution."""
+
+    def test_stage_records_wall_cpu_rows_and_bytes(self):
+        telemetry = IngestionTelemetry(record_runs=False)
+        with telemetry.stage('parse', nbytes=1_000) as counts:
+            time.sleep(0.02)
+            counts['rows'] = 50
+
+        parse = telemetry.totals['parse']
+        assert parse['calls'] == 1 and parse['rows'] == 50 and parse['bytes'] == 1_000
+        assert parse['wall_sec'] >= 0.02 > parse['cpu_sec']
+
+    def test_only_the_active_run_is_charged(self):
+        telemetry = IngestionTelemetry(record_runs=False)
+        run = telemetry.start_run()
+        with telemetry.activate(run):
+            with telemetry.stage('load', rows=10):
+                pass
+        with telemetry.stage('load', rows=5):
+            pass
+
+        assert run.stages['load']['rows'] == 10
+        assert telemetry.totals['load']['rows'] == 15
+
+    def test_prometheus_text(self):
+        text = prometheus_text({'download': {'calls': 2, 'wall_sec': 2.0, 'cpu_sec': 0.5,
+                                             'rows': 0, 'bytes': 4_000_000}})
+        assert '# TYPE gdelt_ingestion_stage_rows_per_second gauge' in text
+        assert 'gdelt_ingestion_stage_bytes_per_second{stage="download"} 2e+06' in text
+        assert 'gdelt_ingestion_stage_cpu_seconds_total{stage="download"} 0.5' in text
+
+
+class TestRunLedger:
+    """ingest_date runs land in the JSON-lines file and ingestion_runs (require PostgreSQL)."""
+
+    def test_ingest_date_records_every_stage(self, pg_config, pg_conn, served_exports, runs_log):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy', cache_mode='off')
+        stats = ingestion.ingest_date(datetime(2024, 1, 1))
+
+        [record] = load_runs(runs_log)
+        assert record['status'] == 'completed'
+        assert record['inserted'] == stats['inserted'] == 300
+        assert set(record['stages']) == {'download', 'parse', 'preprocess', 'load', 'rollups'}
+        assert record['stages']['parse']['rows'] == record['stages']['load']['rows'] == 300
+        zip_size = (served_exports / "20240101.export.CSV.zip").stat().st_size
+        assert record['bytes_downloaded'] == record['stages']['parse']['bytes'] == zip_size
+
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SELECT run_id, status, rows_inserted, stages FROM ingestion_runs")
+            [(run_id, status, inserted, stages)] = cursor.fetchall()
+        assert (run_id, status, inserted) == (record['run_id'], 'completed', 300)
+        assert stages == json.loads(json.dumps(record['stages']))
+        assert IngestionTelemetry(pg_config).recent_runs()[0]['stages'] == stages
+
+    def test_pipelined_runs_include_worker_stages(self, pg_config, served_exports, runs_log):
+        ingestion = GDELTEventIngestion(db_config=pg_config, load_mode='copy', cache_mode='off')
+        ingestion.ingest_date_range(datetime(2024, 1, 1), datetime(2024, 1, 3), workers=2)
+
+        records = load_runs(runs_log)
+        assert sorted(r['date'] for r in records) == ['2024-01-01', '2024-01-02', '2024-01-03']
+        for record in records:
+            assert record['stages']['preprocess']['rows'] == 300
+            assert record['stages']['download']['bytes'] > 0
+
+    def test_missing_file_recorded_as_no_data(self, pg_config, served_exports, runs_log):
+        ingestion = GDELTEventIngestion(db_config=pg_config, cache_mode='off')
+        ingestion.ingest_date(datetime(2024, 2, 1))
+        assert load_runs(runs_log)[0]['status'] == 'no_data'
+
+    def test_disabled(self, pg_config, served_exports, runs_log):
+        ingestion = GDELTEventIngestion(db_config=pg_config, cache_mode='off', telemetry=False)
+        ingestion.ingest_date(datetime(2024, 1, 1))
+        assert not runs_log.exists()
+
+
+class TestSummarizeRuns:
+    """Tests for flagging slow runs against the trailing median."""
+
+    def test_slow_day_flagged_with_dominant_stage(self):
+        runs = [run_record(f"2024-01-0{d}", 100_000, 10.0) for d in range(1, 6)]
+        runs.append(run_record('2024-01-06', 100_000, 40.0, stages={
+            'download': {'calls': 1, 'wall_sec': 35.0, 'cpu_sec': 0.2, 'rows': 0, 'bytes': 1},
+            'load': {'calls': 1, 'wall_sec': 5.0, 'cpu_sec': 1.0, 'rows': 100_000, 'bytes': 0},
+        }))
+
+        summary = summarize_runs(runs, window=3, threshold=0.5)
+        assert summary['slow'].tolist() == [False] * 5 + [True]
+        slow = summary.iloc[-1]
+        assert slow['trailing_median'] == pytest.approx(10_000)
+        assert slow['dominant_stage'] == 'download'
+        assert slow['download_sec'] == 35.0
+
+    def test_moderate_dip_not_flagged(self):
+        runs = [run_record(f"2024-01-0{d}", 100_000, 10.0) for d in range(1, 4)]
+        runs.append(run_record('2024-01-04', 100_000, 15.0))
+        assert not summarize_runs(runs, threshold=0.5)['slow'].any()
+
+    def test_empty_ledger(self):
+        assert summarize_runs([]).empty
+
+    def test_ledger_totals_render_as_prometheus(self):
+        runs = [run_record('2024-01-01', 1_000, 2.0), run_record('2024-01-02', 3_000, 2.0)]
+        assert aggregate_stages(runs)['load']['rows'] == 4_000
+        assert 'gdelt_ingestion_stage_rows_per_second{stage="load"} 1000' in prometheus_text(aggregate_stages(runs))
+
+    def test_windowed_totals_render_as_gauges(self):
+        runs = [run_record('2024-01-01', 1_000, 2.0), run_record('2024-01-02', 3_000, 2.0)]
+        text = prometheus_text(aggregate_stages(runs), windowed=True)
+        assert '# TYPE gdelt_ingestion_stage_rows gauge' in text
+        assert 'gdelt_ingestion_stage_rows{stage="load"} 4000' in text
+        assert '_total' not in text and ' counter' not in text